@@ -384,18 +384,15 @@ def main() -> int:
     fusion_pred = (fusion_prob >= args.decision_threshold).astype(np.float32)
 
     scorer = load_v22_scorer()
-    heuristic_prob = np.zeros_like(y_holdout, dtype=np.float32)
-    heuristic_pred = np.zeros_like(y_holdout, dtype=np.float32)
-    for idx, window in enumerate(x_tel_holdout_raw):
-        spot_history = [float(value) for value in window[:, 0]]
-        assessment = scorer.assess_risk(
-            spot_price_history=spot_history,
-            rebalance_signal=False,
-            capacity_score=0.5,
-        )
-        is_critical = str(assessment.Priority).upper() == "CRITICAL"
-        heuristic_prob[idx] = 1.0 if is_critical else 0.0
-        heuristic_pred[idx] = heuristic_prob[idx]
+    assessments = scorer.assess_risk_batch(
+        x_tel_holdout_raw[:, :, 0],
+        capacity_scores=np.full(len(x_tel_holdout_raw), 0.5),
+    )
+    heuristic_prob = np.asarray(
+        [1.0 if str(assessment.Priority).upper() == "CRITICAL" else 0.0 for assessment in assessments],
+        dtype=np.float32,
+    ).reshape(y_holdout.shape)
+    heuristic_pred = heuristic_prob.copy()
 
     fusion_metrics = calc_metrics(y_holdout, fusion_pred, fusion_prob)
     heuristic_metrics = calc_metrics(y_holdout, heuristic_pred, heuristic_prob)
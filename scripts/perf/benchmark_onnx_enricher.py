@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Compare the FinBERT torch and ONNX Runtime enrichers on latency, throughput, RSS and S_v parity."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+AI_ENGINE_DIR = Path(__file__).resolve().parents[2] / "src" / "services" / "ai-engine"
+PROVIDERS = ("finbert", "finbert-onnx")
+
+SAMPLE_TITLES = [
+    "Service disruption in us-east-1",
+    "RESOLVED: elevated latency for compute instances",
+    "Capacity shortage reported for GPU instance families",
+    "Scheduled maintenance completed successfully",
+    "Investigating degraded performance in storage APIs",
+    "Quota increase procurement delays expected this quarter",
+    "Spot market prices stable across regions",
+    "Networking incident causing intermittent packet loss",
+]
+SAMPLE_SUMMARY = (
+    "Engineers are investigating reports of elevated error rates. "
+    "Some customers may experience increased latency while mitigation is in progress. "
+    "We will provide another update as soon as more information is available."
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-id", default="ProsusAI/finbert")
+    parser.add_argument("--documents", type=int, default=256, help="Synthetic corpus size.")
+    parser.add_argument("--corpus", default="", help="Optional JSON file with a list of {title, summary} documents.")
+    parser.add_argument("--latency-samples", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-chars", type=int, default=2000)
+    parser.add_argument("--onnx-cache-dir", default=".tmp/onnx-cache")
+    parser.add_argument("--quantize", action="store_true", help="Benchmark the int8 dynamic-quantized graph.")
+    parser.add_argument("--tolerance", type=float, default=0.02, help="Maximum allowed |S_v| difference per component.")
+    parser.add_argument("--output", default=".tmp/perf/onnx-enricher-benchmark.json")
+    parser.add_argument("--worker", choices=PROVIDERS, default="", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def now_utc_iso() -> str:
+    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def load_corpus(args: argparse.Namespace) -> list[dict[str, Any]]:
+    if args.corpus:
+        with Path(args.corpus).open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        return [{"source": "corpus", "title": str(item.get("title", "")), "summary": item.get("summary")} for item in payload]
+
+    documents = []
+    for index in range(args.documents):
+        title = SAMPLE_TITLES[index % len(SAMPLE_TITLES)]
+        repeat = 1 + index % 4
+        documents.append({"source": "bench", "title": f"{title} #{index}", "summary": " ".join([SAMPLE_SUMMARY] * repeat)})
+    return documents
+
+
+def read_rss_mb() -> dict[str, float]:
+    values: dict[str, float] = {}
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    key, amount, _unit = line.split()
+                    values["rss_mb" if key == "VmRSS:" else "peak_rss_mb"] = int(amount) / 1024
+    except OSError:
+        import resource
+
+        values["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return values
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return float("nan")
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    sys.path.insert(0, str(AI_ENGINE_DIR))
+    import main as ai  # noqa: E402
+
+    corpus = [ai.SignalDocument(**item) for item in load_corpus(args)]
+    baseline_rss = read_rss_mb()
+
+    load_started = time.perf_counter()
+    common = {
+        "model_id": args.model_id,
+        "max_chars": args.max_chars,
+        "cache_size": 0,
+        "batch_size": args.batch_size,
+        "batch_max_size": 1,
+    }
+    if args.worker == "finbert-onnx":
+        enricher = ai.OnnxFinbertEnricher(cache_dir=args.onnx_cache_dir, quantize=args.quantize, **common)
+    else:
+        enricher = ai.FinbertEnricher(**common)
+    load_seconds = time.perf_counter() - load_started
+
+    enricher.enrich_batch(corpus[: min(8, len(corpus))])
+
+    latencies_ms = []
+    for index in range(args.latency_samples):
+        document = corpus[index % len(corpus)]
+        started = time.perf_counter()
+        enricher.enrich([document])
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    vectors = enricher.enrich_batch(corpus)
+    batch_seconds = time.perf_counter() - started
+
+    payload = {
+        "provider": args.worker,
+        "load_seconds": load_seconds,
+        "latency_ms": {
+            "p50": percentile(latencies_ms, 50),
+            "p95": percentile(latencies_ms, 95),
+            "mean": statistics.fmean(latencies_ms) if latencies_ms else float("nan"),
+        },
+        "throughput_docs_per_second": len(corpus) / batch_seconds if batch_seconds > 0 else float("inf"),
+        "rss_before_load_mb": baseline_rss.get("rss_mb"),
+        **read_rss_mb(),
+        "s_v": [result.s_v for result in vectors],
+    }
+    json.dump(payload, sys.stdout)
+    return 0
+
+
+def run_provider(args: argparse.Namespace, provider: str) -> dict[str, Any]:
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--worker",
+        provider,
+        "--model-id",
+        args.model_id,
+        "--documents",
+        str(args.documents),
+        "--latency-samples",
+        str(args.latency_samples),
+        "--batch-size",
+        str(args.batch_size),
+        "--max-chars",
+        str(args.max_chars),
+        "--onnx-cache-dir",
+        args.onnx_cache_dir,
+    ]
+    if args.corpus:
+        command += ["--corpus", args.corpus]
+    if args.quantize:
+        command.append("--quantize")
+    # Each provider runs in its own interpreter so RSS numbers are not polluted by the other model.
+    completed = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout)
+
+
+def compare_parity(reference: list[list[float]], candidate: list[list[float]]) -> dict[str, Any]:
+    diffs = [max(abs(a - b) for a, b in zip(ref, cand)) for ref, cand in zip(reference, candidate)]
+    argmax_agreement = sum(
+        1 for ref, cand in zip(reference, candidate) if ref.index(max(ref)) == cand.index(max(cand))
+    )
+    return {
+        "documents": len(diffs),
+        "max_abs_diff": max(diffs) if diffs else 0.0,
+        "mean_abs_diff": statistics.fmean(diffs) if diffs else 0.0,
+        "argmax_agreement": argmax_agreement / len(diffs) if diffs else 1.0,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    if args.worker:
+        return run_worker(args)
+
+    results = {provider: run_provider(args, provider) for provider in PROVIDERS}
+    parity = compare_parity(results["finbert"].pop("s_v"), results["finbert-onnx"].pop("s_v"))
+    parity["tolerance"] = args.tolerance
+    parity["passed"] = parity["max_abs_diff"] <= args.tolerance
+
+    report = {
+        "generated_at_utc": now_utc_iso(),
+        "model_id": args.model_id,
+        "quantized": args.quantize,
+        "providers": results,
+        "parity": parity,
+    }
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+    for provider, payload in results.items():
+        print(
+            f"{provider}: p50={payload['latency_ms']['p50']:.2f}ms "
+            f"p95={payload['latency_ms']['p95']:.2f}ms "
+            f"throughput={payload['throughput_docs_per_second']:.1f} docs/s "
+            f"rss={payload.get('rss_mb', float('nan')):.1f}MB"
+        )
+    print(f"S_v parity: max_abs_diff={parity['max_abs_diff']:.5f} tolerance={args.tolerance} passed={parity['passed']}")
+    print(f"Report file: {output_path}")
+    return 0 if parity["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Load-test the AI engine and emit canary-ready latency/error metrics.
+
+By default the engine is started in a child process with a stub FinBERT
+(fixed per-batch latency, deterministic scores) so the run needs no model
+download. Point ``--target`` at a running engine to measure a real deployment.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import requests
+
+AI_ENGINE_DIR = Path(__file__).resolve().parents[2] / "src" / "services" / "ai-engine"
+
+ENDPOINTS = {
+    "analyze": "/analyze",
+    "enrich": "/signals/enrich",
+    "enrich_batch": "/signals/enrich/batch",
+    "summarize": "/signals/summarize",
+}
+DEFAULT_MIX = "analyze=4,enrich=3,enrich_batch=2,summarize=1"
+
+PROVIDERS = ("aws-status", "azure-status", "gcp-status")
+REGIONS = ("us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1")
+SERVICES = ("EC2", "S3", "Lambda", "Compute Engine", "Virtual Machines", "Spot capacity")
+EVENTS = (
+    "elevated error rates",
+    "increased launch latency",
+    "capacity shortage",
+    "degraded performance",
+    "partial outage",
+    "network connectivity issues",
+)
+BODY_SENTENCES = (
+    "Engineers are actively investigating the issue.",
+    "Some customers may experience throttling when launching new instances.",
+    "We have identified the root cause and are applying mitigations.",
+    "Spot interruptions are higher than usual in the affected zones.",
+    "Existing workloads are not affected.",
+    "We expect recovery within the next hour and will provide another update.",
+    "Supply of the affected instance families remains constrained.",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", default="", help="Base URL of a running engine; omit to start a stub engine.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Closed-loop client threads.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds.")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds before the run.")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted request mix, e.g. analyze=4,enrich=1.")
+    parser.add_argument("--batch-documents", type=int, default=16, help="Documents per /signals/enrich/batch call.")
+    parser.add_argument("--summary-documents", type=int, default=4, help="Documents per /signals/summarize call.")
+    parser.add_argument(
+        "--distinct-documents",
+        type=int,
+        default=500,
+        help="Size of the document pool; smaller pools raise enrichment cache hit rates.",
+    )
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request client timeout in seconds.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--stub-batch-ms", type=float, default=8.0, help="Stub FinBERT latency per forward pass.")
+    parser.add_argument("--stub-doc-ms", type=float, default=0.5, help="Stub FinBERT latency per document.")
+    parser.add_argument(
+        "--extra-metrics",
+        default="",
+        help="JSON file whose metrics object is merged into the output (e.g. canary fleet metrics).",
+    )
+    parser.add_argument("--output", default=".tmp/perf/ai-engine-loadtest.json")
+    parser.add_argument("--serve-stub-port", type=int, default=0, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def now_utc_iso() -> str:
+    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_mix(raw: str) -> list[tuple[str, float]]:
+    mix: list[tuple[str, float]] = []
+    for part in raw.split(","):
+        name, _, weight = part.strip().partition("=")
+        if not name:
+            continue
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}' in --mix; expected one of {', '.join(ENDPOINTS)}.")
+        value = float(weight) if weight else 1.0
+        if value > 0:
+            mix.append((name, value))
+    if not mix:
+        raise ValueError("--mix selects no endpoints.")
+    return mix
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+# --- stub engine -----------------------------------------------------------
+
+
+def serve_stub(port: int, batch_ms: float, doc_ms: float) -> int:
+    """Run the real app with a FinBERT stand-in; used as the child process."""
+    sys.path.insert(0, str(AI_ENGINE_DIR))
+    import uvicorn
+
+    import main
+
+    class StubFinbertEnricher(main.FinbertEnricher):
+        """``FinbertEnricher`` with the model replaced by a fixed-cost deterministic scorer."""
+
+        def _load_model(self, model_id: str) -> None:
+            self._tokenizer = None
+
+        def _infer(self, texts: list[str]) -> list[list[float]]:
+            time.sleep((batch_ms + doc_ms * len(texts)) / 1000)
+            scores = []
+            for text in texts:
+                digest = hashlib.blake2b(text.encode("utf-8"), digest_size=3).digest()
+                scores.append([0.05 + byte / 255 for byte in digest])
+            return scores
+
+    main.preloaded_state = {
+        "enricher": StubFinbertEnricher(
+            model_id="stub",
+            max_chars=main.ENRICHMENT_MAX_CHARS,
+            cache_size=main.ENRICHMENT_CACHE_SIZE,
+            batch_size=main.ENRICHMENT_BATCH_SIZE,
+            batch_max_size=main.ENRICHMENT_BATCH_MAX_SIZE,
+            batch_max_wait_ms=main.ENRICHMENT_BATCH_MAX_WAIT_MS,
+        ),
+        "summarizer": main.build_summarizer(),
+    }
+    uvicorn.run(main.app, host="127.0.0.1", port=port, log_level="warning")
+    return 0
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub_engine(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--serve-stub-port",
+        str(port),
+        "--stub-batch-ms",
+        str(args.stub_batch_ms),
+        "--stub-doc-ms",
+        str(args.stub_doc_ms),
+    ]
+    process = subprocess.Popen(command, env={**os.environ, "AI_ENRICH_PROVIDER": "finbert"})
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Stub engine exited with code {process.returncode}.")
+        try:
+            if requests.get(f"{base_url}/readyz", timeout=1).status_code == 200:
+                return process, base_url
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Stub engine did not become ready within 60s.")
+
+
+# --- payloads --------------------------------------------------------------
+
+
+def build_document_pool(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    pool = []
+    for index in range(max(1, count)):
+        region = rng.choice(REGIONS)
+        title = f"{rng.choice(SERVICES)} {rng.choice(EVENTS)} in {region} (#{index})"
+        # Mixed workload: about half are bare titles, the rest carry incident bodies.
+        summary = " ".join(rng.choices(BODY_SENTENCES, k=rng.randint(2, 12))) if rng.random() < 0.5 else None
+        document: dict[str, Any] = {"source": rng.choice(PROVIDERS), "title": title, "region": region}
+        if summary:
+            document["summary"] = summary
+        pool.append(document)
+    return pool
+
+
+def payload_factory(args: argparse.Namespace, pool: list[dict[str, Any]]) -> Callable[[str, random.Random], dict]:
+    def make(endpoint: str, rng: random.Random) -> dict:
+        if endpoint == "analyze":
+            base = rng.uniform(0.05, 2.0)
+            history = [round(base * (1 + rng.gauss(0, 0.05)), 4) for _ in range(rng.randint(5, 30))]
+            return {
+                "spotPriceHistory": history,
+                "rebalanceSignal": rng.random() < 0.05,
+                "capacityScore": round(rng.random(), 3),
+            }
+        if endpoint == "enrich":
+            return {"documents": [rng.choice(pool)]}
+        if endpoint == "enrich_batch":
+            return {"documents": rng.sample(pool, min(len(pool), args.batch_documents))}
+        return {"documents": rng.sample(pool, min(len(pool), args.summary_documents)), "maxChars": 280}
+
+    return make
+
+
+# --- load generation -------------------------------------------------------
+
+
+@dataclass
+class EndpointSamples:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
+
+
+def run_load(
+    base_url: str,
+    args: argparse.Namespace,
+    mix: list[tuple[str, float]],
+    make_payload: Callable[[str, random.Random], dict],
+) -> tuple[dict[str, EndpointSamples], float]:
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    samples = {name: EndpointSamples() for name in names}
+    lock = threading.Lock()
+    start = time.perf_counter()
+    measure_from = start + args.warmup
+    stop_at = measure_from + args.duration
+
+    def worker(worker_index: int) -> None:
+        rng = random.Random(args.seed * 1000 + worker_index)
+        session = requests.Session()
+        local = {name: EndpointSamples() for name in names}
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            endpoint = rng.choices(names, weights)[0]
+            body = make_payload(endpoint, rng)
+            began = time.perf_counter()
+            try:
+                response = session.post(base_url + ENDPOINTS[endpoint], json=body, timeout=args.timeout)
+                status = str(response.status_code)
+                failed = not response.ok
+            except requests.RequestException as exc:
+                status = type(exc).__name__
+                failed = True
+            finished = time.perf_counter()
+            if began < measure_from or finished > stop_at:
+                continue
+            entry = local[endpoint]
+            entry.latencies_ms.append((finished - began) * 1000)
+            entry.errors += int(failed)
+            entry.status_counts[status] = entry.status_counts.get(status, 0) + 1
+        session.close()
+        with lock:
+            for name, entry in local.items():
+                target = samples[name]
+                target.latencies_ms.extend(entry.latencies_ms)
+                target.errors += entry.errors
+                for status, count in entry.status_counts.items():
+                    target.status_counts[status] = target.status_counts.get(status, 0) + count
+
+    threads = [
+        threading.Thread(target=worker, args=(index,), name=f"load-{index}", daemon=True)
+        for index in range(max(1, args.concurrency))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, args.duration
+
+
+def summarize_samples(latencies_ms: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    ordered = sorted(latencies_ms)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 6) if count else None,
+        "rps": round(count / elapsed, 2) if elapsed > 0 else None,
+        "p50_ms": round(percentile(ordered, 0.50), 3) if count else None,
+        "p95_ms": round(percentile(ordered, 0.95), 3) if count else None,
+        "p99_ms": round(percentile(ordered, 0.99), 3) if count else None,
+        "mean_ms": round(statistics.fmean(ordered), 3) if count else None,
+    }
+
+
+def load_extra_metrics(path: str) -> dict[str, Any]:
+    if not path:
+        return {}
+    with Path(path).open("r", encoding="utf-8-sig") as handle:
+        payload = json.load(handle)
+    metrics = payload.get("metrics") if isinstance(payload, dict) else None
+    if not isinstance(metrics, dict):
+        raise ValueError(f"{path} must contain an object field: metrics")
+    return metrics
+
+
+def main() -> int:
+    args = parse_args()
+    if args.serve_stub_port:
+        return serve_stub(args.serve_stub_port, args.stub_batch_ms, args.stub_doc_ms)
+
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    pool = build_document_pool(args.distinct_documents, rng)
+    extra_metrics = load_extra_metrics(args.extra_metrics)
+
+    process = None
+    base_url = args.target.rstrip("/")
+    if not base_url:
+        process, base_url = start_stub_engine(args)
+    try:
+        samples, elapsed = run_load(base_url, args, mix, payload_factory(args, pool))
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    endpoints = {
+        ENDPOINTS[name]: {**summarize_samples(entry.latencies_ms, entry.errors, elapsed), "status": entry.status_counts}
+        for name, entry in samples.items()
+    }
+    all_latencies = [value for entry in samples.values() for value in entry.latencies_ms]
+    overall = summarize_samples(all_latencies, sum(entry.errors for entry in samples.values()), elapsed)
+    if not overall["requests"]:
+        print("No requests completed inside the measurement window.", file=sys.stderr)
+        return 1
+
+    report = {
+        "generatedAt": now_utc_iso(),
+        "target": args.target or "stub",
+        "config": {
+            "concurrency": args.concurrency,
+            "durationSeconds": args.duration,
+            "warmupSeconds": args.warmup,
+            "mix": dict(mix),
+            "batchDocuments": args.batch_documents,
+            "summaryDocuments": args.summary_documents,
+            "distinctDocuments": args.distinct_documents,
+            "stubBatchMs": None if args.target else args.stub_batch_ms,
+            "stubDocMs": None if args.target else args.stub_doc_ms,
+        },
+        # evaluate_m3_canary.py reads this object; latency and errors span the whole request mix.
+        "metrics": {
+            **extra_metrics,
+            "p95_inference_latency_ms": overall["p95_ms"],
+            "inference_error_rate": overall["error_rate"],
+        },
+        "overall": overall,
+        "endpoints": endpoints,
+    }
+
+    print(f"{'endpoint':<24} {'requests':>9} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, row in [*endpoints.items(), ("overall", overall)]:
+        if not row["requests"]:
+            continue
+        print(
+            f"{name:<24} {row['requests']:>9} {row['rps']:>8.1f} {row['p50_ms']:>9.2f} "
+            f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['errors']:>7}"
+        )
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Report written to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for ai-engine request-path functions, with saved baselines and regression checks."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+AI_ENGINE_DIR = Path(__file__).resolve().parents[2] / "src" / "services" / "ai-engine"
+sys.path.insert(0, str(AI_ENGINE_DIR))
+
+DOCUMENT_SIZES = (1, 100, 10_000)
+HISTORY_SIZES = (10, 100, 10_000)
+
+TITLES = (
+    "Service disruption in us-east-1",
+    "RESOLVED: elevated latency for compute instances",
+    "Capacity shortage reported for GPU instance families",
+    "Scheduled maintenance completed successfully",
+    "Investigating degraded performance in storage APIs",
+    "Quota increase procurement delays expected this quarter",
+    "Spot market prices stable across regions",
+    "Networking incident causing intermittent packet loss",
+)
+SENTENCES = (
+    "Engineers are investigating reports of elevated error rates.",
+    "Some customers may experience increased latency while mitigation is in progress.",
+    "Spot interruptions are higher than usual in the affected zones.",
+    "Supply of the affected instance families remains constrained.",
+    "We will provide another update as soon as more information is available.",
+)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    func: Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class Timing:
+    median_us: float
+    min_us: float
+    stdev_us: float
+    loops: int
+    repeats: int
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "median_us": round(self.median_us, 3),
+            "min_us": round(self.min_us, 3),
+            "stdev_us": round(self.stdev_us, 3),
+            "loops": self.loops,
+            "repeats": self.repeats,
+        }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this substring.")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed repeats per case; the median is reported.")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per timed repeat.")
+    parser.add_argument("--warmup", type=float, default=0.2, help="Untimed seconds per case before calibration.")
+    parser.add_argument("--quick", action="store_true", help="3 repeats of 0.02 s each; for smoke runs only.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default=".tmp/perf/microbench-ai-engine.json")
+    parser.add_argument("--save-baseline", default="", help="Also write the results to this baseline file.")
+    parser.add_argument("--compare", default="", help="Baseline file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percent slowdown of the median over the baseline that counts as a regression.",
+    )
+    return parser.parse_args()
+
+
+def now_utc_iso() -> str:
+    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_documents(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    documents = []
+    for index in range(count):
+        document: dict[str, Any] = {"source": "aws-status", "title": f"{rng.choice(TITLES)} #{index}"}
+        if rng.random() < 0.6:
+            document["summary"] = " ".join(rng.choices(SENTENCES, k=rng.randint(1, 8)))
+        documents.append(document)
+    return documents
+
+
+def build_cases(rng: random.Random) -> list[Case]:
+    import main
+    from main import (
+        EnrichBatchItem,
+        EnrichBatchResponse,
+        EnrichRequest,
+        EnrichResult,
+        HeuristicEnricher,
+        HeuristicSummarizer,
+        RiskScorer,
+        normalize_text,
+        normalize_vector,
+        sanitize_enrich_result,
+    )
+
+    cases: list[Case] = []
+    scorer = RiskScorer()
+    for size in HISTORY_SIZES:
+        history = [round(1.0 + rng.gauss(0, 0.05), 4) for _ in range(size)]
+        cases.append(Case(f"risk.assess_risk[history={size}]", lambda h=history: scorer.assess_risk(h, False, 0.5)))
+
+    enricher = HeuristicEnricher()
+    # Summaries are measured uncached: cache_size=0 recomputes segmentation every call.
+    summarizer = HeuristicSummarizer(max_chars=280, cache_size=0)
+    for size in DOCUMENT_SIZES:
+        raw_documents = build_documents(size, rng)
+        body = json.dumps({"documents": raw_documents}).encode("utf-8")
+        documents = EnrichRequest.model_validate_json(body).documents
+        texts = [f"{doc.title}. {doc.summary}" if doc.summary else doc.title for doc in documents]
+        vectors = [
+            EnrichBatchItem(index=index, S_v=[0.2, 0.5, 0.3], P_v=0.4, B_s=0.05) for index in range(size)
+        ]
+        response = EnrichBatchResponse(schemaVersion=main.ENRICHMENT_SCHEMA_VERSION, vectors=vectors)
+
+        cases.extend(
+            [
+                Case(f"heuristic.enrich[docs={size}]", lambda d=documents: enricher.enrich(d)),
+                Case(f"heuristic.enrich_batch[docs={size}]", lambda d=documents: enricher.enrich_batch(d)),
+                Case(f"heuristic.summarize_many[docs={size}]", lambda t=texts: summarizer.summarize_many(t, 280)),
+                Case(f"normalize_text[docs={size}]", lambda t=texts: [normalize_text(text) for text in t]),
+                Case(f"pydantic.EnrichRequest.parse[docs={size}]", lambda b=body: EnrichRequest.model_validate_json(b)),
+                Case(
+                    f"pydantic.EnrichBatchResponse.serialize[docs={size}]",
+                    lambda r=response: r.model_dump_json(by_alias=True),
+                ),
+            ]
+        )
+
+    raw_result = EnrichResult(s_v=[0.3, float("nan"), 0.9], p_v=1.4, b_s=-0.2)
+    cases.append(Case("normalize_vector", lambda: normalize_vector([0.2, 0.5, 0.3])))
+    cases.append(Case("sanitize_enrich_result", lambda: sanitize_enrich_result(raw_result)))
+    return cases
+
+
+def run_loops(func: Callable[[], Any], loops: int) -> float:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def measure(func: Callable[[], Any], repeats: int, min_time: float, warmup: float) -> Timing:
+    warm_until = time.perf_counter() + warmup
+    func()
+    while time.perf_counter() < warm_until:
+        func()
+
+    # Grow the loop count until one repeat takes at least min_time, like timeit.autorange.
+    loops = 1
+    while True:
+        elapsed = run_loops(func, loops)
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.1))
+
+    per_call_us = [run_loops(func, loops) / loops * 1e6 for _ in range(max(1, repeats))]
+    return Timing(
+        median_us=statistics.median(per_call_us),
+        min_us=min(per_call_us),
+        stdev_us=statistics.stdev(per_call_us) if len(per_call_us) > 1 else 0.0,
+        loops=loops,
+        repeats=len(per_call_us),
+    )
+
+
+def compare(results: dict[str, dict[str, Any]], baseline_path: Path, threshold: float) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("cases", {})
+    regressions: list[str] = []
+    print(f"\nComparison with {baseline_path} (regression threshold +{threshold:g}%):")
+    print(f"{'case':<52} {'baseline us':>12} {'current us':>12} {'change':>9}")
+    for name, row in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("median_us"):
+            print(f"{name:<52} {'-':>12} {row['median_us']:>12.3f} {'new':>9}")
+            continue
+        change = (row["median_us"] / previous["median_us"] - 1) * 100
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<52} {previous['median_us']:>12.3f} {row['median_us']:>12.3f} {change:>+8.1f}%{flag}")
+    return regressions
+
+
+def main() -> int:
+    args = parse_args()
+    if args.quick:
+        args.repeats, args.min_time, args.warmup = 3, 0.02, 0.02
+    cases = [case for case in build_cases(random.Random(args.seed)) if args.filter in case.name]
+    if not cases:
+        print(f"No cases match --filter {args.filter!r}.", file=sys.stderr)
+        return 2
+
+    results: dict[str, dict[str, Any]] = {}
+    print(f"{'case':<52} {'median us':>12} {'min us':>12} {'stdev':>9} {'loops':>8}")
+    for case in cases:
+        timing = measure(case.func, args.repeats, args.min_time, args.warmup)
+        results[case.name] = timing.as_dict()
+        print(
+            f"{case.name:<52} {timing.median_us:>12.3f} {timing.min_us:>12.3f} "
+            f"{timing.stdev_us:>9.3f} {timing.loops:>8}"
+        )
+
+    report = {
+        "generatedAt": now_utc_iso(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "settings": {"repeats": args.repeats, "minTimeSeconds": args.min_time, "warmupSeconds": args.warmup},
+        "cases": results,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report written to {output_path}")
+
+    if args.compare:
+        regressions = compare(results, Path(args.compare), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed more than {args.threshold:g}%.")
+            return 1
+        print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
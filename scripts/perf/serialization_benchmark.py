@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Measure /signals/enrich/batch response encode/decode cost per 1k vectors for each response format."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+AI_ENGINE_DIR = Path(__file__).resolve().parents[2] / "src" / "services" / "ai-engine"
+sys.path.insert(0, str(AI_ENGINE_DIR))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+import serialization  # noqa: E402
+from serialization import (  # noqa: E402
+    FLOAT32_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    vector_batch_response,
+)
+
+SCHEMA_VERSION = "1.0"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vectors", type=int, default=1000, help="Vectors per response.")
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default=".tmp/perf/serialization-benchmark.json")
+    return parser.parse_args()
+
+
+def now_utc_iso() -> str:
+    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_vectors(count: int, seed: int) -> list[tuple[list[float], float, float]]:
+    rng = random.Random(seed)
+    vectors = []
+    for _ in range(count):
+        raw = [rng.random() for _ in range(3)]
+        total = sum(raw)
+        vectors.append(([value / total for value in raw], rng.random(), rng.random() * 0.3))
+    return vectors
+
+
+def pydantic_models(vectors: list[tuple[list[float], float, float]]) -> Any:
+    # Imported lazily: main pulls in the full service module graph.
+    from main import EnrichBatchItem, EnrichBatchResponse
+
+    return EnrichBatchResponse(
+        schemaVersion=SCHEMA_VERSION,
+        vectors=[
+            EnrichBatchItem(index=index, S_v=s_v, P_v=p_v, B_s=b_s)
+            for index, (s_v, p_v, b_s) in enumerate(vectors)
+        ],
+    )
+
+
+def encoders(vectors: list[tuple[list[float], float, float]]) -> dict[str, tuple[Callable[[], bytes], Callable[[bytes], Any]]]:
+    def legacy_jsonable() -> bytes:
+        # FastAPI < 0.130: pydantic items -> jsonable_encoder -> json.dumps.
+        content = jsonable_encoder(pydantic_models(vectors), by_alias=True)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def pydantic_dump_json() -> bytes:
+        # FastAPI >= 0.130 fast path for response_model routes.
+        return pydantic_models(vectors).model_dump_json(by_alias=True).encode("utf-8")
+
+    def negotiated(media_type: str) -> Callable[[], bytes]:
+        return lambda: bytes(vector_batch_response(SCHEMA_VERSION, vectors, media_type).body)
+
+    def decode_float32(payload: bytes) -> Any:
+        values = array("f")
+        values.frombytes(payload)
+        return values
+
+    formats: dict[str, tuple[Callable[[], bytes], Callable[[bytes], Any]]] = {
+        "pydantic+jsonable_encoder": (legacy_jsonable, json.loads),
+        "pydantic.model_dump_json": (pydantic_dump_json, json.loads),
+        f"json ({'orjson' if serialization.orjson is not None else 'stdlib'})": (
+            negotiated(JSON_MEDIA_TYPE),
+            serialization.orjson.loads if serialization.orjson is not None else json.loads,
+        ),
+        "float32": (negotiated(FLOAT32_MEDIA_TYPE), decode_float32),
+    }
+    if serialization.msgpack is not None:
+        formats["msgpack"] = (negotiated(MSGPACK_MEDIA_TYPE), serialization.msgpack.unpackb)
+    return formats
+
+
+def time_call(func: Callable[[], Any], repeats: int) -> list[float]:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> int:
+    args = parse_args()
+    vectors = build_vectors(args.vectors, args.seed)
+    scale = 1000 / max(1, args.vectors)
+
+    results: dict[str, dict[str, float]] = {}
+    for name, (encode, decode) in encoders(vectors).items():
+        payload = encode()
+        encode()  # warm caches and lazy imports
+        encode_ms = time_call(encode, args.repeats)
+        decode_ms = time_call(lambda: decode(payload), args.repeats)
+        results[name] = {
+            "encode_ms_per_1k": round(statistics.median(encode_ms) * scale, 4),
+            "decode_ms_per_1k": round(statistics.median(decode_ms) * scale, 4),
+            "bytes_per_1k": round(len(payload) * scale, 1),
+        }
+
+    print(f"{'format':<28} {'encode ms/1k':>13} {'decode ms/1k':>13} {'bytes/1k':>10}")
+    for name, row in results.items():
+        print(f"{name:<28} {row['encode_ms_per_1k']:>13.3f} {row['decode_ms_per_1k']:>13.3f} {row['bytes_per_1k']:>10.0f}")
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "generatedAt": now_utc_iso(),
+        "vectors": args.vectors,
+        "repeats": args.repeats,
+        "python": sys.version.split()[0],
+        "formats": results,
+    }
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Report written to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
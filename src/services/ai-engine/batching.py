@@ -0,0 +1,169 @@
+import contextvars
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BatchObserver = Callable[[int, list[float]], None]
+
+
+@dataclass
+class _PendingItem(Generic[T, R]):
+    item: T
+    enqueued_at: float
+    future: "Future[R]" = field(default_factory=Future)
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+class MicroBatchScheduler(Generic[T, R]):
+    """Coalesces items submitted from concurrent threads into bounded batches.
+
+    A single worker thread drains the queue: it waits for the first item, then
+    keeps collecting until either ``max_batch_size`` items are pending or
+    ``max_wait_seconds`` has elapsed since that first item was enqueued. The
+    collected batch is handed to ``process_batch`` in one call and each result
+    is delivered to the future of the item at the same position.
+    ``process_batch`` runs in the ``contextvars`` context of the batch's first
+    item, so tracing spans it opens are children of that caller's span.
+
+    The worker is started lazily and restarted after ``fork()`` so schedulers
+    built in a parent process keep working inside forked workers.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[T]], Sequence[R]],
+        max_batch_size: int,
+        max_wait_seconds: float,
+        on_batch: BatchObserver | None = None,
+        name: str = "micro-batch",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max(0.0, max_wait_seconds)
+        self._on_batch = on_batch
+        self._name = name
+        self._lock = threading.Lock()
+        self._queue: "queue.SimpleQueue[_PendingItem[T, R] | None]" = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._closed = False
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    def submit(self, item: T) -> "Future[R]":
+        return self.submit_many([item])[0]
+
+    def submit_many(self, items: Sequence[T]) -> list["Future[R]"]:
+        if self._closed:
+            raise RuntimeError(f"{self._name} scheduler is closed.")
+        self._ensure_worker()
+        now = time.perf_counter()
+        pending = [_PendingItem(item=item, enqueued_at=now) for item in items]
+        for entry in pending:
+            self._queue.put(entry)
+        return [entry.future for entry in pending]
+
+    def map(self, items: Sequence[T], timeout: float | None = None) -> list[R]:
+        return [future.result(timeout=timeout) for future in self.submit_many(items)]
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            thread = self._thread if self._pid == os.getpid() else None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+    def _ensure_worker(self) -> None:
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                # Queue contents and the worker thread do not survive fork().
+                self._queue = queue.SimpleQueue()
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        work_queue = self._queue
+        while True:
+            first = work_queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            deadline = first.enqueued_at + self._max_wait_seconds
+            stop = False
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    entry = work_queue.get(timeout=remaining) if remaining > 0 else work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: list[_PendingItem[T, R]]) -> None:
+        started = time.perf_counter()
+        waits_ms = [(started - entry.enqueued_at) * 1000 for entry in batch]
+        try:
+            results = batch[0].context.run(self._process_batch, [entry.item for entry in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self._name} batch returned {len(results)} results for {len(batch)} items."
+                )
+        except Exception as exc:
+            for entry in batch:
+                entry.future.set_exception(exc)
+        else:
+            for entry, result in zip(batch, results):
+                entry.future.set_result(result)
+
+        if self._on_batch is not None:
+            try:
+                self._on_batch(len(batch), waits_ms)
+            except Exception:
+                pass
+
+
+def length_buckets(lengths: Sequence[int], max_batch_size: int) -> list[list[int]]:
+    """Group item indices into batches of similar length.
+
+    Indices are stably sorted by length and cut into runs of at most
+    ``max_batch_size``, so each batch padded to its longest item wastes as
+    little as possible. Callers scatter results back by index to restore the
+    original order.
+    """
+    if max_batch_size < 1:
+        raise ValueError("max_batch_size must be at least 1.")
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    return [order[start : start + max_batch_size] for start in range(0, len(order), max_batch_size)]
+
+
+def padding_efficiency(lengths: Sequence[int]) -> float:
+    """Share of real tokens in a batch padded to its longest item."""
+    longest = max(lengths, default=0)
+    if longest == 0:
+        return 1.0
+    return sum(lengths) / (len(lengths) * longest)
@@ -0,0 +1,365 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+logger = logging.getLogger("uvicorn.error")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+_SCALAR_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def approximate_size(value: object, _depth: int = 0) -> int:
+    """Rough deep ``sys.getsizeof`` for the plain values caches hold.
+
+    Follows containers and instance ``__dict__``s a few levels down; shared
+    objects are counted every time they are referenced.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, _SCALAR_TYPES) or _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            approximate_size(key, _depth + 1) + approximate_size(item, _depth + 1) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(approximate_size(item, _depth + 1) for item in value)
+    if hasattr(value, "__dict__"):
+        return size + approximate_size(vars(value), _depth + 1)
+    return size
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Cumulative counters plus current size of one in-process cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    capacity: int
+    approximate_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LruCache(Generic[K, V]):
+    """Thread-safe bounded LRU mapping with explicit get/put.
+
+    Unlike ``functools.lru_cache`` this lets callers look up many keys first,
+    compute every miss in one batch, and then fill the cache with the results.
+    Each entry keeps its approximate size, measured once outside the lock, so
+    replacing or evicting it never walks the old value again.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = max(0, maxsize)
+        self._entries: "OrderedDict[K, tuple[V, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]  # type: ignore[index]
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        found: dict[K, V] = {}
+        lookups = 0
+        with self._lock:
+            for key in keys:
+                lookups += 1
+                entry = self._entries.get(key, _MISSING)
+                if entry is not _MISSING:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[0]  # type: ignore[index]
+            self._hits += len(found)
+            self._misses += lookups - len(found)
+        return found
+
+    def put(self, key: K, value: V) -> None:
+        if self._maxsize == 0:
+            return
+        size = approximate_size(key) + approximate_size(value)
+        with self._lock:
+            previous = self._entries.get(key, _MISSING)
+            if previous is not _MISSING:
+                self._bytes -= previous[1]  # type: ignore[index]
+            self._entries[key] = (value, size)
+            self._entries.move_to_end(key)
+            self._bytes += size
+            while len(self._entries) > self._maxsize:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def put_many(self, items: Iterable[tuple[K, V]]) -> None:
+        for key, value in items:
+            self.put(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Hits and misses count keys, so a ``get_many`` of ten keys is ten lookups."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                capacity=self._maxsize,
+                approximate_bytes=self._bytes,
+            )
+
+
+def content_digest(*parts: object) -> str:
+    """Stable digest used as a content-addressed key across processes and restarts."""
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(str(part).encode("utf-8"))
+        hasher.update(b"\x1f")
+    return hasher.hexdigest()
+
+
+class SqliteCache:
+    """Size-bounded, multi-process safe key/value store backed by one sqlite file.
+
+    Each process and thread gets its own connection (connections are re-opened
+    after ``fork()``), WAL journaling lets uvicorn workers read concurrently,
+    and rows are evicted by last access time once ``max_entries`` is exceeded.
+    Storage errors are logged and treated as misses so the cache can never take
+    the serving path down.
+    """
+
+    _select_chunk = 500
+    _touch_interval_seconds = 60.0
+
+    def __init__(self, path: str | Path, max_entries: int, busy_timeout_ms: int = 5000) -> None:
+        self._path = Path(path).expanduser()
+        self._max_entries = max(1, max_entries)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._evict_every = max(64, self._max_entries // 100)
+        self._local = threading.local()
+        self._writes_lock = threading.Lock()
+        self._writes_since_evict = 0
+        self._evictions = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def evictions(self) -> int:
+        """Rows removed by ``evict`` in this process."""
+        return self._evictions
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        key_list = list(dict.fromkeys(keys))
+        found: dict[str, str] = {}
+        if not key_list:
+            return found
+        try:
+            connection = self._connection()
+            now = time.time()
+            for start in range(0, len(key_list), self._select_chunk):
+                chunk = key_list[start : start + self._select_chunk]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = connection.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+                if rows:
+                    hit_keys = [row[0] for row in rows]
+                    connection.execute(
+                        f"UPDATE entries SET accessed_at = ? WHERE accessed_at < ? "
+                        f"AND key IN ({','.join('?' for _ in hit_keys)})",
+                        [now, now - self._touch_interval_seconds, *hit_keys],
+                    )
+            connection.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache read failed (%s): %s", self._path, exc)
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, str]]) -> None:
+        rows = [(key, value, time.time()) for key, value in items]
+        if not rows:
+            return
+        try:
+            connection = self._connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, accessed_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            connection.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache write failed (%s): %s", self._path, exc)
+            return
+
+        with self._writes_lock:
+            self._writes_since_evict += len(rows)
+            should_evict = self._writes_since_evict >= self._evict_every
+            if should_evict:
+                self._writes_since_evict = 0
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        try:
+            connection = self._connection()
+            cursor = connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+            connection.commit()
+            with self._writes_lock:
+                self._evictions += max(0, cursor.rowcount)
+            return cursor.rowcount
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache eviction failed (%s): %s", self._path, exc)
+            return 0
+
+    def count(self) -> int:
+        try:
+            return int(self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+        except sqlite3.Error:
+            return 0
+
+    def _connection(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and getattr(self._local, "pid", None) == pid:
+            return connection
+
+        connection = sqlite3.connect(str(self._path), timeout=self._busy_timeout_ms / 1000)
+        connection.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+        connection.commit()
+        self._local.connection = connection
+        self._local.pid = pid
+        return connection
+
+
+class TieredCache(Generic[K, V]):
+    """In-process LRU in front of an optional shared persistent store.
+
+    Memory keys are the caller's keys; persistent keys are produced by
+    ``digest`` so they are content-addressed and shared between workers.
+    """
+
+    def __init__(
+        self,
+        memory: LruCache[K, V],
+        persistent: SqliteCache | None,
+        digest: Callable[[K], str],
+        encode: Callable[[V], object],
+        decode: Callable[[object], V],
+    ) -> None:
+        self._memory = memory
+        self._persistent = persistent
+        self._digest = digest
+        self._encode = encode
+        self._decode = decode
+        self._lock = threading.Lock()
+        self._persistent_hits = 0
+        self._persistent_misses = 0
+
+    @property
+    def memory(self) -> LruCache[K, V]:
+        return self._memory
+
+    @property
+    def persistent(self) -> SqliteCache | None:
+        return self._persistent
+
+    def persistent_lookups(self) -> tuple[int, int]:
+        """``(hits, misses)`` for keys that missed memory and were looked up in the persistent store."""
+        with self._lock:
+            return self._persistent_hits, self._persistent_misses
+
+    def get(self, key: K) -> V | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        key_list = list(keys)
+        found = self._memory.get_many(key_list)
+        if self._persistent is None:
+            return found
+
+        missing: dict[str, list[K]] = {}
+        for key in key_list:
+            if key not in found:
+                missing.setdefault(self._digest(key), []).append(key)
+        if not missing:
+            return found
+        hits = 0
+        for digest, raw in self._persistent.get_many(missing.keys()).items():
+            try:
+                value = self._decode(json.loads(raw))
+            except (ValueError, TypeError, KeyError):
+                continue
+            hits += 1
+            for key in missing[digest]:
+                self._memory.put(key, value)
+                found[key] = value
+        with self._lock:
+            self._persistent_hits += hits
+            self._persistent_misses += len(missing) - hits
+        return found
+
+    def put(self, key: K, value: V, persist: bool = True) -> None:
+        self.put_many([(key, value)], persist=persist)
+
+    def put_many(self, items: Iterable[tuple[K, V]], persist: bool = True) -> None:
+        item_list = list(items)
+        self._memory.put_many(item_list)
+        if self._persistent is not None and persist:
+            self._persistent.put_many(
+                (self._digest(key), json.dumps(self._encode(value), separators=(",", ":")))
+                for key, value in item_list
+            )
@@ -0,0 +1,75 @@
+import threading
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for a remote dependency.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    ``allow`` returns ``False`` for ``reset_timeout_seconds``. It then lets a
+    single trial call through (half-open): success closes the breaker again,
+    failure re-opens it for another cool-down.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        on_state_change: Callable[[str, str], None] | None = None,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout_seconds = max(0.0, reset_timeout_seconds)
+        self._clock = clock
+        self._on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self._reset_timeout_seconds:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._clock() - self._opened_at < self._reset_timeout_seconds:
+                    return False
+                self._transition(HALF_OPEN)
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self._failure_threshold):
+                self._opened_at = self._clock()
+                self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        previous = self._state
+        self._state = state
+        if self._on_state_change is not None and previous != state:
+            self._on_state_change(previous, state)
@@ -0,0 +1,148 @@
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+R = TypeVar("R")
+
+
+class QueueFullError(Exception):
+    """Raised when the inference executor has no free worker or queue slot."""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__(f"Inference queue is full; retry after {retry_after_seconds}s.")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a request's deadline passes before its work could start."""
+
+    def __init__(self, message: str = "Request deadline exceeded before inference started.") -> None:
+        super().__init__(message)
+
+
+class InferenceExecutor:
+    """Dedicated thread pool for model work with a bounded admission queue.
+
+    At most ``max_workers`` jobs run and at most ``max_queue`` wait; anything
+    beyond that is rejected immediately with ``QueueFullError`` instead of
+    piling up behind the default anyio threadpool that serves ``/analyze``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue: int,
+        name: str = "inference",
+        on_wait: Callable[[float], None] | None = None,
+        on_reject: Callable[[], None] | None = None,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._max_queue = max(0, max_queue)
+        self._name = name
+        self._on_wait = on_wait
+        self._on_reject = on_reject
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._running = 0
+        self._rejected = 0
+        self._expired = 0
+        self._service_seconds = 0.05
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._admitted - self._running)
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    @property
+    def expired(self) -> int:
+        return self._expired
+
+    def estimated_wait_seconds(self) -> float:
+        """Rough wait for a job admitted now, from queue depth and average service time."""
+        with self._lock:
+            backlog = self._admitted - self._max_workers + 1
+            service_seconds = self._service_seconds
+        if backlog <= 0:
+            return 0.0
+        return backlog * service_seconds / self._max_workers
+
+    async def run(self, func: Callable[..., R], *args, deadline: float | None = None, **kwargs) -> R:
+        """Run ``func`` on a worker thread.
+
+        ``deadline`` is a ``time.perf_counter()`` instant; a job still queued
+        when it passes is dropped with ``DeadlineExceededError`` instead of
+        running for a caller that has already given up.
+        """
+        with self._lock:
+            if self._admitted >= self._max_workers + self._max_queue:
+                self._rejected += 1
+                rejected = True
+            else:
+                self._admitted += 1
+                rejected = False
+        if rejected:
+            if self._on_reject is not None:
+                self._on_reject()
+            retry_after = max(1, math.ceil(self.estimated_wait_seconds()))
+            raise QueueFullError(retry_after)
+
+        enqueued_at = time.perf_counter()
+        context = contextvars.copy_context()
+
+        def job() -> R:
+            started = time.perf_counter()
+            if deadline is not None and started >= deadline:
+                with self._lock:
+                    self._admitted -= 1
+                    self._expired += 1
+                raise DeadlineExceededError()
+            with self._lock:
+                self._running += 1
+            if self._on_wait is not None:
+                self._on_wait((started - enqueued_at) * 1000)
+            try:
+                return context.run(func, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._running -= 1
+                    self._admitted -= 1
+                    self._service_seconds = 0.8 * self._service_seconds + 0.2 * elapsed
+
+        try:
+            future = self._pool.submit(job)
+        except RuntimeError:
+            with self._lock:
+                self._admitted -= 1
+            raise
+        # A cancelled caller cancels the pending future, and the pool then drops ``job`` without running it.
+        future.add_done_callback(self._release_if_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _release_if_cancelled(self, future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._admitted -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
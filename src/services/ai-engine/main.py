@@ -1,15 +1,30 @@
+import asyncio
+import hashlib
+import hmac
 import logging
+import math
 import os
 import re
+import struct
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass
-from functools import lru_cache
-from typing import Iterable, Iterator
-
-from fastapi import FastAPI
-from pydantic import BaseModel, Field, ConfigDict
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache, partial
+from typing import AsyncIterator, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+import anyio
+from fastapi import FastAPI, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
 from opentelemetry import trace, metrics
+from opentelemetry.metrics import CallbackOptions, Observation
 from opentelemetry.trace import Status, StatusCode
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
@@ -21,43 +36,251 @@ from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-from model import RiskScorer
+from batching import MicroBatchScheduler, length_buckets, padding_efficiency
+from caching import CacheStats, LruCache, SqliteCache, TieredCache, content_digest
+from circuit_breaker import CircuitBreaker
+from executor import DeadlineExceededError, InferenceExecutor, QueueFullError
+from model import IncrementalRiskScorer, RiskAssessment, RiskScorer
+from ndjson import NdjsonReader, NdjsonRecord
+from near_duplicate import NearDuplicateIndex
+from profiling import Profile, RequestProfiler, RequestProfilingMiddleware, SlowRequestRecorder, StackSampler
+from runtime_metrics import RuntimeMonitor, process_rss_bytes, threadpool_statistics, torch_thread_settings
+from serialization import (
+    FLOAT32_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    dumps_json,
+    negotiate_vector_format,
+    vector_batch_response,
+)
+from term_matcher import TermMatcher, load_term_matcher
 
 logger = logging.getLogger("uvicorn.error")
 scorer = RiskScorer()
 ENRICHMENT_SCHEMA_VERSION = "1.0"
 SUMMARY_SCHEMA_VERSION = "1.0"
+MODEL_PROVIDERS = ("finbert", "finbert-onnx")
 
 DEFAULT_FINBERT_MODEL = os.getenv("AI_FINBERT_MODEL", "ProsusAI/finbert")
 ENRICHMENT_PROVIDER = os.getenv("AI_ENRICH_PROVIDER", "finbert").lower()
 ENRICHMENT_MAX_CHARS = int(os.getenv("AI_ENRICH_MAX_CHARS", "2000"))
 ENRICHMENT_CACHE_SIZE = int(os.getenv("AI_ENRICH_CACHE_SIZE", "1024"))
+ONNX_CACHE_DIR = os.getenv("AI_ONNX_CACHE_DIR", os.path.expanduser("~/.cache/aether-guard/onnx"))
+ONNX_QUANTIZE = os.getenv("AI_ONNX_QUANTIZE", "false").lower() in ("1", "true", "yes")
+ONNX_INTRA_OP_THREADS = int(os.getenv("AI_ONNX_INTRA_OP_THREADS", "0"))
+ENRICHMENT_TERMS_FILE = os.getenv("AI_ENRICH_TERMS_FILE", "")
+ENRICHMENT_BACKGROUND_LOAD = os.getenv("AI_ENRICH_BACKGROUND_LOAD", "true").lower() in ("1", "true", "yes")
+ENRICHMENT_WARMUP_LENGTHS = [
+    int(item) for item in os.getenv("AI_ENRICH_WARMUP_LENGTHS", "16,128,512").split(",") if item.strip()
+]
+ENRICHMENT_BATCH_SIZE = int(os.getenv("AI_ENRICH_BATCH_SIZE", "32"))
+ENRICHMENT_BATCH_MAX_SIZE = int(os.getenv("AI_ENRICH_BATCH_MAX_SIZE", "32"))
+ENRICHMENT_BATCH_MAX_WAIT_MS = float(os.getenv("AI_ENRICH_BATCH_MAX_WAIT_MS", "5"))
+ENRICHMENT_STREAM_CHUNK_SIZE = int(os.getenv("AI_ENRICH_STREAM_CHUNK_SIZE", str(ENRICHMENT_BATCH_SIZE)))
+ENRICHMENT_STREAM_MAX_LINE_BYTES = int(os.getenv("AI_ENRICH_STREAM_MAX_LINE_BYTES", str(1024 * 1024)))
+ENRICHMENT_NEAR_DUP = os.getenv("AI_ENRICH_NEAR_DUP", "false").lower() in ("1", "true", "yes")
+ENRICHMENT_NEAR_DUP_MAX_DISTANCE = int(os.getenv("AI_ENRICH_NEAR_DUP_MAX_DISTANCE", "3"))
+ENRICHMENT_NEAR_DUP_ENTRIES = int(os.getenv("AI_ENRICH_NEAR_DUP_ENTRIES", "10000"))
+ENRICHMENT_NEAR_DUP_TTL_SECONDS = float(os.getenv("AI_ENRICH_NEAR_DUP_TTL_SECONDS", "3600"))
+ENRICHMENT_NEAR_DUP_MIN_FEATURES = int(os.getenv("AI_ENRICH_NEAR_DUP_MIN_FEATURES", "8"))
 SUMMARY_PROVIDER = os.getenv("AI_SUMMARIZER_PROVIDER", "heuristic").lower()
 SUMMARY_ENDPOINT = os.getenv("AI_SUMMARIZER_ENDPOINT", "")
 SUMMARY_MAX_CHARS = int(os.getenv("AI_SUMMARIZER_MAX_CHARS", "600"))
 SUMMARY_CACHE_SIZE = int(os.getenv("AI_SUMMARIZER_CACHE_SIZE", "1024"))
 SUMMARY_TIMEOUT_SECONDS = float(os.getenv("AI_SUMMARIZER_TIMEOUT", "8"))
+SUMMARY_CONNECT_TIMEOUT_SECONDS = float(os.getenv("AI_SUMMARIZER_CONNECT_TIMEOUT", "2"))
+SUMMARY_CONCURRENCY = int(os.getenv("AI_SUMMARIZER_CONCURRENCY", "8"))
+SUMMARY_BREAKER_FAILURES = int(os.getenv("AI_SUMMARIZER_BREAKER_FAILURES", "5"))
+SUMMARY_BREAKER_COOLDOWN_SECONDS = float(os.getenv("AI_SUMMARIZER_BREAKER_COOLDOWN_SECONDS", "30"))
+SUMMARY_BATCH_MODE = os.getenv("AI_SUMMARIZER_BATCH", "auto").lower()
+SUMMARY_BATCH_MAX_ITEMS = int(os.getenv("AI_SUMMARIZER_BATCH_MAX_ITEMS", "64"))
+SUMMARY_CAPABILITY_TTL_SECONDS = float(os.getenv("AI_SUMMARIZER_CAPABILITY_TTL_SECONDS", "300"))
+INFERENCE_WORKERS = int(os.getenv("AI_INFERENCE_WORKERS", str(min(4, os.cpu_count() or 1))))
+INFERENCE_QUEUE_SIZE = int(os.getenv("AI_INFERENCE_QUEUE_SIZE", "64"))
+SUMMARY_WORKERS = int(os.getenv("AI_SUMMARIZER_WORKERS", "4"))
+SUMMARY_QUEUE_SIZE = int(os.getenv("AI_SUMMARIZER_QUEUE_SIZE", "64"))
+ANALYZE_MEMO_SIZE = int(os.getenv("AI_ANALYZE_MEMO_SIZE", "4096"))
+ANALYZE_CAPACITY_BUCKET = float(os.getenv("AI_ANALYZE_CAPACITY_BUCKET", "0.05"))
+INCREMENTAL_MAX_SERIES = int(os.getenv("AI_INCREMENTAL_MAX_SERIES", "10000"))
+INCREMENTAL_IDLE_TTL_SECONDS = float(os.getenv("AI_INCREMENTAL_IDLE_TTL_SECONDS", "3600"))
+PERSISTENT_CACHE_PATH = os.getenv("AI_CACHE_PATH", "")
+PERSISTENT_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "200000"))
+DEBUG_TOKEN = os.getenv("AI_DEBUG_TOKEN", "")
+DEBUG_PROFILE_MAX_SECONDS = float(os.getenv("AI_DEBUG_PROFILE_MAX_SECONDS", "60"))
+PROFILE_INTERVAL_MS = float(os.getenv("AI_PROFILE_INTERVAL_MS", "10"))
+PROFILE_REQUEST_EVERY = int(os.getenv("AI_PROFILE_REQUEST_EVERY", "0"))
+PROFILE_DIR = os.getenv("AI_PROFILE_DIR", "/tmp/aether-guard/profiles")
+PROFILE_KEEP = int(os.getenv("AI_PROFILE_KEEP", "10"))
+RUNTIME_SAMPLE_INTERVAL_MS = float(os.getenv("AI_RUNTIME_SAMPLE_INTERVAL_MS", "250"))
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout-Ms"
 SIGNALS_TELEMETRY_METER = "aether_guard.ai.signals"
 SIGNALS_TELEMETRY_TRACER = "aether_guard.ai.signals"
 
+term_matcher = load_term_matcher(ENRICHMENT_TERMS_FILE)
 signals_tracer = trace.get_tracer(SIGNALS_TELEMETRY_TRACER)
+# Set while warming up the model so synthetic passes stay out of the stage histogram.
+stage_recording_suppressed: ContextVar[bool] = ContextVar("stage_recording_suppressed", default=False)
 signals_request_counter = None
 signals_error_counter = None
 signals_latency_histogram = None
 signals_document_histogram = None
+signals_batch_size_histogram = None
+signals_queue_wait_histogram = None
+signals_padding_efficiency_histogram = None
+signals_stage_histogram = None
+signals_executor_wait_histogram = None
+signals_executor_rejection_counter = None
+signals_degraded_counter = None
+analyze_memo_counter = None
+near_duplicate_counter = None
+runtime_gc_pause_histogram = None
+runtime_loop_lag_histogram = None
+
+
+preloaded_state: dict[str, object] | None = None
+
+
+def preload_state() -> dict[str, object]:
+    """Build model-backed state ahead of time, e.g. in a parent process before forking workers."""
+    global preloaded_state
+    if preloaded_state is None:
+        preloaded_state = {
+            "enricher": build_enricher(),
+            "summarizer": build_summarizer(),
+        }
+    return preloaded_state
+
+
+@dataclass
+class ReadinessState:
+    target_provider: str
+    active_provider: str
+    status: str = "loading"
+    detail: str | None = None
+    started_at: float = field(default_factory=time.time)
+    ready_at: float | None = None
+
+    def mark_ready(self, active_provider: str, detail: str | None = None) -> None:
+        self.active_provider = active_provider
+        self.detail = detail
+        self.ready_at = time.time()
+        self.status = "ready"
+
+    def as_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "activeProvider": self.active_provider,
+            "targetProvider": self.target_provider,
+            "detail": self.detail,
+            "startedAt": self.started_at,
+            "readyAt": self.ready_at,
+        }
+
+
+# Held while the background loader installs its enricher and while shutdown flags the loader to stop.
+enricher_swap_lock = threading.Lock()
+
+
+def load_enricher_in_background(
+    app_instance: FastAPI,
+    shutdown: threading.Event,
+    near_duplicates: NearDuplicateIndex[list[float]] | None = None,
+) -> None:
+    readiness: ReadinessState = app_instance.state.readiness
+    started = time.perf_counter()
+    enricher = build_enricher(near_duplicates)
+    if not shutdown.is_set():
+        try:
+            enricher.warmup(ENRICHMENT_WARMUP_LENGTHS)
+        except Exception as exc:
+            logger.warning("Enricher warmup failed: %s", exc)
+
+    with enricher_swap_lock:
+        installed = not shutdown.is_set()
+        if installed:
+            # A single attribute assignment is atomic, so in-flight requests keep the heuristic enricher.
+            app_instance.state.enricher = enricher
+    if not installed:
+        # The lifespan has already closed the enricher it knew about; nobody else will close this one.
+        logger.info("Shutting down; discarding enrichment provider %s loaded too late.", enricher.provider_name)
+        enricher.close()
+        return
+    detail = None
+    if enricher.provider_name != readiness.target_provider:
+        detail = f"{readiness.target_provider} unavailable; serving {enricher.provider_name}"
+    readiness.mark_ready(enricher.provider_name, detail)
+    logger.info(
+        "Enrichment provider %s ready after %.1fs.", enricher.provider_name, time.perf_counter() - started
+    )
 
 
 @asynccontextmanager
 async def lifespan(app_instance: FastAPI):
     configure_tracing()
     app_instance.state.scorer = scorer
-    app_instance.state.enricher = build_enricher()
-    app_instance.state.summarizer = build_summarizer()
+    app_instance.state.analyze_memo = AnalyzeMemo(ANALYZE_MEMO_SIZE, ANALYZE_CAPACITY_BUCKET)
+    app_instance.state.incremental_scorer = IncrementalRiskScorer(
+        scorer,
+        max_series=INCREMENTAL_MAX_SERIES,
+        idle_ttl_seconds=INCREMENTAL_IDLE_TTL_SECONDS,
+    )
+    app_instance.state.inference_executor = build_inference_executor()
+    app_instance.state.summary_executor = build_summary_executor()
+    app_instance.state.fallback_enricher = HeuristicEnricher()
+    app_instance.state.runtime_monitor = RuntimeMonitor(
+        RUNTIME_SAMPLE_INTERVAL_MS / 1000,
+        on_gc_pause=record_gc_pause,
+        on_loop_lag=record_event_loop_lag,
+    )
+    app_instance.state.runtime_monitor.start()
+    app_instance.state.loader_shutdown = threading.Event()
+
+    if preloaded_state is None and ENRICHMENT_BACKGROUND_LOAD and ENRICHMENT_PROVIDER in MODEL_PROVIDERS:
+        # Serve /analyze and heuristic enrichment while the model loads and warms up.
+        app_instance.state.enricher = HeuristicEnricher()
+        app_instance.state.summarizer = build_summarizer()
+        app_instance.state.readiness = ReadinessState(
+            target_provider=ENRICHMENT_PROVIDER,
+            active_provider=HeuristicEnricher.provider_name,
+        )
+        threading.Thread(
+            target=load_enricher_in_background,
+            # Built here so an invalid near-duplicate setting fails startup instead of the loader thread.
+            args=(app_instance, app_instance.state.loader_shutdown, build_near_duplicate_index()),
+            name="enricher-loader",
+            daemon=True,
+        ).start()
+    else:
+        state = preload_state()
+        app_instance.state.enricher = state["enricher"]
+        app_instance.state.summarizer = state["summarizer"]
+        app_instance.state.readiness = ReadinessState(
+            target_provider=ENRICHMENT_PROVIDER,
+            active_provider=app_instance.state.enricher.provider_name,
+        )
+        app_instance.state.readiness.mark_ready(app_instance.state.enricher.provider_name)
+
     logger.info("AI Engine Online.")
     yield
+    with enricher_swap_lock:
+        app_instance.state.loader_shutdown.set()
+    await app_instance.state.runtime_monitor.stop()
+    app_instance.state.inference_executor.shutdown()
+    app_instance.state.summary_executor.shutdown()
+    app_instance.state.enricher.close()
+    app_instance.state.summarizer.close()
 
 
 app = FastAPI(lifespan=lifespan)
+debug_profile_lock = asyncio.Lock()
+if PROFILE_REQUEST_EVERY > 0:
+    app.add_middleware(
+        RequestProfilingMiddleware,
+        profiler=RequestProfiler(
+            PROFILE_REQUEST_EVERY,
+            SlowRequestRecorder(PROFILE_DIR, PROFILE_KEEP),
+            interval_seconds=PROFILE_INTERVAL_MS / 1000,
+        ),
+    )
 
 
 def initialize_signals_metrics() -> None:
@@ -65,6 +288,17 @@ def initialize_signals_metrics() -> None:
     global signals_error_counter
     global signals_latency_histogram
     global signals_document_histogram
+    global signals_batch_size_histogram
+    global signals_queue_wait_histogram
+    global signals_padding_efficiency_histogram
+    global signals_stage_histogram
+    global signals_executor_wait_histogram
+    global signals_executor_rejection_counter
+    global signals_degraded_counter
+    global analyze_memo_counter
+    global near_duplicate_counter
+    global runtime_gc_pause_histogram
+    global runtime_loop_lag_histogram
 
     meter = metrics.get_meter(SIGNALS_TELEMETRY_METER)
     signals_request_counter = meter.create_counter(
@@ -85,6 +319,116 @@ def initialize_signals_metrics() -> None:
         unit="documents",
         description="Document count per AI signal API request.",
     )
+    signals_batch_size_histogram = meter.create_histogram(
+        "aetherguard.ai.signals.batch.size",
+        unit="documents",
+        description="Documents per coalesced enrichment model batch.",
+    )
+    signals_queue_wait_histogram = meter.create_histogram(
+        "aetherguard.ai.signals.batch.queue_wait.ms",
+        unit="ms",
+        description="Time a document waited in the enrichment batch queue.",
+    )
+    signals_padding_efficiency_histogram = meter.create_histogram(
+        "aetherguard.ai.signals.batch.padding_efficiency",
+        unit="1",
+        description="Real tokens divided by padded tokens per enrichment model forward pass.",
+    )
+    signals_stage_histogram = meter.create_histogram(
+        "aetherguard.ai.signals.stage.duration.ms",
+        unit="ms",
+        description="Latency of one enrichment or summarization pipeline stage.",
+    )
+    signals_executor_wait_histogram = meter.create_histogram(
+        "aetherguard.ai.signals.executor.wait.ms",
+        unit="ms",
+        description="Time a request waited for an inference executor worker.",
+    )
+    signals_executor_rejection_counter = meter.create_counter(
+        "aetherguard.ai.signals.executor.rejections",
+        description="Requests shed with 429 because the inference queue was full.",
+    )
+    signals_degraded_counter = meter.create_counter(
+        "aetherguard.ai.signals.degraded",
+        description="Requests answered with heuristic results because the model could not meet their deadline.",
+    )
+    analyze_memo_counter = meter.create_counter(
+        "aetherguard.ai.analyze.memo.lookups",
+        description="/analyze memo lookups by result (raw_hit, semantic_hit, miss).",
+    )
+    near_duplicate_counter = meter.create_counter(
+        "aetherguard.ai.signals.enrich.near_duplicate.lookups",
+        description="Near-duplicate index lookups for uncached texts by result (reused, miss, too_short).",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.signals.executor.queue_depth",
+        callbacks=[observe_inference_queue_depth],
+        unit="requests",
+        description="Requests waiting for an inference executor worker.",
+    )
+    runtime_gc_pause_histogram = meter.create_histogram(
+        "aetherguard.ai.runtime.gc.pause.ms",
+        unit="ms",
+        description="Duration of one garbage collection, labelled by generation.",
+    )
+    runtime_loop_lag_histogram = meter.create_histogram(
+        "aetherguard.ai.runtime.event_loop.lag.ms",
+        unit="ms",
+        description="How late the event loop woke a periodic timer.",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.runtime.threadpool.busy",
+        callbacks=[partial(observe_threadpool, "busy")],
+        unit="threads",
+        description="Default anyio threadpool workers running sync endpoints and run_in_threadpool calls.",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.runtime.threadpool.queued",
+        callbacks=[partial(observe_threadpool, "waiting")],
+        unit="tasks",
+        description="Tasks waiting for a default anyio threadpool worker.",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.runtime.memory.rss",
+        callbacks=[observe_process_rss],
+        unit="By",
+        description="Resident set size of the ai-engine worker process.",
+    )
+    for field_name, description in (
+        ("hits", "Cache lookups that found a value."),
+        ("misses", "Cache lookups that found nothing."),
+        ("evictions", "Entries dropped to stay within capacity or because they expired."),
+    ):
+        meter.create_observable_counter(
+            f"aetherguard.ai.cache.{field_name}",
+            callbacks=[partial(observe_caches, field_name)],
+            unit="entries" if field_name == "evictions" else "lookups",
+            description=description,
+        )
+    meter.create_observable_gauge(
+        "aetherguard.ai.cache.entries",
+        callbacks=[partial(observe_caches, "entries")],
+        unit="entries",
+        description="Entries currently held by a cache.",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.cache.capacity",
+        callbacks=[partial(observe_caches, "capacity")],
+        unit="entries",
+        description="Configured maximum entries of a cache.",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.cache.memory.bytes",
+        callbacks=[partial(observe_caches, "approximate_bytes")],
+        unit="By",
+        description="Approximate memory held by the keys and values of an in-process cache.",
+    )
+    meter.create_observable_gauge(
+        "aetherguard.ai.runtime.torch.threads",
+        callbacks=[observe_torch_threads],
+        unit="threads",
+        description="Torch intra-op and inter-op thread settings.",
+    )
 
 
 def record_signal_request(
@@ -115,8 +459,231 @@ def record_signal_request(
         signals_error_counter.add(1, {**base_attributes, "error.type": error_type})
 
 
+def record_enrichment_batch(provider: str, batch_size: int, queue_waits_ms: list[float]) -> None:
+    attributes = {"provider": provider}
+    if signals_batch_size_histogram is not None:
+        signals_batch_size_histogram.record(batch_size, attributes)
+    if signals_queue_wait_histogram is not None:
+        for wait_ms in queue_waits_ms:
+            signals_queue_wait_histogram.record(wait_ms, attributes)
+
+
+def record_padding_efficiency(provider: str, token_lengths: list[int]) -> None:
+    if signals_padding_efficiency_histogram is not None:
+        signals_padding_efficiency_histogram.record(padding_efficiency(token_lengths), {"provider": provider})
+
+
+def record_near_duplicate_lookups(provider: str, reused: int, missed: int, too_short: int) -> None:
+    if near_duplicate_counter is None:
+        return
+    for result, count in (("reused", reused), ("miss", missed), ("too_short", too_short)):
+        if count:
+            near_duplicate_counter.add(count, {"provider": provider, "result": result})
+
+
+def record_executor_wait(wait_ms: float, executor: str = "inference") -> None:
+    if signals_executor_wait_histogram is not None:
+        signals_executor_wait_histogram.record(wait_ms, {"executor": executor})
+
+
+def record_executor_rejection(executor: str = "inference") -> None:
+    if signals_executor_rejection_counter is not None:
+        signals_executor_rejection_counter.add(1, {"executor": executor})
+
+
+def record_degraded_request(endpoint: str, reason: str) -> None:
+    if signals_degraded_counter is not None:
+        signals_degraded_counter.add(1, {"endpoint": endpoint, "reason": reason})
+
+
+def observe_inference_queue_depth(options: CallbackOptions) -> Iterable[Observation]:
+    observations = []
+    for name in ("inference_executor", "summary_executor"):
+        executor: InferenceExecutor | None = getattr(app.state, name, None)
+        if executor is not None:
+            observations.append(Observation(executor.queue_depth, {"executor": executor.name}))
+    return observations
+
+
+def record_gc_pause(generation: int, pause_ms: float) -> None:
+    if runtime_gc_pause_histogram is not None:
+        runtime_gc_pause_histogram.record(pause_ms, {"generation": str(generation)})
+
+
+def record_event_loop_lag(lag_ms: float) -> None:
+    if runtime_loop_lag_histogram is not None:
+        runtime_loop_lag_histogram.record(lag_ms)
+
+
+def observe_threadpool(field_name: str, options: CallbackOptions) -> Iterable[Observation]:
+    monitor: RuntimeMonitor | None = getattr(app.state, "runtime_monitor", None)
+    statistics = threadpool_statistics(monitor.limiter) if monitor is not None else None
+    if statistics is None:
+        return []
+    return [Observation(statistics[field_name], {"pool": "anyio"})]
+
+
+def observe_process_rss(options: CallbackOptions) -> Iterable[Observation]:
+    rss_bytes = process_rss_bytes()
+    return [] if rss_bytes is None else [Observation(rss_bytes)]
+
+
+def observe_torch_threads(options: CallbackOptions) -> Iterable[Observation]:
+    settings = torch_thread_settings()
+    if settings is None:
+        return []
+    return [Observation(count, {"kind": kind}) for kind, count in settings.items()]
+
+
+def registered_caches() -> list[tuple[dict[str, str], "LruCache | TieredCache | NearDuplicateIndex"]]:
+    """Every in-process memoization layer of the running app, with its metric labels."""
+    owners: list[tuple[str, str, dict]] = []
+    memo: AnalyzeMemo | None = getattr(app.state, "analyze_memo", None)
+    if memo is not None:
+        owners.append(("/analyze", "risk", memo.caches()))
+    enricher: SemanticEnricher | None = getattr(app.state, "enricher", None)
+    if enricher is not None:
+        owners.append(("/signals/enrich", enricher.provider_name, enricher.caches()))
+    summarizer: SignalSummarizer | None = getattr(app.state, "summarizer", None)
+    while summarizer is not None:
+        owners.append(("/signals/summarize", summarizer.provider_name, summarizer.caches()))
+        summarizer = getattr(summarizer, "fallback", None)
+    return [
+        ({"cache": name, "endpoint": endpoint, "provider": provider}, cache)
+        for endpoint, provider, caches in owners
+        for name, cache in caches.items()
+    ]
+
+
+def observe_caches(field_name: str, options: CallbackOptions) -> Iterable[Observation]:
+    observations: list[Observation] = []
+    for labels, cache in registered_caches():
+        stats: CacheStats = (cache.memory if isinstance(cache, TieredCache) else cache).stats()
+        observations.append(Observation(getattr(stats, field_name), {**labels, "tier": "memory"}))
+        if isinstance(cache, TieredCache) and cache.persistent is not None and field_name in ("hits", "misses"):
+            hits, misses = cache.persistent_lookups()
+            observations.append(
+                Observation(hits if field_name == "hits" else misses, {**labels, "tier": "persistent"})
+            )
+
+    # The sqlite store is shared by every tiered cache (and every worker), so its size is reported once.
+    store = get_persistent_cache()
+    if store is not None and field_name in ("evictions", "entries", "capacity"):
+        value = {"evictions": store.evictions, "capacity": store.max_entries}.get(field_name)
+        observations.append(
+            Observation(
+                store.count() if value is None else value,
+                {"cache": "persistent_store", "endpoint": "shared", "provider": "sqlite", "tier": "persistent"},
+            )
+        )
+    return observations
+
+
+def build_inference_executor() -> InferenceExecutor:
+    return InferenceExecutor(
+        max_workers=INFERENCE_WORKERS,
+        max_queue=INFERENCE_QUEUE_SIZE,
+        on_wait=record_executor_wait,
+        on_reject=record_executor_rejection,
+    )
+
+
+def build_summary_executor() -> InferenceExecutor:
+    # Remote summaries hold a worker for a network round trip, so they must not take the model workers.
+    return InferenceExecutor(
+        max_workers=SUMMARY_WORKERS,
+        max_queue=SUMMARY_QUEUE_SIZE,
+        name="summarizer",
+        on_wait=partial(record_executor_wait, executor="summarizer"),
+        on_reject=partial(record_executor_rejection, executor="summarizer"),
+    )
+
+
+async def run_inference(func, *args, deadline: float | None = None):
+    executor: InferenceExecutor = app.state.inference_executor
+    return await executor.run(func, *args, deadline=deadline)
+
+
+def request_deadline(request: Request) -> float | None:
+    """``time.perf_counter()`` deadline from the caller's ``X-Request-Timeout-Ms`` budget, if any."""
+    raw = request.headers.get(REQUEST_TIMEOUT_HEADER)
+    if raw is None:
+        return None
+    try:
+        budget_ms = float(raw)
+    except ValueError:
+        return None
+    if not math.isfinite(budget_ms):
+        return None
+    return time.perf_counter() + budget_ms / 1000
+
+
+async def run_inference_within_deadline(
+    endpoint: str,
+    deadline: float | None,
+    func,
+    fallback,
+    *args,
+) -> tuple[object, bool]:
+    """Run ``func`` on the inference executor, or ``fallback`` when the deadline cannot be met.
+
+    Returns ``(result, degraded)``. A deadline that has already passed raises
+    ``DeadlineExceededError``. When the estimated queue wait exceeds the
+    remaining budget, or the queue is full, ``fallback`` (cheap heuristics) is
+    run off the event loop instead, and ``degraded`` is true. Without a
+    deadline or a fallback this is plain ``run_inference``.
+    """
+    if deadline is None:
+        return await run_inference(func, *args), False
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    if fallback is None:
+        return await run_inference(func, *args, deadline=deadline), False
+
+    executor: InferenceExecutor = app.state.inference_executor
+    if executor.estimated_wait_seconds() > remaining:
+        record_degraded_request(endpoint, "queue_wait")
+        return await run_in_threadpool(fallback, *args), True
+    try:
+        return await run_inference(func, *args, deadline=deadline), False
+    except QueueFullError:
+        record_degraded_request(endpoint, "queue_full")
+        return await run_in_threadpool(fallback, *args), True
+
+
+def enrichment_fallback(enricher: "SemanticEnricher") -> "SemanticEnricher | None":
+    if enricher.provider_name == HeuristicEnricher.provider_name:
+        return None
+    return getattr(app.state, "fallback_enricher", None)
+
+
+@app.exception_handler(QueueFullError)
+async def queue_full_handler(request: Request, exc: QueueFullError) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError) -> JSONResponse:
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
 @contextmanager
-def observe_signal_endpoint(endpoint: str, provider: str, documents: int) -> Iterator[object]:
+def observe_signal_endpoint(
+    endpoint: str,
+    provider: str,
+    documents: int,
+    document_count: Callable[[], int] | None = None,
+) -> Iterator[object]:
+    """Span plus request metrics for one signals call.
+
+    Streaming endpoints do not know their document count up front; they pass
+    ``document_count``, which is read when the call finishes.
+    """
     start = time.perf_counter()
     outcome = "success"
     error_type: str | None = None
@@ -135,10 +702,60 @@ def observe_signal_endpoint(endpoint: str, provider: str, documents: int) -> Ite
             span.set_status(Status(StatusCode.ERROR))
             raise
         finally:
+            if document_count is not None:
+                documents = document_count()
+                span.set_attribute("ai.signals.documents", documents)
             duration_ms = (time.perf_counter() - start) * 1000
             record_signal_request(endpoint, provider, documents, duration_ms, outcome, error_type)
 
 
+class PipelineStage:
+    """Handle yielded by ``observe_stage``: the stage span plus low-cardinality metric labels."""
+
+    def __init__(self, span) -> None:
+        self.span = span
+        self.labels: dict[str, str] = {}
+
+    def record_cache(self, hits: int, misses: int) -> None:
+        self.span.set_attribute("ai.signals.cache.hits", hits)
+        self.span.set_attribute("ai.signals.cache.misses", misses)
+        self.labels["cache.result"] = "hit" if misses == 0 else "miss" if hits == 0 else "partial"
+
+
+@contextmanager
+def observe_stage(
+    stage: str,
+    component: str,
+    provider: str,
+    **attributes: int | float | str,
+) -> Iterator[PipelineStage]:
+    """Child span plus ``aetherguard.ai.signals.stage.duration.ms`` sample for one pipeline stage.
+
+    ``attributes`` (batch sizes, sequence lengths) go on the span only; the
+    histogram is labelled by stage, component, provider and, for cache
+    lookups, the hit/miss/partial result. Nothing is recorded while
+    ``stage_recording_suppressed`` is set.
+    """
+    if stage_recording_suppressed.get():
+        yield PipelineStage(trace.INVALID_SPAN)
+        return
+    start = time.perf_counter()
+    with signals_tracer.start_as_current_span(f"ai.signals.{component}.{stage}") as span:
+        span.set_attribute("ai.signals.stage", stage)
+        span.set_attribute("ai.signals.provider", provider)
+        for key, value in attributes.items():
+            span.set_attribute(f"ai.signals.{key}", value)
+        handle = PipelineStage(span)
+        try:
+            yield handle
+        finally:
+            if signals_stage_histogram is not None:
+                signals_stage_histogram.record(
+                    (time.perf_counter() - start) * 1000,
+                    {"stage": stage, "component": component, "provider": provider, **handle.labels},
+                )
+
+
 class RiskPayload(BaseModel):
     spot_price_history: list[float] = Field(default_factory=list, alias="spotPriceHistory")
     rebalance_signal: bool = Field(alias="rebalanceSignal")
@@ -147,6 +764,20 @@ class RiskPayload(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class AnalyzeBatchRequest(BaseModel):
+    items: list[RiskPayload]
+
+
+class IncrementalRiskPayload(BaseModel):
+    series_id: str = Field(alias="seriesId", min_length=1, max_length=256)
+    prices: list[float] = Field(default_factory=list, description="Price points observed since the last call.")
+    rebalance_signal: bool = Field(default=False, alias="rebalanceSignal")
+    capacity_score: float = Field(default=0.0, alias="capacityScore")
+    reset: bool = Field(default=False, description="Drop stored points before appending prices.")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class SignalDocument(BaseModel):
     source: str
     title: str
@@ -182,6 +813,10 @@ class EnrichResponse(BaseModel):
         le=1.0,
         description="Supply or capacity bias (long-horizon signal).",
     )
+    degraded: bool = Field(
+        default=False,
+        description="True when heuristic scores were returned because the model could not meet the request deadline.",
+    )
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -213,6 +848,10 @@ class EnrichBatchItem(BaseModel):
 class EnrichBatchResponse(BaseModel):
     schema_version: str = Field(alias="schemaVersion", description="Semantic vector schema version.")
     vectors: list[EnrichBatchItem]
+    degraded: bool = Field(
+        default=False,
+        description="True when heuristic scores were returned because the model could not meet the request deadline.",
+    )
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -244,15 +883,266 @@ def root() -> dict:
     return {"status": "AI Engine Online"}
 
 
-@app.post("/analyze")
-def analyze(payload: RiskPayload) -> dict:
+@app.get("/healthz")
+def healthz() -> dict:
+    readiness: ReadinessState = app.state.readiness
+    return {"status": "ok", **{key: value for key, value in readiness.as_dict().items() if key != "status"}}
+
+
+@app.get("/readyz")
+def readyz() -> JSONResponse:
+    readiness: ReadinessState = app.state.readiness
+    status_code = 200 if readiness.status == "ready" else 503
+    return JSONResponse(status_code=status_code, content=readiness.as_dict())
+
+
+def debug_auth_error(request: Request) -> JSONResponse | None:
+    """``None`` when the bearer token matches ``AI_DEBUG_TOKEN``; debug routes 404 while it is unset."""
+    if not DEBUG_TOKEN:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode("utf-8"), DEBUG_TOKEN.encode("utf-8")):
+        return JSONResponse(
+            status_code=401,
+            content={"detail": "A valid debug bearer token is required."},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return None
+
+
+@app.get("/debug/runtime", include_in_schema=False)
+async def debug_runtime(request: Request) -> JSONResponse:
+    """GC, event-loop, threadpool, memory and torch thread state of this worker process.
+
+    Async on purpose: it must answer while the threadpool it reports on is exhausted.
+    """
+    error = debug_auth_error(request)
+    if error is not None:
+        return error
+    monitor: RuntimeMonitor = app.state.runtime_monitor
+    return JSONResponse(
+        content={
+            **monitor.snapshot(),
+            "inference_executor": executor_snapshot(app.state.inference_executor),
+            "summary_executor": executor_snapshot(app.state.summary_executor),
+        }
+    )
+
+
+def executor_snapshot(executor: InferenceExecutor) -> dict[str, object]:
+    return {
+        "name": executor.name,
+        "workers": executor.max_workers,
+        "queue_depth": executor.queue_depth,
+        "estimated_wait_seconds": round(executor.estimated_wait_seconds(), 3),
+        "expired": executor.expired,
+    }
+
+
+@app.get("/debug/profile", include_in_schema=False)
+async def debug_profile(
+    request: Request,
+    seconds: float = Query(default=10.0),
+    output: str = Query(default="collapsed", alias="format"),
+    idle: bool = Query(default=False),
+) -> Response:
+    """Sample every thread's stack for ``seconds`` and return collapsed stacks or speedscope JSON."""
+    error = debug_auth_error(request)
+    if error is not None:
+        return error
+    if not 0 < seconds <= DEBUG_PROFILE_MAX_SECONDS:
+        return JSONResponse(
+            status_code=400,
+            content={"detail": f"seconds must be greater than 0 and at most {DEBUG_PROFILE_MAX_SECONDS:g}."},
+        )
+    if output not in ("collapsed", "speedscope"):
+        return JSONResponse(status_code=400, content={"detail": "format must be collapsed or speedscope."})
+    if debug_profile_lock.locked():
+        return JSONResponse(status_code=409, content={"detail": "A profile is already running."})
+
+    async with debug_profile_lock:
+        sampler = StackSampler(PROFILE_INTERVAL_MS / 1000, include_idle=idle).start()
+        try:
+            # The event loop stays free while sampling, so its own stacks show real request work.
+            await asyncio.sleep(seconds)
+        finally:
+            # Joining the sampler thread blocks; the shield keeps it from being left running on cancellation.
+            with anyio.CancelScope(shield=True):
+                profile = await run_in_threadpool(sampler.stop)
+    # Large profiles take a while to serialize, so render them off the event loop too.
+    return await run_in_threadpool(render_profile, profile, output, f"ai-engine pid {os.getpid()}, {seconds:g} s")
+
+
+def render_profile(profile: Profile, output: str, label: str) -> Response:
+    headers = {"X-Profile-Samples": str(profile.sample_count)}
+    if output == "speedscope":
+        return JSONResponse(content=profile.speedscope(label), headers=headers)
+    return Response(content=profile.collapsed(), media_type="text/plain; charset=utf-8", headers=headers)
+
+
+@app.post(
+    "/analyze",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": RiskPayload.model_json_schema(by_alias=True)}},
+        }
+    },
+)
+async def analyze(request: Request) -> Response:
+    scorer: RiskScorer = app.state.scorer
+    memo: AnalyzeMemo = app.state.analyze_memo
+    body = await request.body()
+
+    raw_key = memo.raw_key(body, scorer.version)
+    rendered = memo.get_raw(raw_key)
+    if rendered is None:
+        payload = parse_risk_payload(body)
+        semantic_key = memo.semantic_key(payload, scorer.version)
+        rendered = memo.get_semantic(semantic_key)
+        if rendered is None:
+            assessment = scorer.assess_risk(
+                payload.spot_price_history,
+                payload.rebalance_signal,
+                payload.capacity_score,
+            )
+            rendered = dumps_json(build_analyze_response(assessment))
+        memo.put(raw_key, semantic_key, rendered)
+    return Response(rendered, media_type="application/json")
+
+
+def parse_risk_payload(body: bytes) -> RiskPayload:
+    try:
+        return RiskPayload.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)],
+            body=body,
+        ) from exc
+
+
+class AnalyzeMemo:
+    """Bounded memo of rendered ``/analyze`` responses.
+
+    Lookups try a digest of the raw request body first, so a repeated payload
+    skips JSON parsing and validation entirely. On a raw miss the parsed
+    payload is keyed semantically by (price history, rebalance signal,
+    bucketed capacity score), so differently formatted copies of the same
+    request still hit. Keys include the scorer version, so a scorer upgrade
+    never serves stale results; ``invalidate`` drops everything at once.
+    """
+
+    def __init__(self, maxsize: int, capacity_bucket: float) -> None:
+        self._raw: LruCache[bytes, bytes] = LruCache(maxsize)
+        self._semantic: LruCache[bytes, bytes] = LruCache(maxsize)
+        self._capacity_bucket = capacity_bucket if capacity_bucket > 0 else 0.0
+        self._lock = threading.Lock()
+        self._counts = {"raw_hit": 0, "semantic_hit": 0, "miss": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._raw.maxsize > 0
+
+    def raw_key(self, body: bytes, scorer_version: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(scorer_version.encode("utf-8"))
+        hasher.update(b"\x1f")
+        hasher.update(body)
+        return hasher.digest()
+
+    def semantic_key(self, payload: RiskPayload, scorer_version: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        history = payload.spot_price_history
+        if self._capacity_bucket and math.isfinite(payload.capacity_score):
+            capacity_bucket = math.floor(payload.capacity_score / self._capacity_bucket)
+        else:
+            # inf and NaN cannot be bucketed; key them on the raw value instead.
+            capacity_bucket = payload.capacity_score
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{scorer_version}\x1f{payload.rebalance_signal}\x1f{capacity_bucket}\x1f".encode("utf-8"))
+        hasher.update(struct.pack(f"<{len(history)}d", *history))
+        return hasher.digest()
+
+    def get_raw(self, key: bytes | None) -> bytes | None:
+        if key is None:
+            return None
+        rendered = self._raw.get(key)
+        if rendered is not None:
+            self._record("raw_hit")
+        return rendered
+
+    def get_semantic(self, key: bytes | None) -> bytes | None:
+        rendered = self._semantic.get(key) if key is not None else None
+        self._record("semantic_hit" if rendered is not None else "miss")
+        return rendered
+
+    def put(self, raw_key: bytes | None, semantic_key: bytes | None, rendered: bytes) -> None:
+        if raw_key is not None:
+            self._raw.put(raw_key, rendered)
+        if semantic_key is not None:
+            self._semantic.put(semantic_key, rendered)
+
+    def caches(self) -> dict[str, LruCache]:
+        return {"raw": self._raw, "semantic": self._semantic}
+
+    def invalidate(self) -> None:
+        """Drop every memoized response, e.g. after swapping in a new scorer."""
+        self._raw.clear()
+        self._semantic.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._counts, "entries": len(self._semantic)}
+
+    def _record(self, result: str) -> None:
+        with self._lock:
+            self._counts[result] += 1
+        if analyze_memo_counter is not None:
+            analyze_memo_counter.add(1, {"result": result})
+
+
+@app.post("/analyze/batch")
+def analyze_batch(payload: AnalyzeBatchRequest) -> dict:
     scorer: RiskScorer = app.state.scorer
-    assessment = scorer.assess_risk(
-        payload.spot_price_history,
+    assessments = score_risk_batch(scorer, payload.items)
+    return {"results": [build_analyze_response(assessment) for assessment in assessments]}
+
+
+@app.post("/analyze/incremental")
+def analyze_incremental(payload: IncrementalRiskPayload) -> dict:
+    incremental_scorer: IncrementalRiskScorer = app.state.incremental_scorer
+    assessment, samples = incremental_scorer.update(
+        payload.series_id,
+        payload.prices,
         payload.rebalance_signal,
         payload.capacity_score,
+        reset=payload.reset,
+    )
+    return {**build_analyze_response(assessment), "seriesId": payload.series_id, "samples": samples}
+
+
+def score_risk_batch(scorer: RiskScorer, items: list[RiskPayload]) -> list[RiskAssessment]:
+    import numpy as np
+
+    width = max((len(item.spot_price_history) for item in items), default=0)
+    prices = np.full((len(items), width), np.nan, dtype=np.float64)
+    mask = np.zeros((len(items), width), dtype=bool)
+    for row, item in enumerate(items):
+        count = len(item.spot_price_history)
+        prices[row, :count] = item.spot_price_history
+        mask[row, :count] = True
+    return scorer.assess_risk_batch(
+        prices,
+        mask,
+        rebalance_signals=[item.rebalance_signal for item in items],
+        capacity_scores=[item.capacity_score for item in items],
     )
 
+
+def build_analyze_response(assessment: RiskAssessment) -> dict:
     priority = assessment.Priority
     prediction = 100.0 if priority == "CRITICAL" else 0.0
     confidence = 0.95 if priority == "CRITICAL" else 0.8
@@ -267,41 +1157,185 @@ def analyze(payload: RiskPayload) -> dict:
 
 
 @app.post("/signals/enrich", response_model=EnrichResponse)
-def enrich_signals(payload: EnrichRequest) -> EnrichResponse:
+async def enrich_signals(payload: EnrichRequest, request: Request) -> EnrichResponse:
     enricher: SemanticEnricher = app.state.enricher
-    with observe_signal_endpoint("/signals/enrich", ENRICHMENT_PROVIDER, len(payload.documents)) as span:
-        result = sanitize_enrich_result(enricher.enrich(payload.documents))
-        span.set_attribute("ai.signals.schema_version", ENRICHMENT_SCHEMA_VERSION)
-        return EnrichResponse(
-            schemaVersion=ENRICHMENT_SCHEMA_VERSION,
-            S_v=result.s_v,
-            P_v=result.p_v,
-            B_s=result.b_s,
+    deadline = request_deadline(request)
+    with observe_signal_endpoint("/signals/enrich", enricher.provider_name, len(payload.documents)) as span:
+        fallback = enrichment_fallback(enricher)
+        pending, degraded = await run_inference_within_deadline(
+            "/signals/enrich",
+            deadline,
+            enricher.start_enrich,
+            fallback.start_enrich if fallback is not None else None,
+            payload.documents,
         )
-
-
-@app.post("/signals/enrich/batch", response_model=EnrichBatchResponse)
-def enrich_signals_batch(payload: EnrichRequest) -> EnrichBatchResponse:
-    enricher: SemanticEnricher = app.state.enricher
-    with observe_signal_endpoint("/signals/enrich/batch", ENRICHMENT_PROVIDER, len(payload.documents)) as span:
-        vectors = [
-            EnrichBatchItem(
-                index=index,
+        raw = await pending.wait()
+        span.set_attribute("ai.signals.schema_version", ENRICHMENT_SCHEMA_VERSION)
+        span.set_attribute("ai.signals.degraded", degraded)
+        with observe_stage("response_build", "enricher", enricher.provider_name, documents=len(payload.documents)):
+            result = sanitize_enrich_result(raw)
+            return EnrichResponse(
+                schemaVersion=ENRICHMENT_SCHEMA_VERSION,
                 S_v=result.s_v,
                 P_v=result.p_v,
                 B_s=result.b_s,
+                degraded=degraded,
             )
-            for index, result in enumerate(
-                [sanitize_enrich_result(result) for result in enricher.enrich_batch(payload.documents)]
-            )
-        ]
 
+
+@app.post(
+    "/signals/enrich/batch",
+    response_model=EnrichBatchResponse,
+    responses={
+        200: {
+            "content": {
+                MSGPACK_MEDIA_TYPE: {},
+                FLOAT32_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            },
+            "description": "Vectors as JSON (default), msgpack, or a packed little-endian float32 matrix "
+            "selected with the Accept header.",
+        }
+    },
+)
+async def enrich_signals_batch(payload: EnrichRequest, request: Request) -> Response:
+    enricher: SemanticEnricher = app.state.enricher
+    media_type = negotiate_vector_format(request.headers.get("accept"))
+    deadline = request_deadline(request)
+    with observe_signal_endpoint("/signals/enrich/batch", enricher.provider_name, len(payload.documents)) as span:
+        fallback = enrichment_fallback(enricher)
+        pending, degraded = await run_inference_within_deadline(
+            "/signals/enrich/batch",
+            deadline,
+            partial(start_enrich_batch_vectors, enricher),
+            partial(start_enrich_batch_vectors, fallback) if fallback is not None else None,
+            payload.documents,
+        )
+        vectors = await pending.wait()
         span.set_attribute("ai.signals.schema_version", ENRICHMENT_SCHEMA_VERSION)
         span.set_attribute("ai.signals.vectors", len(vectors))
-        return EnrichBatchResponse(
-            schemaVersion=ENRICHMENT_SCHEMA_VERSION,
-            vectors=vectors,
-        )
+        span.set_attribute("ai.signals.response_format", media_type)
+        span.set_attribute("ai.signals.degraded", degraded)
+        with observe_stage("response_build", "enricher", enricher.provider_name, documents=len(vectors)):
+            return vector_batch_response(ENRICHMENT_SCHEMA_VERSION, vectors, media_type, degraded=degraded)
+
+
+def start_enrich_batch_vectors(
+    enricher: "SemanticEnricher", documents: list[SignalDocument]
+) -> "PendingEnrichment[list[tuple[list[float], float, float]]]":
+    return enricher.start_enrich_batch(documents).then(partial(sanitize_enrich_results, enricher.provider_name))
+
+
+def sanitize_enrich_results(provider: str, results: list["EnrichResult"]) -> list[tuple[list[float], float, float]]:
+    vectors: list[tuple[list[float], float, float]] = []
+    with observe_stage("sanitize", "enricher", provider, documents=len(results)):
+        for result in results:
+            clean = sanitize_enrich_result(result)
+            vectors.append((clean.s_v, clean.p_v, clean.b_s))
+    return vectors
+
+
+class NdjsonStreamingResponse(StreamingResponse):
+    """Streaming response that reads the request body while it is still sending.
+
+    ``StreamingResponse`` listens for disconnects with a concurrent
+    ``receive()`` on ASGI < 2.4 servers (uvicorn reports 2.3), which would
+    steal body chunks from ``request.stream()``. Here a disconnect surfaces
+    through the body stream instead.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+        if self.background is not None:
+            await self.background()
+
+
+@app.post(
+    "/signals/enrich/stream",
+    response_class=NdjsonStreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": SignalDocument.model_json_schema()}},
+        }
+    },
+)
+async def enrich_signals_stream(request: Request) -> NdjsonStreamingResponse:
+    """Enrich an NDJSON body of ``SignalDocument`` lines, answering with one NDJSON line per document.
+
+    Lines are written in input order as each chunk is scored, so memory stays
+    bounded by the chunk size no matter how long the upload is. Lines that are
+    not valid documents produce ``{"index": n, "error": ...}`` and do not stop
+    the stream.
+    """
+    enricher: SemanticEnricher = app.state.enricher
+    return NdjsonStreamingResponse(
+        stream_enrich_results(enricher, request.stream()),
+        headers={"X-Schema-Version": ENRICHMENT_SCHEMA_VERSION},
+    )
+
+
+async def stream_enrich_results(
+    enricher: "SemanticEnricher", body: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    reader = NdjsonReader(ENRICHMENT_STREAM_MAX_LINE_BYTES)
+    chunk_size = max(1, ENRICHMENT_STREAM_CHUNK_SIZE)
+    pending: list[NdjsonRecord] = []
+
+    with observe_signal_endpoint(
+        "/signals/enrich/stream",
+        enricher.provider_name,
+        0,
+        document_count=lambda: reader.records_read,
+    ) as span:
+        span.set_attribute("ai.signals.schema_version", ENRICHMENT_SCHEMA_VERSION)
+        async for piece in body:
+            pending.extend(reader.feed(piece))
+            while len(pending) >= chunk_size:
+                yield await score_stream_chunk(enricher, pending[:chunk_size])
+                del pending[:chunk_size]
+            # Flush what this read completed so a slow producer still gets results promptly.
+            if pending:
+                yield await score_stream_chunk(enricher, pending)
+                pending.clear()
+        pending.extend(reader.finish())
+        if pending:
+            yield await score_stream_chunk(enricher, pending)
+
+
+async def score_stream_chunk(enricher: "SemanticEnricher", records: list[NdjsonRecord]) -> bytes:
+    lines: list[dict] = []
+    documents: list[SignalDocument] = []
+    for record in records:
+        if record.error is not None:
+            lines.append({"index": record.index, "error": record.error})
+            continue
+        try:
+            documents.append(SignalDocument.model_validate(record.value))
+            lines.append({"index": record.index})
+        except ValueError as exc:
+            lines.append({"index": record.index, "error": f"Invalid document: {exc}"})
+
+    if documents:
+        while True:
+            try:
+                pending = await run_inference(enricher.start_enrich_batch, documents)
+                break
+            except QueueFullError as exc:
+                # The response has already started, so wait for capacity instead of answering 429.
+                await asyncio.sleep(exc.retry_after_seconds)
+        results = await pending.wait()
+        scored = iter(results)
+        for line in lines:
+            if "error" not in line:
+                result = sanitize_enrich_result(next(scored))
+                line.update({"S_v": result.s_v, "P_v": result.p_v, "B_s": result.b_s})
+
+    return b"".join(dumps_json(line) + b"\n" for line in lines)
 
 
 @app.get("/signals/enrich/schema")
@@ -309,6 +1343,7 @@ def enrich_schema() -> dict:
     return {
         "schemaVersion": ENRICHMENT_SCHEMA_VERSION,
         "batchEndpoint": "/signals/enrich/batch",
+        "streamEndpoint": "/signals/enrich/stream",
         "fields": {
             "S_v": "Sentiment vector [negative, neutral, positive], normalized to sum to 1.",
             "P_v": "Volatility probability in [0, 1].",
@@ -324,13 +1359,72 @@ class EnrichResult:
     b_s: float
 
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class PendingEnrichment(Generic[T]):
+    """Enrichment whose uncached texts may still be queued on a micro-batch scheduler.
+
+    ``finish`` turns the scores of the queued texts, in ``futures`` order,
+    into the result. Worker threads block on ``result()``; request handlers
+    ``await wait()`` so an inference worker is not held while the texts wait
+    for a batch to fill.
+    """
+
+    def __init__(
+        self,
+        futures: list["Future[list[float]]"],
+        finish: Callable[[list[list[float]]], T],
+    ) -> None:
+        self.futures = futures
+        self._finish = finish
+
+    @classmethod
+    def completed(cls, result: T) -> "PendingEnrichment[T]":
+        return cls([], lambda _: result)
+
+    def then(self, func: Callable[[T], R]) -> "PendingEnrichment[R]":
+        if not self.futures:
+            return PendingEnrichment.completed(func(self._finish([])))
+        return PendingEnrichment(self.futures, lambda scores: func(self._finish(scores)))
+
+    def result(self) -> T:
+        return self._finish([future.result() for future in self.futures])
+
+    async def wait(self) -> T:
+        if not self.futures:
+            return self._finish([])
+        scores = await asyncio.gather(*(asyncio.wrap_future(future) for future in self.futures))
+        return await run_in_threadpool(self._finish, list(scores))
+
+
 class SemanticEnricher:
+    provider_name = "unknown"
+
     def enrich(self, documents: Iterable[SignalDocument]) -> EnrichResult:  # pragma: no cover - interface
         raise NotImplementedError
 
     def enrich_batch(self, documents: Iterable[SignalDocument]) -> list[EnrichResult]:
         return [self.enrich([document]) for document in documents]
 
+    def start_enrich(self, documents: Iterable[SignalDocument]) -> PendingEnrichment[EnrichResult]:
+        """``enrich`` that may leave model work queued; see ``PendingEnrichment``."""
+        return PendingEnrichment.completed(self.enrich(documents))
+
+    def start_enrich_batch(self, documents: Iterable[SignalDocument]) -> PendingEnrichment[list[EnrichResult]]:
+        return PendingEnrichment.completed(self.enrich_batch(documents))
+
+    def warmup(self, sequence_lengths: Iterable[int]) -> None:
+        return None
+
+    def caches(self) -> dict[str, "LruCache | TieredCache | NearDuplicateIndex"]:
+        """Memoization layers by name, for cache metrics."""
+        return {}
+
+    def close(self) -> None:
+        return None
+
 
 @dataclass
 class SummarizeResult:
@@ -339,13 +1433,29 @@ class SummarizeResult:
 
 
 class SignalSummarizer:
+    provider_name = "unknown"
+
     def summarize(self, text: str, max_chars: int) -> SummarizeResult:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def summarize_many(self, texts: Sequence[str], max_chars: int) -> list[SummarizeResult]:
+        return [self.summarize(text, max_chars) for text in texts]
+
+    def caches(self) -> dict[str, "LruCache | TieredCache"]:
+        """Memoization layers by name, for cache metrics."""
+        return {}
+
+    def close(self) -> None:
+        return None
+
 
 class HeuristicEnricher(SemanticEnricher):
-    negative_terms = ("outage", "disruption", "degraded", "incident", "latency", "unavailable")
-    supply_terms = ("capacity", "shortage", "procurement", "inventory", "supply", "quota")
+    provider_name = "heuristic"
+
+    def __init__(self, matcher: TermMatcher | None = None) -> None:
+        self._matcher = matcher or term_matcher
+        self._negative_index = self._matcher.category_index("negative")
+        self._supply_index = self._matcher.category_index("supply")
 
     def enrich(self, documents: Iterable[SignalDocument]) -> EnrichResult:
         document_list = list(documents)
@@ -353,15 +1463,41 @@ class HeuristicEnricher(SemanticEnricher):
             return EnrichResult(s_v=[0.15, 0.7, 0.15], p_v=0.1, b_s=0.0)
 
         # Keep the legacy aggregate behavior for backward compatibility.
-        combined = " ".join([self._doc_text(doc) for doc in document_list]).lower()
+        combined = " ".join([self._doc_text(doc) for doc in document_list])
         return self._score_text(combined)
 
     def enrich_batch(self, documents: Iterable[SignalDocument]) -> list[EnrichResult]:
-        return [self._score_text(self._doc_text(document).lower()) for document in documents]
+        s_v, p_v, b_s = self.score_arrays([self._doc_text(document) for document in documents])
+        return [
+            EnrichResult(s_v=vector, p_v=volatility, b_s=bias)
+            for vector, volatility, bias in zip(s_v.tolist(), p_v.tolist(), b_s.tolist())
+        ]
+
+    def score_arrays(self, texts: Sequence[str]):
+        """Vectorized ``_score_text`` over many documents.
+
+        Returns ``(S_v, P_v, B_s)`` NumPy arrays shaped ``(N, 3)``, ``(N,)`` and
+        ``(N,)`` with values identical to scoring each text individually.
+        """
+        import numpy as np
+
+        counts = self._matcher.count_many(texts)
+        negative_hits = counts[:, self._negative_index].astype(np.float64)
+        supply_hits = counts[:, self._supply_index].astype(np.float64)
+
+        neg_score = 0.15 + 0.2 * negative_hits
+        neutral_score = 0.6 - 0.1 * negative_hits
+        pos_score = 1.0 - (neg_score + neutral_score)
+
+        s_v = normalize_vector_rows(np.stack([neg_score, neutral_score, np.maximum(0.0, pos_score)], axis=1))
+        p_v = np.clip(0.15 + 0.25 * negative_hits, 0.0, 1.0)
+        b_s = np.clip(0.05 * supply_hits, 0.0, 1.0)
+        return s_v, p_v, b_s
 
     def _score_text(self, combined: str) -> EnrichResult:
-        negative_hits = sum(term in combined for term in self.negative_terms)
-        supply_hits = sum(term in combined for term in self.supply_terms)
+        counts = self._matcher.count(combined)
+        negative_hits = counts[self._negative_index]
+        supply_hits = counts[self._supply_index]
 
         neg_score = 0.15 + 0.2 * negative_hits
         neutral_score = 0.6 - 0.1 * negative_hits
@@ -379,7 +1515,144 @@ class HeuristicEnricher(SemanticEnricher):
 
 
 class FinbertEnricher(SemanticEnricher):
-    def __init__(self, model_id: str, max_chars: int, cache_size: int) -> None:
+    provider_name = "finbert"
+    label_order = ("negative", "neutral", "positive")
+    tensor_type = "pt"
+
+    def __init__(
+        self,
+        model_id: str,
+        max_chars: int,
+        cache_size: int,
+        batch_size: int = 32,
+        batch_max_size: int = 1,
+        batch_max_wait_ms: float = 0.0,
+        persistent_cache: SqliteCache | None = None,
+        near_duplicates: NearDuplicateIndex[list[float]] | None = None,
+    ) -> None:
+        self._load_model(model_id)
+        self._matcher = term_matcher
+        self._supply_index = term_matcher.category_index("supply")
+        self._model_id = model_id
+        self._max_chars = max_chars
+        self._batch_size = max(1, batch_size)
+        self._cache: TieredCache[str, list[float]] = TieredCache(
+            LruCache(cache_size),
+            persistent_cache,
+            digest=lambda text: content_digest(
+                "enrich", self.cache_namespace, ENRICHMENT_SCHEMA_VERSION, normalize_text(text)
+            ),
+            encode=list,
+            decode=lambda value: [float(score) for score in value],
+        )
+        self._near_duplicates = near_duplicates
+        self._scheduler: MicroBatchScheduler[str, list[float]] | None = None
+        if batch_max_size > 1:
+            # Coalesce uncached texts from concurrent requests into one padded forward pass.
+            self._scheduler = MicroBatchScheduler(
+                self._score_texts,
+                max_batch_size=batch_max_size,
+                max_wait_seconds=batch_max_wait_ms / 1000,
+                on_batch=lambda size, waits: record_enrichment_batch(self.provider_name, size, waits),
+                name="finbert-batch",
+            )
+
+    def enrich(self, documents: Iterable[SignalDocument]) -> EnrichResult:
+        return self.start_enrich(documents).result()
+
+    def start_enrich(self, documents: Iterable[SignalDocument]) -> PendingEnrichment[EnrichResult]:
+        document_list = list(documents)
+        return self._start_scoring(document_list).then(partial(self._aggregate, document_list))
+
+    def enrich_batch(self, documents: Iterable[SignalDocument]) -> list[EnrichResult]:
+        return self.start_enrich_batch(documents).result()
+
+    def start_enrich_batch(self, documents: Iterable[SignalDocument]) -> PendingEnrichment[list[EnrichResult]]:
+        document_list = list(documents)
+        supply_hits = self._matcher.count_many([self._doc_text(doc) for doc in document_list])[
+            :, self._supply_index
+        ].tolist()
+        return self._start_scoring(document_list).then(partial(self._per_document, supply_hits))
+
+    def _aggregate(self, document_list: list[SignalDocument], scores: list[list[float]]) -> EnrichResult:
+        if not scores:
+            return EnrichResult(s_v=[0.15, 0.7, 0.15], p_v=0.1, b_s=0.0)
+
+        with observe_stage("postprocess", "enricher", self.provider_name, documents=len(scores)):
+            neg = sum(score[0] for score in scores) / len(scores)
+            neutral = sum(score[1] for score in scores) / len(scores)
+            pos = sum(score[2] for score in scores) / len(scores)
+            s_v = normalize_vector([neg, neutral, pos])
+
+            volatility_boost = max(0.0, neg - pos)
+            p_v = clamp(0.1 + volatility_boost * 1.2, 0.0, 1.0)
+            b_s = clamp(self._supply_bias(document_list), 0.0, 1.0)
+            return EnrichResult(s_v=s_v, p_v=p_v, b_s=b_s)
+
+    def _per_document(self, supply_hits: list[int], document_scores: list[list[float]]) -> list[EnrichResult]:
+        results: list[EnrichResult] = []
+        with observe_stage("postprocess", "enricher", self.provider_name, documents=len(document_scores)):
+            for scores, hits in zip(document_scores, supply_hits):
+                neg = scores[0]
+                pos = scores[2]
+                p_v = clamp(0.1 + max(0.0, neg - pos) * 1.2, 0.0, 1.0)
+                b_s = clamp(0.05 * hits, 0.0, 1.0)
+                results.append(EnrichResult(s_v=list(scores), p_v=p_v, b_s=b_s))
+        return results
+
+    @property
+    def cache_namespace(self) -> str:
+        return f"{self.provider_name}:{self._model_id}:{self._max_chars}"
+
+    def _start_scoring(self, documents: list[SignalDocument]) -> PendingEnrichment[list[list[float]]]:
+        texts = [self._doc_text(doc) for doc in documents]
+        with observe_stage("cache_lookup", "enricher", self.provider_name, documents=len(texts)) as stage:
+            scores_by_text = self._cache.get_many(texts)
+            misses = list(dict.fromkeys(text for text in texts if text not in scores_by_text))
+            hits = sum(1 for text in texts if text in scores_by_text)
+            stage.record_cache(hits, len(texts) - hits)
+        fingerprints: dict[str, int | None] = {}
+        if misses and self._near_duplicates is not None:
+            fingerprints = {text: self._near_duplicates.fingerprint(text[: self._max_chars]) for text in misses}
+            reused = self._reuse_near_duplicates(fingerprints)
+            if reused:
+                # Reused vectors are approximations; keep them out of the shared persistent cache.
+                self._cache.put_many(reused.items(), persist=False)
+                scores_by_text.update(reused)
+                misses = [text for text in misses if text not in reused]
+
+        def complete(miss_scores: list[list[float]]) -> list[list[float]]:
+            if misses:
+                scored = list(zip(misses, miss_scores))
+                self._cache.put_many(scored)
+                scores_by_text.update(scored)
+                if self._near_duplicates is not None:
+                    for text, scores in scored:
+                        fingerprint = fingerprints.get(text)
+                        if fingerprint is not None:
+                            self._near_duplicates.add(fingerprint, scores)
+            return [scores_by_text[text] for text in texts]
+
+        # Requests that already fill a batch skip the coalescing queue.
+        if misses and self._scheduler is not None and len(misses) < self._scheduler.max_batch_size:
+            return PendingEnrichment(self._scheduler.submit_many(misses), complete)
+        return PendingEnrichment.completed(complete(self._score_texts(misses) if misses else []))
+
+    def _reuse_near_duplicates(self, fingerprints: dict[str, int | None]) -> dict[str, list[float]]:
+        reused: dict[str, list[float]] = {}
+        too_short = 0
+        for text, fingerprint in fingerprints.items():
+            if fingerprint is None:
+                too_short += 1
+                continue
+            match = self._near_duplicates.lookup(fingerprint)
+            if match is not None:
+                reused[text] = match[0]
+        missed = len(fingerprints) - len(reused) - too_short
+        record_near_duplicate_lookups(self.provider_name, len(reused), missed, too_short)
+        return reused
+
+    def _load_model(self, model_id: str) -> None:
         from transformers import pipeline
         import torch
 
@@ -388,76 +1661,199 @@ class FinbertEnricher(SemanticEnricher):
             "sentiment-analysis",
             model=model_id,
             tokenizer=model_id,
-            return_all_scores=True,
+            top_k=None,
             device=device,
         )
-        self._max_chars = max_chars
-        self._cache = lru_cache(maxsize=cache_size)(self._score_text)
-
-    def enrich(self, documents: Iterable[SignalDocument]) -> EnrichResult:
-        document_list = list(documents)
-        scores = [self._cache(self._doc_text(doc)) for doc in document_list]
-        if not scores:
-            return EnrichResult(s_v=[0.15, 0.7, 0.15], p_v=0.1, b_s=0.0)
+        self._tokenizer = self._pipeline.tokenizer
+        label_to_id = {label.lower(): index for index, label in self._pipeline.model.config.id2label.items()}
+        self._label_columns = [label_to_id[label] for label in self.label_order]
+
+    def _score_texts(self, texts: list[str]) -> list[list[float]]:
+        truncated = [text[: self._max_chars] for text in texts]
+        raw_scores = self._infer(truncated)
+        with observe_stage("normalize", "enricher", self.provider_name, batch_size=len(texts)):
+            return [normalize_vector(scores) for scores in raw_scores]
+
+    def _infer(self, texts: list[str]) -> list[list[float]]:
+        # Tokenize once without padding, then pad each length bucket only to its own longest text.
+        with observe_stage("tokenize", "enricher", self.provider_name, batch_size=len(texts)):
+            encoded = self._tokenizer(texts, truncation=True)
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            buckets = length_buckets(lengths, self._batch_size)
+            batches = [
+                self._tokenizer.pad(
+                    {name: [encoded[name][index] for index in bucket] for name in encoded.keys()},
+                    return_tensors=self.tensor_type,
+                )
+                for bucket in buckets
+            ]
+        scores: list[list[float]] = [[] for _ in texts]
+        for bucket, features in zip(buckets, batches):
+            bucket_lengths = [lengths[index] for index in bucket]
+            with observe_stage(
+                "forward",
+                "enricher",
+                self.provider_name,
+                batch_size=len(bucket),
+                sequence_length=max(bucket_lengths),
+            ):
+                rows = self._forward(features)
+            for index, row in zip(bucket, rows):
+                scores[index] = row
+            record_padding_efficiency(self.provider_name, bucket_lengths)
+        return scores
 
-        neg = sum(score[0] for score in scores) / len(scores)
-        neutral = sum(score[1] for score in scores) / len(scores)
-        pos = sum(score[2] for score in scores) / len(scores)
-        s_v = normalize_vector([neg, neutral, pos])
+    def _forward(self, features) -> list[list[float]]:
+        """Class probabilities in ``label_order`` for one padded batch."""
+        import torch
 
-        volatility_boost = max(0.0, neg - pos)
-        p_v = clamp(0.1 + volatility_boost * 1.2, 0.0, 1.0)
-        b_s = clamp(self._supply_bias(document_list), 0.0, 1.0)
-        return EnrichResult(s_v=s_v, p_v=p_v, b_s=b_s)
+        model = self._pipeline.model
+        with torch.inference_mode():
+            logits = model(**{name: tensor.to(model.device) for name, tensor in features.items()}).logits
+        probabilities = torch.softmax(logits.float(), dim=-1)
+        return probabilities[:, self._label_columns].cpu().tolist()
 
-    def enrich_batch(self, documents: Iterable[SignalDocument]) -> list[EnrichResult]:
-        results: list[EnrichResult] = []
-        for document in documents:
-            scores = self._cache(self._doc_text(document))
-            neg = scores[0]
-            pos = scores[2]
-            p_v = clamp(0.1 + max(0.0, neg - pos) * 1.2, 0.0, 1.0)
-            b_s = clamp(self._supply_bias([document]), 0.0, 1.0)
-            results.append(EnrichResult(s_v=scores, p_v=p_v, b_s=b_s))
-        return results
+    def warmup(self, sequence_lengths: Iterable[int]) -> None:
+        """Run uncached forward passes at a few sequence lengths and batch sizes."""
+        token = stage_recording_suppressed.set(True)
+        try:
+            for length in sequence_lengths:
+                text = " ".join(["capacity"] * max(1, length))
+                for batch in sorted({1, min(self._batch_size, 8)}):
+                    self._score_texts([text] * batch)
+        finally:
+            stage_recording_suppressed.reset(token)
 
-    def _score_text(self, text: str) -> list[float]:
-        scores_raw = self._pipeline(text[: self._max_chars])
-        scores = self._parse_scores(scores_raw)
-        return normalize_vector(scores)
+    def caches(self) -> dict[str, "TieredCache | NearDuplicateIndex"]:
+        caches: dict[str, TieredCache | NearDuplicateIndex] = {"vectors": self._cache}
+        if self._near_duplicates is not None:
+            caches["near_duplicates"] = self._near_duplicates
+        return caches
 
-    @staticmethod
-    def _parse_scores(raw) -> list[float]:
-        if isinstance(raw, list) and raw and isinstance(raw[0], list):
-            entries = raw[0]
-        else:
-            entries = raw
-
-        label_map = {"negative": 0, "neutral": 1, "positive": 2}
-        scores = [0.0, 0.0, 0.0]
-        for entry in entries:
-            label = entry.get("label", "").lower()
-            score = float(entry.get("score", 0.0))
-            if label in label_map:
-                scores[label_map[label]] = score
-        if sum(scores) == 0:
-            return [0.15, 0.7, 0.15]
-        return scores
+    def close(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.close()
 
     @staticmethod
     def _doc_text(doc: SignalDocument) -> str:
         summary = doc.summary or ""
         return f"{doc.title} {summary}".strip()
 
-    @staticmethod
-    def _supply_bias(documents: Iterable[SignalDocument]) -> float:
-        supply_terms = ("capacity", "shortage", "procurement", "inventory", "supply", "quota")
-        combined = " ".join([doc.title + " " + (doc.summary or "") for doc in documents]).lower()
-        hits = sum(term in combined for term in supply_terms)
-        return 0.05 * hits
+    def _supply_bias(self, documents: Iterable[SignalDocument]) -> float:
+        combined = " ".join([self._doc_text(doc) for doc in documents])
+        return 0.05 * self._matcher.count(combined)[self._supply_index]
+
+
+class OnnxFinbertEnricher(FinbertEnricher):
+    """FinBERT served from a cached ONNX export through an onnxruntime CPU session."""
+
+    provider_name = "finbert-onnx"
+    tensor_type = "np"
+
+    def __init__(
+        self,
+        model_id: str,
+        max_chars: int,
+        cache_size: int,
+        cache_dir: str,
+        quantize: bool,
+        intra_op_threads: int = 0,
+        **kwargs,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._quantize = quantize
+        self._intra_op_threads = intra_op_threads
+        super().__init__(model_id=model_id, max_chars=max_chars, cache_size=cache_size, **kwargs)
+
+    @property
+    def cache_namespace(self) -> str:
+        return f"{super().cache_namespace}:{'int8' if self._quantize else 'fp32'}"
+
+    def _load_model(self, model_id: str) -> None:
+        import numpy as np
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        from onnx_export import ensure_onnx_artifact
+
+        artifact = ensure_onnx_artifact(model_id, self._cache_dir, self._quantize)
+        self._np = np
+        self._ort = ort
+        self._model_path = artifact.model_path
+        self._session_pid: int | None = None
+        self._session_lock = threading.Lock()
+        self._session_for_process()
+        self._tokenizer = AutoTokenizer.from_pretrained(str(artifact.tokenizer_dir))
+        label_to_id = {label.lower(): index for index, label in artifact.id2label.items()}
+        self._label_columns = [label_to_id[label] for label in self.label_order]
+        logger.info("Loaded ONNX enrichment graph %s.", artifact.model_path)
+
+    def _session_for_process(self):
+        # onnxruntime thread pools do not survive fork(), so each process builds its own session.
+        if self._session_pid == os.getpid():
+            return self._session
+        with self._session_lock:
+            if self._session_pid != os.getpid():
+                ort = self._ort
+                options = ort.SessionOptions()
+                options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                if self._intra_op_threads > 0:
+                    options.intra_op_num_threads = self._intra_op_threads
+                self._session = ort.InferenceSession(
+                    str(self._model_path),
+                    sess_options=options,
+                    providers=["CPUExecutionProvider"],
+                )
+                self._input_names = [item.name for item in self._session.get_inputs()]
+                self._session_pid = os.getpid()
+        return self._session
+
+    def _forward(self, features) -> list[list[float]]:
+        np = self._np
+        session = self._session_for_process()
+        feeds = {name: features[name].astype(np.int64) for name in self._input_names if name in features}
+        logits = session.run(None, feeds)[0]
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities[:, self._label_columns].astype(float).tolist()
+
+
+@lru_cache(maxsize=1)
+def get_persistent_cache() -> SqliteCache | None:
+    if not PERSISTENT_CACHE_PATH:
+        return None
+    try:
+        cache = SqliteCache(PERSISTENT_CACHE_PATH, PERSISTENT_CACHE_MAX_ENTRIES)
+    except Exception as exc:
+        logger.warning("Failed to open persistent cache %s, using memory only: %s", PERSISTENT_CACHE_PATH, exc)
+        return None
+    logger.info("Persistent enrichment/summary cache at %s.", cache.path)
+    return cache
 
 
-def build_enricher() -> SemanticEnricher:
+def build_enricher(near_duplicates: NearDuplicateIndex[list[float]] | None = None) -> SemanticEnricher:
+    # Built outside the model-loading try blocks: a bad near-duplicate setting must fail startup, not fall back.
+    if near_duplicates is None:
+        near_duplicates = build_near_duplicate_index()
+    if ENRICHMENT_PROVIDER == "finbert-onnx":
+        try:
+            logger.info("Loading ONNX FinBERT model %s for enrichment.", DEFAULT_FINBERT_MODEL)
+            return OnnxFinbertEnricher(
+                model_id=DEFAULT_FINBERT_MODEL,
+                max_chars=ENRICHMENT_MAX_CHARS,
+                cache_size=ENRICHMENT_CACHE_SIZE,
+                cache_dir=ONNX_CACHE_DIR,
+                quantize=ONNX_QUANTIZE,
+                intra_op_threads=ONNX_INTRA_OP_THREADS,
+                batch_size=ENRICHMENT_BATCH_SIZE,
+                batch_max_size=ENRICHMENT_BATCH_MAX_SIZE,
+                batch_max_wait_ms=ENRICHMENT_BATCH_MAX_WAIT_MS,
+                persistent_cache=get_persistent_cache(),
+                near_duplicates=near_duplicates,
+            )
+        except Exception as exc:
+            logger.warning("Failed to load ONNX FinBERT model, falling back to heuristics: %s", exc)
     if ENRICHMENT_PROVIDER == "finbert":
         try:
             logger.info("Loading FinBERT model %s for enrichment.", DEFAULT_FINBERT_MODEL)
@@ -465,88 +1861,379 @@ def build_enricher() -> SemanticEnricher:
                 model_id=DEFAULT_FINBERT_MODEL,
                 max_chars=ENRICHMENT_MAX_CHARS,
                 cache_size=ENRICHMENT_CACHE_SIZE,
+                batch_size=ENRICHMENT_BATCH_SIZE,
+                batch_max_size=ENRICHMENT_BATCH_MAX_SIZE,
+                batch_max_wait_ms=ENRICHMENT_BATCH_MAX_WAIT_MS,
+                persistent_cache=get_persistent_cache(),
+                near_duplicates=near_duplicates,
             )
         except Exception as exc:
             logger.warning("Failed to load FinBERT model, falling back to heuristics: %s", exc)
     return HeuristicEnricher()
 
 
+def build_near_duplicate_index() -> NearDuplicateIndex[list[float]] | None:
+    if not ENRICHMENT_NEAR_DUP:
+        return None
+    return NearDuplicateIndex(
+        max_distance=ENRICHMENT_NEAR_DUP_MAX_DISTANCE,
+        max_entries=ENRICHMENT_NEAR_DUP_ENTRIES,
+        ttl_seconds=ENRICHMENT_NEAR_DUP_TTL_SECONDS,
+        min_features=ENRICHMENT_NEAR_DUP_MIN_FEATURES,
+    )
+
+
 class HeuristicSummarizer(SignalSummarizer):
-    def __init__(self, max_chars: int, cache_size: int) -> None:
+    """Extractive summarizer that keeps whole leading sentences within the character limit.
+
+    Segmentation is cached once per normalized text as the cumulative length
+    of each sentence prefix, so any ``max_chars`` is answered with a binary
+    search instead of re-splitting, and one cache entry serves every limit.
+    """
+
+    provider_name = "heuristic"
+    _sentence_boundary = re.compile(r"(?<=[.!?])\s+")
+
+    def __init__(self, max_chars: int, cache_size: int, persistent_cache: SqliteCache | None = None) -> None:
         self._max_chars = max_chars
-        self._cache = lru_cache(maxsize=cache_size)(self._summarize_text)
+        self._segments: TieredCache[str, list[int]] = TieredCache(
+            LruCache(cache_size),
+            persistent_cache,
+            digest=lambda key: content_digest("summary-segments", "heuristic", SUMMARY_SCHEMA_VERSION, key),
+            encode=list,
+            decode=lambda value: [int(item) for item in value],
+        )
+
+    def caches(self) -> dict[str, TieredCache]:
+        return {"segments": self._segments}
 
     def summarize(self, text: str, max_chars: int | None = None) -> SummarizeResult:
+        return self.summarize_many([text], max_chars)[0]
+
+    def summarize_many(self, texts: Sequence[str], max_chars: int | None = None) -> list[SummarizeResult]:
         limit = max_chars or self._max_chars
-        clean = normalize_text(text)
-        if not clean:
-            return SummarizeResult(summary="", truncated=False)
-        if limit <= 0:
-            return SummarizeResult(summary="", truncated=len(clean) > 0)
-        return self._cache(clean, limit)
-
-    def _summarize_text(self, text: str, limit: int) -> SummarizeResult:
-        if len(text) <= limit:
-            return SummarizeResult(summary=text, truncated=False)
-
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        summary_parts: list[str] = []
-        total_len = 0
-        for sentence in sentences:
-            if not sentence:
-                continue
-            next_len = total_len + len(sentence) + (1 if summary_parts else 0)
-            if next_len > limit:
-                break
-            summary_parts.append(sentence)
-            total_len = next_len
+        cleaned = [normalize_text(text) for text in texts]
+        long_texts = [clean for clean in cleaned if limit > 0 and len(clean) > limit]
+        prefixes: dict[str, list[int]] = {}
+        if long_texts:
+            with observe_stage("cache_lookup", "summarizer", self.provider_name, documents=len(long_texts)) as stage:
+                prefixes = self._segments.get_many(long_texts)
+                hits = sum(1 for clean in long_texts if clean in prefixes)
+                stage.record_cache(hits, len(long_texts) - hits)
+        missing = [clean for clean in dict.fromkeys(long_texts) if clean not in prefixes]
+        if missing:
+            with observe_stage("segment", "summarizer", self.provider_name, documents=len(missing)):
+                computed = {clean: self._sentence_prefixes(clean) for clean in missing}
+                self._segments.put_many(computed.items())
+                prefixes.update(computed)
+
+        results: list[SummarizeResult] = []
+        for clean in cleaned:
+            if not clean:
+                results.append(SummarizeResult(summary="", truncated=False))
+            elif limit <= 0:
+                results.append(SummarizeResult(summary="", truncated=True))
+            elif len(clean) <= limit:
+                results.append(SummarizeResult(summary=clean, truncated=False))
+            else:
+                results.append(self._summary_for_limit(clean, prefixes[clean], limit))
+        return results
 
-        if not summary_parts:
+    @staticmethod
+    def _summary_for_limit(text: str, prefixes: list[int], limit: int) -> SummarizeResult:
+        sentences = bisect_right(prefixes, limit)
+        if sentences == 0:
             return SummarizeResult(summary=text[:limit].rstrip(), truncated=True)
+        return SummarizeResult(summary=text[: prefixes[sentences - 1]].rstrip(), truncated=True)
 
-        summary = " ".join(summary_parts).rstrip()
-        return SummarizeResult(summary=summary, truncated=True)
+    @classmethod
+    def _sentence_prefixes(cls, text: str) -> list[int]:
+        """End offset of each leading run of sentences in ``text`` (normalized, single-spaced)."""
+        prefixes: list[int] = []
+        total_len = 0
+        for sentence in cls._sentence_boundary.split(text):
+            if not sentence:
+                continue
+            total_len += len(sentence) + (1 if prefixes else 0)
+            prefixes.append(total_len)
+        return prefixes
 
 
 class HttpSummarizer(SignalSummarizer):
-    def __init__(self, endpoint: str, fallback: SignalSummarizer, max_chars: int, cache_size: int, timeout: float) -> None:
+    """Remote summarizer with a pooled keep-alive session, bounded fan-out and a circuit breaker.
+
+    Uncached documents are summarized concurrently (at most ``concurrency`` in
+    flight). Consecutive failures open the breaker, and while it is open every
+    document goes to ``fallback`` at once instead of waiting out the timeout.
+
+    Endpoints that advertise ``{"batch": true}`` at ``{endpoint}/capabilities``
+    receive many documents per round trip at ``{endpoint}/batch``::
+
+        {"items": [{"text": "...", "maxChars": 600}, ...]}  ->  {"summaries": [{"summary": "..."}, ...]}
+
+    ``batch_mode`` is ``auto`` (probe, cached for ``capability_ttl``), ``on``
+    (skip the probe) or ``off``. Endpoints without batch support get
+    per-document calls.
+    """
+
+    provider_name = "http"
+    _capability_retry_seconds = 30.0
+    _batch_unsupported_statuses = (404, 405, 501)
+
+    def __init__(
+        self,
+        endpoint: str,
+        fallback: SignalSummarizer,
+        max_chars: int,
+        cache_size: int,
+        timeout: float,
+        persistent_cache: SqliteCache | None = None,
+        concurrency: int = 8,
+        connect_timeout: float | None = None,
+        breaker: CircuitBreaker | None = None,
+        batch_mode: str = "auto",
+        batch_max_items: int = 64,
+        capability_ttl: float = 300.0,
+    ) -> None:
         self._endpoint = endpoint
+        self._base_url = endpoint.rstrip("/")
+        self._batch_mode = batch_mode if batch_mode in ("auto", "on", "off") else "auto"
+        self._batch_max_items = max(1, batch_max_items)
+        self._batch_url = f"{self._base_url}/batch"
+        self._capability_ttl = capability_ttl
+        self._capability_lock = threading.Lock()
+        self._batch_supported_until = 0.0
+        self._batch_supported = False
+        self._capability_probing = False
         self._fallback = fallback
         self._max_chars = max_chars
-        self._timeout = timeout
-        self._cache = lru_cache(maxsize=cache_size)(self._summarize_remote)
+        self._timeout = (min(connect_timeout, timeout) if connect_timeout else timeout, timeout)
+        self._concurrency = max(1, concurrency)
+        self._breaker = breaker or CircuitBreaker(
+            SUMMARY_BREAKER_FAILURES,
+            SUMMARY_BREAKER_COOLDOWN_SECONDS,
+            on_state_change=self._log_breaker_change,
+        )
+        self._local_lock = threading.Lock()
+        self._local_pid: int | None = None
+        self._session = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._cache: TieredCache[tuple[str, int], SummarizeResult] = TieredCache(
+            LruCache(cache_size),
+            persistent_cache,
+            digest=lambda key: content_digest("summary", endpoint, SUMMARY_SCHEMA_VERSION, key[1], key[0]),
+            encode=asdict,
+            decode=lambda value: SummarizeResult(**value),
+        )
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    @property
+    def fallback(self) -> SignalSummarizer:
+        return self._fallback
+
+    def caches(self) -> dict[str, TieredCache]:
+        return {"summaries": self._cache}
 
     def summarize(self, text: str, max_chars: int | None = None) -> SummarizeResult:
+        return self.summarize_many([text], max_chars)[0]
+
+    def summarize_many(self, texts: Sequence[str], max_chars: int | None = None) -> list[SummarizeResult]:
         limit = max_chars or self._max_chars
-        clean = normalize_text(text)
-        if not clean:
-            return SummarizeResult(summary="", truncated=False)
-        if limit <= 0:
-            return SummarizeResult(summary="", truncated=len(clean) > 0)
-        return self._cache(clean, limit)
-
-    def _summarize_remote(self, text: str, limit: int) -> SummarizeResult:
+        results: list[SummarizeResult | None] = [None] * len(texts)
+        keys: dict[int, tuple[str, int]] = {}
+        for index, text in enumerate(texts):
+            clean = normalize_text(text)
+            if not clean:
+                results[index] = SummarizeResult(summary="", truncated=False)
+            elif limit <= 0:
+                results[index] = SummarizeResult(summary="", truncated=True)
+            else:
+                keys[index] = (clean, limit)
+
+        with observe_stage("cache_lookup", "summarizer", self.provider_name, documents=len(keys)) as stage:
+            cached = self._cache.get_many(keys.values())
+            hits = sum(1 for key in keys.values() if key in cached)
+            stage.record_cache(hits, len(keys) - hits)
+        missing = list(dict.fromkeys(key for key in keys.values() if key not in cached))
+        if missing:
+            computed: list[tuple[tuple[str, int], SummarizeResult]] = []
+            persisted: list[tuple[tuple[str, int], SummarizeResult]] = []
+            with observe_stage("remote", "summarizer", self.provider_name, documents=len(missing)):
+                remote_results = self._summarize_remote_many(missing)
+            for key, (result, from_remote) in zip(missing, remote_results):
+                cached[key] = result
+                # Fallback summaries stay in memory only so a recovered endpoint is used after restart.
+                (persisted if from_remote else computed).append((key, result))
+            self._cache.put_many(persisted)
+            self._cache.put_many(computed, persist=False)
+
+        for index, key in keys.items():
+            results[index] = cached[key]
+        return results  # type: ignore[return-value]
+
+    def close(self) -> None:
+        with self._local_lock:
+            if self._pool is not None and self._local_pid == os.getpid():
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            if self._session is not None and self._local_pid == os.getpid():
+                self._session.close()
+            self._pool = None
+            self._session = None
+
+    def _summarize_remote_many(self, keys: list[tuple[str, int]]) -> list[tuple[SummarizeResult, bool]]:
+        results: dict[tuple[str, int], tuple[SummarizeResult, bool]] = {}
+        pending = keys
+        if len(keys) > 1 and self._batch_enabled():
+            chunks = [keys[start : start + self._batch_max_items] for start in range(0, len(keys), self._batch_max_items)]
+            pending = []
+            for chunk, chunk_results in zip(chunks, self._fan_out(self._summarize_remote_batch, chunks)):
+                if chunk_results is None:
+                    pending.extend(chunk)
+                else:
+                    results.update(zip(chunk, chunk_results))
+        if pending:
+            results.update(zip(pending, self._fan_out(lambda key: self._summarize_remote(*key), pending)))
+        return [results[key] for key in keys]
+
+    def _fan_out(self, func, items: list) -> list:
+        if len(items) == 1 or self._concurrency == 1:
+            return [func(item) for item in items]
+        _, pool = self._clients()
+        return list(pool.map(func, items))
+
+    def _summarize_remote_batch(self, keys: list[tuple[str, int]]) -> list[tuple[SummarizeResult, bool]] | None:
+        """Summarize ``keys`` in one request; ``None`` means the endpoint cannot batch."""
+        if not self._breaker.allow():
+            return [(self._fallback.summarize(text, limit), False) for text, limit in keys]
         try:
-            import requests
+            session, _ = self._clients()
+            response = session.post(
+                self._batch_url,
+                json={"items": [{"text": text, "maxChars": limit} for text, limit in keys]},
+                timeout=self._timeout,
+            )
+            if response.status_code in self._batch_unsupported_statuses:
+                self._breaker.record_success()
+                with self._capability_lock:
+                    self._mark_batch_support(False, self._capability_ttl)
+                logger.info("Summarizer %s does not support batching; using per-document calls.", self._endpoint)
+                return None
+            response.raise_for_status()
+            summaries = response.json().get("summaries")
+            if not isinstance(summaries, list) or len(summaries) != len(keys):
+                raise ValueError("Batch summarizer response does not match the request items.")
+        except Exception as exc:
+            self._breaker.record_failure()
+            logger.warning("Summarizer batch call failed, falling back: %s", exc)
+            return [(self._fallback.summarize(text, limit), False) for text, limit in keys]
+
+        self._breaker.record_success()
+        results: list[tuple[SummarizeResult, bool]] = []
+        for (text, limit), item in zip(keys, summaries):
+            summary = str(item.get("summary", "") if isinstance(item, dict) else item or "").strip()
+            if summary:
+                results.append((SummarizeResult(summary=summary, truncated=len(text) > len(summary)), True))
+            else:
+                results.append((self._fallback.summarize(text, limit), False))
+        return results
 
-            response = requests.post(
+    def _batch_enabled(self) -> bool:
+        if self._batch_mode != "auto":
+            return self._batch_mode == "on"
+        with self._capability_lock:
+            if time.monotonic() < self._batch_supported_until:
+                return self._batch_supported
+            if self._capability_probing:
+                # Another caller is probing; use per-document calls instead of waiting on its timeout.
+                return False
+            self._capability_probing = True
+        supported = False
+        max_items: int | None = None
+        ttl = self._capability_retry_seconds
+        try:
+            session, _ = self._clients()
+            response = session.get(f"{self._base_url}/capabilities", timeout=self._timeout)
+            capabilities = response.json() if response.ok else {}
+            supported = isinstance(capabilities, dict) and bool(capabilities.get("batch"))
+            if supported and isinstance(capabilities.get("maxBatchItems"), int):
+                max_items = capabilities["maxBatchItems"]
+            ttl = self._capability_ttl
+        except Exception as exc:
+            logger.warning("Summarizer capability probe failed (%s); retrying later: %s", self._endpoint, exc)
+        finally:
+            with self._capability_lock:
+                if max_items is not None:
+                    self._batch_max_items = max(1, min(self._batch_max_items, max_items))
+                self._mark_batch_support(supported, ttl)
+                self._capability_probing = False
+        return supported
+
+    def _mark_batch_support(self, supported: bool, ttl: float) -> None:
+        # Callers hold _capability_lock.
+        self._batch_supported = supported
+        self._batch_supported_until = time.monotonic() + ttl
+
+    def _summarize_remote(self, text: str, limit: int) -> tuple[SummarizeResult, bool]:
+        if not self._breaker.allow():
+            return self._fallback.summarize(text, limit), False
+        try:
+            session, _ = self._clients()
+            response = session.post(
                 self._endpoint,
                 json={"text": text, "maxChars": limit},
                 timeout=self._timeout,
             )
             response.raise_for_status()
             payload = response.json()
-            summary = str(payload.get("summary", "")).strip()
-            if not summary:
-                return self._fallback.summarize(text, limit)
-            return SummarizeResult(summary=summary, truncated=len(text) > len(summary))
         except Exception as exc:
+            self._breaker.record_failure()
             logger.warning("Summarizer remote call failed, falling back: %s", exc)
-            return self._fallback.summarize(text, limit)
+            return self._fallback.summarize(text, limit), False
+
+        self._breaker.record_success()
+        summary = str(payload.get("summary", "")).strip() if isinstance(payload, dict) else ""
+        if not summary:
+            return self._fallback.summarize(text, limit), False
+        return SummarizeResult(summary=summary, truncated=len(text) > len(summary)), True
+
+    def _clients(self):
+        pid = os.getpid()
+        with self._local_lock:
+            if self._session is None or self._local_pid != pid:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._concurrency)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+                # A pool inherited through fork() has no live threads; build a new one.
+                self._pool = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="summarizer")
+                self._local_pid = pid
+            return self._session, self._pool
+
+    def _log_breaker_change(self, previous: str, state: str) -> None:
+        if state == "open":
+            logger.warning(
+                "Summarizer circuit opened for %s; using heuristic summaries for %.0fs.",
+                self._endpoint,
+                SUMMARY_BREAKER_COOLDOWN_SECONDS,
+            )
+        elif state == "closed":
+            logger.info("Summarizer circuit closed for %s.", self._endpoint)
 
 
 def build_summarizer() -> SignalSummarizer:
-    heuristic = HeuristicSummarizer(max_chars=SUMMARY_MAX_CHARS, cache_size=SUMMARY_CACHE_SIZE)
+    persistent_cache = get_persistent_cache()
+    heuristic = HeuristicSummarizer(
+        max_chars=SUMMARY_MAX_CHARS,
+        cache_size=SUMMARY_CACHE_SIZE,
+        persistent_cache=persistent_cache,
+    )
 
     if SUMMARY_PROVIDER == "http":
         if SUMMARY_ENDPOINT:
@@ -556,6 +2243,12 @@ def build_summarizer() -> SignalSummarizer:
                 max_chars=SUMMARY_MAX_CHARS,
                 cache_size=SUMMARY_CACHE_SIZE,
                 timeout=SUMMARY_TIMEOUT_SECONDS,
+                persistent_cache=persistent_cache,
+                concurrency=SUMMARY_CONCURRENCY,
+                connect_timeout=SUMMARY_CONNECT_TIMEOUT_SECONDS,
+                batch_mode=SUMMARY_BATCH_MODE,
+                batch_max_items=SUMMARY_BATCH_MAX_ITEMS,
+                capability_ttl=SUMMARY_CAPABILITY_TTL_SECONDS,
             )
         logger.warning("AI_SUMMARIZER_PROVIDER=http set but AI_SUMMARIZER_ENDPOINT is empty; using heuristic.")
 
@@ -569,6 +2262,22 @@ def normalize_vector(values: list[float]) -> list[float]:
     return [max(0.0, value) / total for value in values]
 
 
+def normalize_vector_rows(values):
+    """Row-wise ``normalize_vector`` for an ``(N, K)`` NumPy array, with identical results."""
+    import numpy as np
+
+    clipped = np.maximum(values, 0.0)
+    total = np.zeros(clipped.shape[0], dtype=np.float64)
+    for column in range(clipped.shape[1]):
+        # Accumulate column by column to match the left-to-right order of sum().
+        total = total + clipped[:, column]
+    normalized = np.empty_like(clipped, dtype=np.float64)
+    valid = total > 0
+    normalized[valid] = clipped[valid] / total[valid, None]
+    normalized[~valid] = [0.15, 0.7, 0.15]
+    return normalized
+
+
 def clamp(value: float, min_value: float, max_value: float) -> float:
     return max(min_value, min(max_value, value))
 
@@ -587,17 +2296,34 @@ def normalize_text(text: str) -> str:
 
 
 @app.post("/signals/summarize", response_model=SummarizeResponse)
-def summarize_signals(payload: SummarizeRequest) -> SummarizeResponse:
+async def summarize_signals(payload: SummarizeRequest, request: Request) -> SummarizeResponse:
     summarizer: SignalSummarizer = app.state.summarizer
+    deadline = request_deadline(request)
     with observe_signal_endpoint("/signals/summarize", SUMMARY_PROVIDER, len(payload.documents)) as span:
         max_chars = payload.max_chars if payload.max_chars and payload.max_chars > 0 else SUMMARY_MAX_CHARS
-        summaries: list[SummaryItem] = []
+        # No degraded mode: the HTTP summarizer already bounds its own calls and falls back to heuristics.
+        if deadline is not None and deadline <= time.perf_counter():
+            raise DeadlineExceededError()
+        executor: InferenceExecutor = app.state.summary_executor
+        summaries = await executor.run(
+            build_summary_items, summarizer, payload.documents, max_chars, deadline=deadline
+        )
+
+        span.set_attribute("ai.signals.schema_version", SUMMARY_SCHEMA_VERSION)
+        span.set_attribute("ai.signals.max_chars", max_chars)
+        return SummarizeResponse(schemaVersion=SUMMARY_SCHEMA_VERSION, summaries=summaries)
 
-        for index, doc in enumerate(payload.documents):
+
+def build_summary_items(
+    summarizer: SignalSummarizer, documents: list[SignalDocument], max_chars: int
+) -> list[SummaryItem]:
+    texts = [f"{doc.title}. {doc.summary}" if doc.summary else doc.title for doc in documents]
+    results = summarizer.summarize_many(texts, max_chars)
+    summaries: list[SummaryItem] = []
+    with observe_stage("response_build", "summarizer", summarizer.provider_name, documents=len(results)):
+        for index, (doc, result) in enumerate(zip(documents, results)):
             source = doc.source
             title = doc.title
-            text = f"{doc.title}. {doc.summary}" if doc.summary else doc.title
-            result = summarizer.summarize(text, max_chars)
             summaries.append(
                 SummaryItem(
                     index=index,
@@ -607,10 +2333,8 @@ def summarize_signals(payload: SummarizeRequest) -> SummarizeResponse:
                     truncated=result.truncated,
                 )
             )
+    return summaries
 
-        span.set_attribute("ai.signals.schema_version", SUMMARY_SCHEMA_VERSION)
-        span.set_attribute("ai.signals.max_chars", max_chars)
-        return SummarizeResponse(schemaVersion=SUMMARY_SCHEMA_VERSION, summaries=summaries)
 
 def resolve_otlp_endpoint(base_endpoint: str | None, signal_endpoint: str | None, signal: str) -> str | None:
     if signal_endpoint:
@@ -1,7 +1,21 @@
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 import math
 import statistics
-from typing import Sequence
+import threading
+import time
+from typing import Callable, Sequence
+
+RISK_SCORER_VERSION = "1"
+RISK_WINDOW_SIZE = 10
+RISK_MIN_SAMPLES = 3
+SPIKE_TREND_THRESHOLD = 0.2
+VOLATILITY_THRESHOLD = 5.0
+ZERO_MEAN_EPSILON = 1e-9
+
+# Vectorized and rolling statistics differ from fsum/exact pstdev by a few ulps;
+# decisions within this relative margin of a threshold are re-scored exactly.
+_RECHECK_TOLERANCE = 1e-9
 
 
 @dataclass(frozen=True)
@@ -10,7 +24,27 @@ class RiskAssessment:
     Reason: str
 
 
+REBALANCE_ASSESSMENT = RiskAssessment(Priority="CRITICAL", Reason="Cloud Provider Signal")
+INSUFFICIENT_DATA_ASSESSMENT = RiskAssessment(Priority="LOW", Reason="Insufficient Data")
+SPIKE_ASSESSMENT = RiskAssessment(Priority="CRITICAL", Reason="Price Spike Detected")
+INSTABILITY_ASSESSMENT = RiskAssessment(Priority="CRITICAL", Reason="Market Instability")
+STABLE_ASSESSMENT = RiskAssessment(Priority="LOW", Reason="Stable")
+
+
+def _clean_price(value: object) -> float | None:
+    if value is None:
+        return None
+    try:
+        price = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return price if math.isfinite(price) else None
+
+
 class RiskScorer:
+    # Bump when scoring rules change; memoized /analyze results are keyed on it.
+    version = RISK_SCORER_VERSION
+
     def assess_risk(
         self,
         spot_price_history: Sequence[float],
@@ -18,37 +52,259 @@ class RiskScorer:
         capacity_score: float,
     ) -> RiskAssessment:
         if rebalance_signal:
-            return RiskAssessment(Priority="CRITICAL", Reason="Cloud Provider Signal")
+            return REBALANCE_ASSESSMENT
 
         clean_prices: list[float] = []
         for value in spot_price_history:
-            if value is None:
-                continue
-            try:
-                price = float(value)
-            except (TypeError, ValueError):
-                continue
-            if not math.isfinite(price):
-                continue
-            clean_prices.append(price)
-
-        if len(clean_prices) < 3:
-            return RiskAssessment(Priority="LOW", Reason="Insufficient Data")
-
-        window = clean_prices[-10:]
+            price = _clean_price(value)
+            if price is not None:
+                clean_prices.append(price)
+
+        if len(clean_prices) < RISK_MIN_SAMPLES:
+            return INSUFFICIENT_DATA_ASSESSMENT
+
+        window = clean_prices[-RISK_WINDOW_SIZE:]
         moving_average = statistics.fmean(window)
         last_price = window[-1]
         volatility = statistics.pstdev(window)
 
-        if abs(moving_average) < 1e-9:
+        if abs(moving_average) < ZERO_MEAN_EPSILON:
             trend = 0.0
         else:
             trend = (last_price - moving_average) / moving_average
 
-        if trend > 0.2:
-            return RiskAssessment(Priority="CRITICAL", Reason="Price Spike Detected")
+        if trend > SPIKE_TREND_THRESHOLD:
+            return SPIKE_ASSESSMENT
+
+        if volatility > VOLATILITY_THRESHOLD:
+            return INSTABILITY_ASSESSMENT
+
+        return STABLE_ASSESSMENT
+
+    def assess_risk_batch(
+        self,
+        price_matrix,
+        valid_mask=None,
+        rebalance_signals: Sequence[bool] | None = None,
+        capacity_scores: Sequence[float] | None = None,
+    ) -> list[RiskAssessment]:
+        """Score N histories at once from an ``(N, T)`` price matrix.
+
+        ``valid_mask`` marks real samples (ragged histories are right-padded);
+        non-finite prices are dropped like the scalar path drops them. Window
+        statistics are computed with NumPy, and any row whose decision is within
+        floating-point noise of a threshold is re-scored with ``assess_risk``,
+        so results are identical to calling ``assess_risk`` per row.
+        """
+        import numpy as np
+
+        prices = np.asarray(price_matrix, dtype=np.float64)
+        if prices.ndim != 2:
+            raise ValueError("price_matrix must be a two-dimensional (N, T) array.")
+        rows, columns = prices.shape
+
+        valid = np.isfinite(prices)
+        if valid_mask is not None:
+            mask = np.asarray(valid_mask, dtype=bool)
+            if mask.shape != prices.shape:
+                raise ValueError("valid_mask must have the same shape as price_matrix.")
+            valid &= mask
+        rebalance = (
+            np.zeros(rows, dtype=bool)
+            if rebalance_signals is None
+            else np.asarray(rebalance_signals, dtype=bool).reshape(rows)
+        )
+        capacity = (
+            np.zeros(rows, dtype=np.float64)
+            if capacity_scores is None
+            else np.asarray(capacity_scores, dtype=np.float64).reshape(rows)
+        )
+
+        # Keep the last RISK_WINDOW_SIZE valid samples of every row.
+        remaining = np.cumsum(valid[:, ::-1], axis=1)[:, ::-1]
+        in_window = valid & (remaining <= RISK_WINDOW_SIZE)
+        counts = in_window.sum(axis=1)
+
+        with np.errstate(all="ignore"):
+            samples = np.where(in_window, prices, 0.0)
+            divisor = np.maximum(counts, 1)
+            moving_average = samples.sum(axis=1) / divisor
+            deviations = np.where(in_window, prices - moving_average[:, None], 0.0)
+            volatility = np.sqrt((deviations * deviations).sum(axis=1) / divisor)
+            last_column = columns - 1 - np.argmax(valid[:, ::-1], axis=1) if columns else np.zeros(rows, dtype=int)
+            last_price = samples[np.arange(rows), last_column] if columns else np.zeros(rows)
+            magnitude = np.abs(samples).max(axis=1) if columns else np.zeros(rows)
+
+            zero_mean = np.abs(moving_average) < ZERO_MEAN_EPSILON
+            safe_average = np.where(zero_mean, 1.0, moving_average)
+            trend = np.where(zero_mean, 0.0, (last_price - moving_average) / safe_average)
+
+            noise = _RECHECK_TOLERANCE * np.maximum(magnitude, 1e-300)
+            trend_noise = noise * (1.0 + np.abs(trend)) / np.abs(safe_average)
+            ambiguous = (
+                ~np.isfinite(moving_average)
+                | ~np.isfinite(volatility)
+                | ~np.isfinite(trend)
+                | (np.abs(np.abs(moving_average) - ZERO_MEAN_EPSILON) <= noise)
+                | (np.abs(trend - SPIKE_TREND_THRESHOLD) <= trend_noise)
+                | (np.abs(volatility - VOLATILITY_THRESHOLD) <= noise)
+            )
+
+        insufficient = counts < RISK_MIN_SAMPLES
+        spike = trend > SPIKE_TREND_THRESHOLD
+        unstable = volatility > VOLATILITY_THRESHOLD
+
+        results: list[RiskAssessment] = []
+        for row in range(rows):
+            if rebalance[row]:
+                results.append(REBALANCE_ASSESSMENT)
+            elif insufficient[row]:
+                results.append(INSUFFICIENT_DATA_ASSESSMENT)
+            elif ambiguous[row]:
+                results.append(self.assess_risk(prices[row][valid[row]].tolist(), False, float(capacity[row])))
+            elif spike[row]:
+                results.append(SPIKE_ASSESSMENT)
+            elif unstable[row]:
+                results.append(INSTABILITY_ASSESSMENT)
+            else:
+                results.append(STABLE_ASSESSMENT)
+        return results
+
+
+@dataclass
+class _SeriesWindow:
+    prices: deque = field(default_factory=lambda: deque(maxlen=RISK_WINDOW_SIZE))
+    total: float = 0.0
+    total_squares: float = 0.0
+    updates_since_anchor: int = 0
+    last_seen: float = 0.0
+
+
+class IncrementalRiskScorer:
+    """Stateful ``assess_risk`` for callers that send only new price points.
+
+    Each series id keeps the last ``RISK_WINDOW_SIZE`` clean prices in a ring
+    buffer with a rolling sum and sum of squares, so an update costs O(new
+    points) instead of O(history). Rolling sums are re-anchored from the
+    buffer every window's worth of updates to stop drift, and a decision
+    within rounding noise of a threshold falls back to ``RiskScorer`` on the
+    buffer, so results match ``assess_risk`` on the full history. Idle series
+    are dropped after ``idle_ttl_seconds``, and the least recently used
+    series are dropped beyond ``max_series``.
+    """
+
+    def __init__(
+        self,
+        scorer: RiskScorer | None = None,
+        max_series: int = 10000,
+        idle_ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._scorer = scorer or RiskScorer()
+        self._max_series = max(1, max_series)
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._clock = clock
+        self._series: "OrderedDict[str, _SeriesWindow]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def samples(self, series_id: str) -> int:
+        with self._lock:
+            window = self._series.get(series_id)
+            return len(window.prices) if window is not None else 0
+
+    def forget(self, series_id: str) -> None:
+        with self._lock:
+            self._series.pop(series_id, None)
+
+    def update(
+        self,
+        series_id: str,
+        new_prices: Sequence[float],
+        rebalance_signal: bool,
+        capacity_score: float,
+        reset: bool = False,
+    ) -> tuple[RiskAssessment, int]:
+        """Append ``new_prices`` to the series and score it; returns ``(assessment, samples in window)``."""
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            window = None if reset else self._series.get(series_id)
+            if window is None:
+                window = _SeriesWindow()
+                self._series[series_id] = window
+            self._series.move_to_end(series_id)
+            window.last_seen = now
+            while len(self._series) > self._max_series:
+                self._series.popitem(last=False)
+
+            for value in new_prices:
+                price = _clean_price(value)
+                if price is not None:
+                    self._push(window, price)
+
+            samples = len(window.prices)
+            if rebalance_signal:
+                return REBALANCE_ASSESSMENT, samples
+            if samples < RISK_MIN_SAMPLES:
+                return INSUFFICIENT_DATA_ASSESSMENT, samples
+            assessment = self._classify(window)
+            if assessment is None:
+                assessment = self._scorer.assess_risk(list(window.prices), False, capacity_score)
+            return assessment, samples
+
+    def _push(self, window: _SeriesWindow, price: float) -> None:
+        if len(window.prices) == RISK_WINDOW_SIZE:
+            evicted = window.prices[0]
+            window.total -= evicted
+            window.total_squares -= evicted * evicted
+        window.prices.append(price)
+        window.total += price
+        window.total_squares += price * price
+        window.updates_since_anchor += 1
+        if window.updates_since_anchor >= RISK_WINDOW_SIZE:
+            window.total = math.fsum(window.prices)
+            window.total_squares = math.fsum(value * value for value in window.prices)
+            window.updates_since_anchor = 0
+
+    @staticmethod
+    def _classify(window: _SeriesWindow) -> RiskAssessment | None:
+        """Decide from rolling sums, or return ``None`` when rounding could flip the decision."""
+        count = len(window.prices)
+        moving_average = window.total / count
+        variance = max(0.0, window.total_squares / count - moving_average * moving_average)
+        last_price = window.prices[-1]
+        magnitude = max(abs(value) for value in window.prices) or 1e-300
+
+        noise = _RECHECK_TOLERANCE * magnitude
+        if not (math.isfinite(moving_average) and math.isfinite(variance)):
+            return None
+        if abs(abs(moving_average) - ZERO_MEAN_EPSILON) <= noise:
+            return None
+
+        if abs(moving_average) < ZERO_MEAN_EPSILON:
+            trend = 0.0
+        else:
+            trend = (last_price - moving_average) / moving_average
+            if abs(trend - SPIKE_TREND_THRESHOLD) <= noise * (1.0 + abs(trend)) / abs(moving_average):
+                return None
+        if trend > SPIKE_TREND_THRESHOLD:
+            return SPIKE_ASSESSMENT
 
-        if volatility > 5.0:
-            return RiskAssessment(Priority="CRITICAL", Reason="Market Instability")
+        # Sum-of-squares variance loses precision with the square of the magnitude.
+        if abs(variance - VOLATILITY_THRESHOLD * VOLATILITY_THRESHOLD) <= noise * magnitude:
+            return None
+        if variance > VOLATILITY_THRESHOLD * VOLATILITY_THRESHOLD:
+            return INSTABILITY_ASSESSMENT
+        return STABLE_ASSESSMENT
 
-        return RiskAssessment(Priority="LOW", Reason="Stable")
+    def _expire(self, now: float) -> None:
+        if self._idle_ttl_seconds <= 0:
+            return
+        while self._series:
+            series_id, window = next(iter(self._series.items()))
+            if now - window.last_seen <= self._idle_ttl_seconds:
+                break
+            self._series.popitem(last=False)
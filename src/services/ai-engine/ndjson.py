@@ -0,0 +1,84 @@
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class NdjsonRecord:
+    """One non-blank input line: the decoded value, or an error message if it could not be used."""
+
+    index: int
+    value: Any = None
+    error: str | None = None
+
+
+class NdjsonReader:
+    """Incremental newline-delimited JSON splitter for request bodies that arrive in pieces.
+
+    ``feed`` accepts raw body chunks as they come off the socket and returns
+    every record completed so far; only the current partial line is buffered,
+    and a line longer than ``max_line_bytes`` is reported as an error and
+    skipped instead of growing the buffer without bound.
+    """
+
+    def __init__(self, max_line_bytes: int) -> None:
+        self._max_line_bytes = max(1, max_line_bytes)
+        self._buffer = bytearray()
+        self._discarding = False
+        self._next_index = 0
+
+    @property
+    def records_read(self) -> int:
+        return self._next_index
+
+    def feed(self, chunk: bytes) -> list[NdjsonRecord]:
+        records: list[NdjsonRecord] = []
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            if newline == -1:
+                break
+            if self._discarding:
+                self._discarding = False
+            else:
+                self._buffer += chunk[start:newline]
+                if len(self._buffer) > self._max_line_bytes:
+                    records.append(self._oversized())
+                else:
+                    record = self._decode(bytes(self._buffer))
+                    if record is not None:
+                        records.append(record)
+            self._buffer.clear()
+            start = newline + 1
+
+        if not self._discarding:
+            self._buffer += chunk[start:]
+            if len(self._buffer) > self._max_line_bytes:
+                records.append(self._oversized())
+                self._buffer.clear()
+                self._discarding = True
+        return records
+
+    def finish(self) -> list[NdjsonRecord]:
+        """Flush a final line that was not terminated by a newline."""
+        if self._discarding:
+            self._discarding = False
+            return []
+        record = self._decode(bytes(self._buffer))
+        self._buffer.clear()
+        return [record] if record is not None else []
+
+    def _decode(self, line: bytes) -> NdjsonRecord | None:
+        if not line.strip():
+            return None
+        index = self._next_index
+        self._next_index += 1
+        try:
+            return NdjsonRecord(index=index, value=json.loads(line))
+        except (UnicodeDecodeError, ValueError) as exc:
+            return NdjsonRecord(index=index, error=f"Invalid JSON: {exc}")
+
+    def _oversized(self) -> NdjsonRecord:
+        index = self._next_index
+        self._next_index += 1
+        return NdjsonRecord(index=index, error=f"Line exceeds {self._max_line_bytes} bytes.")
@@ -0,0 +1,193 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+from caching import CacheStats, approximate_size
+
+V = TypeVar("V")
+
+FINGERPRINT_BITS = 64
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def text_features(text: str) -> list[str]:
+    """Lower-cased word unigrams and bigrams; bigrams keep some word order."""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    return tokens + [f"{left} {right}" for left, right in zip(tokens, tokens[1:])]
+
+
+def simhash(features: list[str]) -> int:
+    """64-bit SimHash: each bit is the majority vote of that bit over the feature hashes."""
+    import numpy as np
+
+    if not features:
+        return 0
+    hashes = np.array([_feature_hash(feature) for feature in features], dtype="<u8")
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(features)
+    return int.from_bytes(np.packbits(votes, bitorder="little").tobytes(), "little")
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+class NearDuplicateIndex(Generic[V]):
+    """Bounded SimHash index that finds a recently stored value for a similar text.
+
+    Fingerprints within ``max_distance`` differing bits count as near
+    duplicates. The 64 bits are split into ``max_distance + 1`` bands; two
+    fingerprints that close must agree exactly on at least one band, so a
+    lookup only compares against entries sharing a band instead of scanning
+    the whole index. Entries expire ``ttl_seconds`` after they were stored,
+    and the oldest are dropped beyond ``max_entries``. Texts with fewer than
+    ``min_features`` features are not fingerprinted: on short titles a single
+    word flips too many bits for the distance to mean anything.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 3,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600.0,
+        min_features: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 <= max_distance < FINGERPRINT_BITS // 2:
+            raise ValueError(f"max_distance must be between 0 and {FINGERPRINT_BITS // 2 - 1}.")
+        self._max_distance = max_distance
+        self._max_entries = max(0, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._min_features = max(1, min_features)
+        self._clock = clock
+        # Each entry is (value, stored_at, approximate size); the size is measured once, outside the lock.
+        self._entries: "OrderedDict[int, tuple[V, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes = 0
+
+        band_count = max_distance + 1
+        width, extra = divmod(FINGERPRINT_BITS, band_count)
+        self._bands: list[tuple[int, int]] = []
+        shift = 0
+        for band in range(band_count):
+            band_width = width + (1 if band < extra else 0)
+            self._bands.append((shift, (1 << band_width) - 1))
+            shift += band_width
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in self._bands]
+
+    @property
+    def max_distance(self) -> int:
+        return self._max_distance
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        """Lookup hits and misses, plus entries dropped by age or by the size bound."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                capacity=self._max_entries,
+                approximate_bytes=self._bytes,
+            )
+
+    def fingerprint(self, text: str) -> int | None:
+        """SimHash of ``text``, or ``None`` when it is too short to match reliably."""
+        features = text_features(text)
+        if len(features) < self._min_features:
+            return None
+        return simhash(features)
+
+    def lookup(self, fingerprint: int) -> tuple[V, int] | None:
+        """Closest stored ``(value, distance)`` within ``max_distance``, if any."""
+        with self._lock:
+            self._expire(self._clock())
+            best = self._closest(fingerprint)
+            if best is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return best
+
+    def _closest(self, fingerprint: int) -> tuple[V, int] | None:
+        best: tuple[V, int] | None = None
+        seen: set[int] = set()
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            for candidate in buckets.get((fingerprint >> shift) & mask, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = hamming_distance(fingerprint, candidate)
+                if distance <= self._max_distance and (best is None or distance < best[1]):
+                    best = (self._entries[candidate][0], distance)
+                    if distance == 0:
+                        return best
+        return best
+
+    def add(self, fingerprint: int, value: V) -> None:
+        if not self.enabled:
+            return
+        size = self._entry_size(fingerprint, value)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            if fingerprint in self._entries:
+                self._entries.move_to_end(fingerprint)
+                self._bytes -= self._entries[fingerprint][2]
+            else:
+                for (shift, mask), buckets in zip(self._bands, self._buckets):
+                    buckets.setdefault((fingerprint >> shift) & mask, set()).add(fingerprint)
+            self._entries[fingerprint] = (value, now, size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries:
+                self._remove_oldest()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for buckets in self._buckets:
+                buckets.clear()
+
+    def _expire(self, now: float) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        while self._entries:
+            _, stored_at, _ = next(iter(self._entries.values()))
+            if now - stored_at <= self._ttl_seconds:
+                break
+            self._remove_oldest()
+
+    def _entry_size(self, fingerprint: int, value: V) -> int:
+        # The fingerprint is referenced once from the entry map and once per band bucket.
+        return approximate_size(fingerprint) * (len(self._bands) + 1) + approximate_size(value)
+
+    def _remove_oldest(self) -> None:
+        fingerprint, (_, _, size) = self._entries.popitem(last=False)
+        self._bytes -= size
+        self._evictions += 1
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            key = (fingerprint >> shift) & mask
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.discard(fingerprint)
+                if not bucket:
+                    del buckets[key]
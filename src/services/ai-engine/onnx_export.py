@@ -0,0 +1,91 @@
+import inspect
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+ONNX_OPSET = 14
+LABELS_FILE = "labels.json"
+
+
+@dataclass(frozen=True)
+class OnnxArtifact:
+    model_path: Path
+    tokenizer_dir: Path
+    id2label: dict[int, str]
+
+
+def artifact_dir(cache_dir: str | Path, model_id: str) -> Path:
+    key = re.sub(r"[^A-Za-z0-9_.-]+", "--", model_id).strip("-") or "model"
+    return Path(cache_dir).expanduser() / key
+
+
+def ensure_onnx_artifact(model_id: str, cache_dir: str | Path, quantize: bool) -> OnnxArtifact:
+    """Return the cached ONNX export for ``model_id``, exporting it on first use.
+
+    The export, tokenizer files and label map live under one directory per model
+    id. Files are written to a temporary name and renamed into place, so several
+    workers racing on a cold cache never load a half-written graph.
+    """
+    target_dir = artifact_dir(cache_dir, model_id)
+    fp32_path = target_dir / "model.onnx"
+    model_path = target_dir / "model.int8.onnx" if quantize else fp32_path
+    labels_path = target_dir / LABELS_FILE
+
+    if not (fp32_path.exists() and labels_path.exists()):
+        _export_fp32(model_id, target_dir, fp32_path, labels_path)
+    if quantize and not model_path.exists():
+        _quantize_int8(fp32_path, model_path)
+
+    with labels_path.open("r", encoding="utf-8") as handle:
+        id2label = {int(key): str(value) for key, value in json.load(handle).items()}
+    return OnnxArtifact(model_path=model_path, tokenizer_dir=target_dir, id2label=id2label)
+
+
+def _export_fp32(model_id: str, target_dir: Path, fp32_path: Path, labels_path: Path) -> None:
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    model = AutoModelForSequenceClassification.from_pretrained(model_id)
+    model.eval()
+
+    sample = tokenizer(["capacity incident in us-east-1"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    export_kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        # The TorchScript exporter writes one self-contained graph that quantize_dynamic accepts.
+        export_kwargs["dynamo"] = False
+
+    tmp_path = fp32_path.with_name(f"{fp32_path.name}.{os.getpid()}.tmp")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(tmp_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET,
+            **export_kwargs,
+        )
+    tokenizer.save_pretrained(str(target_dir))
+
+    labels_tmp = labels_path.with_name(f"{labels_path.name}.{os.getpid()}.tmp")
+    with labels_tmp.open("w", encoding="utf-8") as handle:
+        json.dump({str(key): value for key, value in model.config.id2label.items()}, handle)
+    os.replace(tmp_path, fp32_path)
+    os.replace(labels_tmp, labels_path)
+
+
+def _quantize_int8(fp32_path: Path, model_path: Path) -> None:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp_path = model_path.with_name(f"{model_path.name}.{os.getpid()}.tmp")
+    quantize_dynamic(str(fp32_path), str(tmp_path), weight_type=QuantType.QInt8)
+    os.replace(tmp_path, model_path)
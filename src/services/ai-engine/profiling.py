@@ -0,0 +1,270 @@
+import heapq
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Leaf frames of threads parked on a lock, condition or selector; skipped unless idle stacks are requested.
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+}
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _frame_name(code) -> str:
+    filename = code.co_filename
+    marker = filename.rfind("site-packages" + os.sep)
+    location = filename[marker + len("site-packages") + 1 :] if marker >= 0 else os.path.basename(filename)
+    return f"{code.co_name} ({location}:{code.co_firstlineno})".replace(";", ":")
+
+
+@dataclass
+class Profile:
+    """Aggregated stacks from one sampling run.
+
+    Each stack runs root to leaf and starts with the thread name. ``counts``
+    holds the number of samples per stack. ``seconds`` holds the wall time
+    between samples attributed to it, so samples delayed by a thread holding
+    the GIL still weigh what they cost.
+    """
+
+    interval_seconds: float
+    started_at: float
+    duration_seconds: float = 0.0
+    counts: Counter = field(default_factory=Counter)
+    seconds: Counter = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.counts.values())
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed format: ``frame;frame;frame count`` per line."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.counts.most_common())
+
+    def speedscope(self, name: str) -> dict:
+        """Speedscope file with one sampled profile per thread."""
+        frames: list[dict[str, object]] = []
+        frame_index: dict[str, int] = {}
+        per_thread: dict[str, tuple[list[list[int]], list[float]]] = {}
+        for stack, weight in self.seconds.most_common():
+            thread_name, *calls = stack
+            indices = []
+            for call in calls:
+                if call not in frame_index:
+                    frame_index[call] = len(frames)
+                    function, _, location = call.rpartition(" (")
+                    file, _, line = location.rstrip(")").rpartition(":")
+                    frames.append({"name": function, "file": file, "line": int(line) if line.isdigit() else 0})
+                indices.append(frame_index[call])
+            samples, weights = per_thread.setdefault(thread_name, ([], []))
+            samples.append(indices)
+            weights.append(round(weight, 6))
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "aether-guard-ai-engine",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 6),
+                    "samples": samples,
+                    "weights": weights,
+                }
+                for thread_name, (samples, weights) in per_thread.items()
+            ],
+        }
+
+
+class StackSampler:
+    """Samples every Python thread's stack from a background thread.
+
+    ``sys._current_frames`` is read every ``interval_seconds``; nothing is
+    installed in the profiled threads, so the cost is one short GIL
+    acquisition per sample and the process needs no restart or tracer.
+    Threads parked in a lock, condition or selector wait are skipped unless
+    ``include_idle`` is set.
+    """
+
+    def __init__(self, interval_seconds: float = 0.01, include_idle: bool = False) -> None:
+        self._interval_seconds = max(0.001, interval_seconds)
+        self._include_idle = include_idle
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._profile = Profile(interval_seconds=self._interval_seconds, started_at=time.time())
+
+    def start(self) -> "StackSampler":
+        self._profile.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self._profile
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        start = last = time.perf_counter()
+        while not self._stop.wait(self._interval_seconds):
+            now = time.perf_counter()
+            self._sample(own_id, now - last)
+            last = now
+        self._profile.duration_seconds = time.perf_counter() - start
+
+    def _sample(self, own_id: int, elapsed: float) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            code = frame.f_code
+            if not self._include_idle and (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES:
+                continue
+            calls: list[str] = []
+            while frame is not None:
+                calls.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            stack = (names.get(thread_id, f"thread-{thread_id}"), *reversed(calls))
+            self._profile.counts[stack] += 1
+            self._profile.seconds[stack] += elapsed
+
+
+class SlowRequestRecorder:
+    """Keeps speedscope files for the ``keep`` slowest profiled requests in ``directory``.
+
+    Only profiles recorded by this process are ranked; files left by earlier
+    processes are not touched.
+    """
+
+    def __init__(self, directory: str, keep: int = 10) -> None:
+        self._directory = directory
+        self._keep = max(1, keep)
+        self._lock = threading.Lock()
+        self._slowest: list[tuple[float, str]] = []
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def paths(self) -> list[str]:
+        with self._lock:
+            return [path for _, path in sorted(self._slowest, reverse=True)]
+
+    def record(self, name: str, duration_ms: float, profile: Profile) -> str | None:
+        """Write ``profile`` if it is among the slowest; returns its path, or ``None`` if it was dropped."""
+        with self._lock:
+            if len(self._slowest) >= self._keep and duration_ms <= self._slowest[0][0]:
+                return None
+            os.makedirs(self._directory, exist_ok=True)
+            stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(profile.started_at))
+            safe_name = _UNSAFE_PATH_CHARS.sub("_", name).strip("_")[:80]
+            filename = f"{stamp}-{os.getpid()}-{duration_ms:.0f}ms-{safe_name}.speedscope.json"
+            path = os.path.join(self._directory, filename)
+            temporary = f"{path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as handle:
+                json.dump(profile.speedscope(f"{name} {duration_ms:.1f} ms"), handle)
+            os.replace(temporary, path)
+            heapq.heappush(self._slowest, (duration_ms, path))
+            while len(self._slowest) > self._keep:
+                _, evicted = heapq.heappop(self._slowest)
+                try:
+                    os.remove(evicted)
+                except FileNotFoundError:
+                    pass
+            return path
+
+
+class RequestProfiler:
+    """Profiles one in every ``sample_every`` requests and keeps the slowest.
+
+    The sampler sees every thread, so only one request is profiled at a time;
+    selected requests that arrive while another is being profiled are skipped.
+    Stacks from unrelated requests running concurrently still show up in the
+    file and should be read as background load.
+    """
+
+    def __init__(
+        self,
+        sample_every: int,
+        recorder: SlowRequestRecorder,
+        interval_seconds: float = 0.01,
+        sampler_factory: Callable[[float], StackSampler] | None = None,
+    ) -> None:
+        self._sample_every = max(1, sample_every)
+        self._recorder = recorder
+        self._interval_seconds = interval_seconds
+        self._sampler_factory = sampler_factory or (lambda interval: StackSampler(interval))
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._active = False
+
+    @property
+    def recorder(self) -> SlowRequestRecorder:
+        return self._recorder
+
+    def begin(self) -> StackSampler | None:
+        with self._lock:
+            self._seen += 1
+            if self._seen % self._sample_every or self._active:
+                return None
+            self._active = True
+        return self._sampler_factory(self._interval_seconds).start()
+
+    def finish(self, sampler: StackSampler, name: str, duration_ms: float) -> str | None:
+        try:
+            profile = sampler.stop()
+        finally:
+            with self._lock:
+                self._active = False
+        return self._recorder.record(name, duration_ms, profile)
+
+
+class RequestProfilingMiddleware:
+    """ASGI middleware that runs ``RequestProfiler`` around HTTP requests.
+
+    Timing ends when the response body has been sent, so streaming endpoints
+    are measured end to end. Paths starting with ``/debug`` are never sampled.
+    Stopping the sampler and writing the profile run in a worker thread.
+    """
+
+    def __init__(self, app, profiler: RequestProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith("/debug"):
+            await self.app(scope, receive, send)
+            return
+        sampler = self.profiler.begin()
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+        import anyio
+        import anyio.to_thread
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            # Joining the sampler and writing the file would stall every request on the loop.
+            # The shield makes sure the profiler is released even if this request is cancelled.
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(
+                    self.profiler.finish, sampler, f"{scope['method']} {scope['path']}", duration_ms
+                )
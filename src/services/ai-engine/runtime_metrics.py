@@ -0,0 +1,192 @@
+import asyncio
+import gc
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+GC_GENERATIONS = (0, 1, 2)
+
+
+def process_rss_bytes() -> int | None:
+    """Resident set size from ``/proc/self/statm``; ``None`` where procfs is unavailable."""
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def torch_thread_settings() -> dict[str, int] | None:
+    """Torch intra-op and inter-op thread counts, or ``None`` when torch was never imported."""
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None
+    return {"intra_op": torch.get_num_threads(), "inter_op": torch.get_num_interop_threads()}
+
+
+def threadpool_statistics(limiter) -> dict[str, int] | None:
+    """Busy, waiting and maximum worker threads of an anyio ``CapacityLimiter``."""
+    if limiter is None:
+        return None
+    statistics = limiter.statistics()
+    return {
+        "busy": statistics.borrowed_tokens,
+        "waiting": statistics.tasks_waiting,
+        "limit": int(statistics.total_tokens),
+    }
+
+
+class GcPauseMonitor:
+    """Times every garbage collection through ``gc.callbacks``.
+
+    The callback runs inside the collection, on whichever thread triggered
+    it, possibly while that thread holds an exporter lock. It therefore only
+    updates counters and appends to a bounded deque; ``drain`` hands the
+    pauses to code that may take locks.
+    """
+
+    def __init__(self, max_pending: int = 10000, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._pending: deque[tuple[int, float]] = deque(maxlen=max_pending)
+        self._started_at = 0.0
+        self._collections = [0, 0, 0]
+        self._total_ms = [0.0, 0.0, 0.0]
+        self._max_ms = [0.0, 0.0, 0.0]
+        self._last_ms = [0.0, 0.0, 0.0]
+        self._collected = [0, 0, 0]
+
+    def install(self) -> None:
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def uninstall(self) -> None:
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def drain(self) -> list[tuple[int, float]]:
+        """Pauses recorded since the last call, as ``(generation, milliseconds)``."""
+        pauses = []
+        while self._pending:
+            pauses.append(self._pending.popleft())
+        return pauses
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "generations": {
+                str(generation): {
+                    "collections": self._collections[generation],
+                    "collected": self._collected[generation],
+                    "total_pause_ms": round(self._total_ms[generation], 3),
+                    "max_pause_ms": round(self._max_ms[generation], 3),
+                    "last_pause_ms": round(self._last_ms[generation], 3),
+                }
+                for generation in GC_GENERATIONS
+            },
+            "counts": list(gc.get_count()),
+            "thresholds": list(gc.get_threshold()),
+            "frozen_objects": gc.get_freeze_count(),
+        }
+
+    def _callback(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started_at = self._clock()
+            return
+        generation = info.get("generation", 2)
+        if generation not in GC_GENERATIONS:
+            return
+        pause_ms = (self._clock() - self._started_at) * 1000
+        self._collections[generation] += 1
+        self._collected[generation] += info.get("collected", 0)
+        self._total_ms[generation] += pause_ms
+        self._last_ms[generation] = pause_ms
+        if pause_ms > self._max_ms[generation]:
+            self._max_ms[generation] = pause_ms
+        self._pending.append((generation, pause_ms))
+
+
+class RuntimeMonitor:
+    """GC pauses, event-loop lag and threadpool saturation for one worker process.
+
+    ``start`` must run on the serving event loop. It installs the GC hook,
+    captures the anyio default thread limiter that ``run_in_threadpool`` uses
+    and starts a task that sleeps ``interval_seconds`` at a time. How late
+    each wake-up comes is the event-loop lag. The same task passes buffered
+    GC pauses to ``on_gc_pause``.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.25,
+        on_gc_pause: Callable[[int, float], None] | None = None,
+        on_loop_lag: Callable[[float], None] | None = None,
+        window: int = 240,
+    ) -> None:
+        self._interval_seconds = max(0.01, interval_seconds)
+        self._on_gc_pause = on_gc_pause
+        self._on_loop_lag = on_loop_lag
+        self.gc = GcPauseMonitor()
+        self._lags: deque[float] = deque(maxlen=max(1, window))
+        self._max_lag_ms = 0.0
+        self._limiter = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def limiter(self):
+        return self._limiter
+
+    def start(self) -> None:
+        import anyio.to_thread
+
+        self._limiter = anyio.to_thread.current_default_thread_limiter()
+        self.gc.install()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="runtime-monitor")
+
+    async def stop(self) -> None:
+        self.gc.uninstall()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._flush_gc_pauses()
+
+    def snapshot(self) -> dict[str, object]:
+        lags = list(self._lags)
+        return {
+            "pid": os.getpid(),
+            "event_loop": {
+                "interval_ms": round(self._interval_seconds * 1000, 3),
+                "samples": len(lags),
+                "last_lag_ms": round(lags[-1], 3) if lags else None,
+                "window_max_lag_ms": round(max(lags), 3) if lags else None,
+                "max_lag_ms": round(self._max_lag_ms, 3),
+            },
+            "gc": self.gc.snapshot(),
+            "threadpool": threadpool_statistics(self._limiter),
+            "process": {"rss_bytes": process_rss_bytes(), "threads": threading.active_count()},
+            "torch": torch_thread_settings(),
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self._interval_seconds)
+            lag_ms = max(0.0, (loop.time() - scheduled - self._interval_seconds) * 1000)
+            self._lags.append(lag_ms)
+            self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+            if self._on_loop_lag is not None:
+                self._on_loop_lag(lag_ms)
+            self._flush_gc_pauses()
+
+    def _flush_gc_pauses(self) -> None:
+        pauses = self.gc.drain()
+        if self._on_gc_pause is not None:
+            for generation, pause_ms in pauses:
+                self._on_gc_pause(generation, pause_ms)
@@ -0,0 +1,118 @@
+import json
+import sys
+from array import array
+from typing import Any, Iterable, Sequence
+
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+FLOAT32_MEDIA_TYPE = "application/vnd.aether-guard.vectors+float32"
+VECTOR_COLUMNS = ("S_v.negative", "S_v.neutral", "S_v.positive", "P_v", "B_s")
+
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Compact JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` for plain dict/list content, skipping pydantic models and ``jsonable_encoder``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def negotiate_vector_format(accept: str | None) -> str:
+    """Pick ``float32``, ``msgpack`` or ``json`` from an ``Accept`` header.
+
+    The highest ``q`` wins and ties keep header order. Unknown types, wildcards
+    and msgpack without the ``msgpack`` package all fall back to JSON.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    best = JSON_MEDIA_TYPE
+    best_quality = -1.0
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type == FLOAT32_MEDIA_TYPE:
+            candidate = FLOAT32_MEDIA_TYPE
+        elif media_type in _MSGPACK_ALIASES and msgpack is not None:
+            candidate = MSGPACK_MEDIA_TYPE
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            continue
+        if quality > 0 and quality > best_quality:
+            best = candidate
+            best_quality = quality
+    return best
+
+
+def pack_vectors_float32(vectors: Iterable[tuple[Sequence[float], float, float]]) -> bytes:
+    """Row-major little-endian float32 matrix with ``VECTOR_COLUMNS`` per row."""
+    packed = array("f")
+    for s_v, p_v, b_s in vectors:
+        packed.extend(s_v)
+        packed.append(p_v)
+        packed.append(b_s)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def vector_batch_response(
+    schema_version: str,
+    vectors: Sequence[tuple[Sequence[float], float, float]],
+    media_type: str,
+    degraded: bool = False,
+) -> Response:
+    """Encode batch enrichment vectors in the negotiated format.
+
+    JSON and msgpack carry the ``EnrichBatchResponse`` shape. float32 carries
+    only the ``len(vectors) x 5`` matrix; the row is the document index, and
+    the shape and column names travel in headers, as does ``X-Degraded``
+    when heuristic scores stood in for the model.
+    """
+    headers = {"X-Schema-Version": schema_version, "Vary": "Accept"}
+    if degraded:
+        headers["X-Degraded"] = "true"
+    if media_type == FLOAT32_MEDIA_TYPE:
+        headers["X-Vector-Count"] = str(len(vectors))
+        headers["X-Vector-Columns"] = ",".join(VECTOR_COLUMNS)
+        return Response(pack_vectors_float32(vectors), media_type=FLOAT32_MEDIA_TYPE, headers=headers)
+
+    content = {
+        "schemaVersion": schema_version,
+        "vectors": [
+            {"index": index, "S_v": list(s_v), "P_v": p_v, "B_s": b_s}
+            for index, (s_v, p_v, b_s) in enumerate(vectors)
+        ],
+        "degraded": degraded,
+    }
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        return Response(msgpack.packb(content), media_type=MSGPACK_MEDIA_TYPE, headers=headers)
+    return FastJSONResponse(content, headers=headers)
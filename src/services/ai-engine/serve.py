@@ -0,0 +1,236 @@
+"""Preload-then-fork serving mode for the AI engine.
+
+The parent process imports the app and builds the enricher and summarizer once,
+freezes those objects out of the garbage collector, binds the listening socket
+and then forks ``--workers`` uvicorn servers. Workers share the model weights
+copy-on-write instead of each loading FinBERT in ``lifespan``. Each worker gets
+``--threads-per-worker`` CPU threads, split between its ``AI_INFERENCE_WORKERS``
+concurrent model calls, so workers x calls x intra-op threads stays within the
+node. The parent periodically reports per-worker unique (private) RSS for pod
+sizing.
+
+Only the torch provider shares weights this way. onnxruntime sessions do not
+survive fork(), so ``finbert-onnx`` rebuilds its session, and loads its own copy
+of the weights, in every worker.
+
+Usage:
+    python serve.py --workers 4 --threads-per-worker 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def parse_args() -> argparse.Namespace:
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Serve the AI engine with preloaded, fork-shared models.")
+    parser.add_argument("--host", default=os.getenv("AI_SERVE_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("AI_SERVE_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("AI_SERVE_WORKERS", "2")))
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=int(os.getenv("AI_SERVE_THREADS_PER_WORKER", "0")),
+        help="CPU threads per worker, split across its concurrent inference calls (default: CPU count / workers).",
+    )
+    parser.add_argument(
+        "--memory-report-interval",
+        type=float,
+        default=float(os.getenv("AI_SERVE_MEMORY_REPORT_SECONDS", "60")),
+        help="Seconds between per-worker memory reports (0 disables).",
+    )
+    parser.add_argument(
+        "--memory-report-path",
+        default=os.getenv("AI_SERVE_MEMORY_REPORT_PATH", ""),
+        help="Optional JSON file rewritten with the latest per-worker memory report.",
+    )
+    parser.add_argument("--log-level", default=os.getenv("AI_SERVE_LOG_LEVEL", "info"))
+    args = parser.parse_args()
+    args.workers = max(1, args.workers)
+    if args.threads_per_worker <= 0:
+        args.threads_per_worker = max(1, cpu_count // args.workers)
+    # Every concurrent inference call runs its own intra-op pool, so the worker's share is divided between them.
+    args.inference_workers = max(1, int(os.getenv("AI_INFERENCE_WORKERS", "0")) or min(4, args.threads_per_worker))
+    args.intra_op_threads = max(1, args.threads_per_worker // args.inference_workers)
+    return args
+
+
+def read_process_memory(pid: int) -> dict[str, float] | None:
+    """Return RSS, PSS and unique (private) set size in MiB from smaps_rollup."""
+    fields = {"Rss": "rss_mb", "Pss": "pss_mb", "Private_Clean": "private_clean_mb", "Private_Dirty": "private_dirty_mb"}
+    values: dict[str, float] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r", encoding="utf-8") as handle:
+            for line in handle:
+                key, _, rest = line.partition(":")
+                if key in fields:
+                    values[fields[key]] = int(rest.split()[0]) / 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    values["uss_mb"] = values.get("private_clean_mb", 0.0) + values.get("private_dirty_mb", 0.0)
+    return values
+
+
+def report_memory(parent_pid: int, workers: dict[int, int], report_path: str) -> None:
+    report = {
+        "generated_at_unix": time.time(),
+        "parent": {"pid": parent_pid, **(read_process_memory(parent_pid) or {})},
+        "workers": [],
+    }
+    for pid, index in sorted(workers.items(), key=lambda item: item[1]):
+        memory = read_process_memory(pid)
+        if memory is None:
+            continue
+        report["workers"].append({"index": index, "pid": pid, **memory})
+        logger.info(
+            "Worker %s (pid %s): uss=%.1fMiB pss=%.1fMiB rss=%.1fMiB",
+            index,
+            pid,
+            memory["uss_mb"],
+            memory.get("pss_mb", 0.0),
+            memory.get("rss_mb", 0.0),
+        )
+
+    if report_path:
+        path = Path(report_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def pin_worker_threads(threads: int) -> None:
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before any inter-op work has started in this process.
+        pass
+
+
+def run_worker(engine, sock: socket.socket, index: int, args: argparse.Namespace) -> None:
+    import uvicorn
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    pin_worker_threads(args.intra_op_threads)
+    config = uvicorn.Config(engine.app, log_level=args.log_level, lifespan="on")
+    server = uvicorn.Server(config)
+    logger.info(
+        "Worker %s (pid %s) serving %s concurrent inference calls with %s intra-op threads each.",
+        index,
+        os.getpid(),
+        args.inference_workers,
+        args.intra_op_threads,
+    )
+    server.run(sockets=[sock])
+
+
+def spawn_worker(engine, sock: socket.socket, index: int, args: argparse.Namespace) -> int:
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 0
+        try:
+            run_worker(engine, sock, index, args)
+        except BaseException:
+            logger.exception("Worker %s crashed.", index)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+    return pid
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def main() -> int:
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s:     %(message)s")
+
+    # Must be set before main, torch/OpenMP and the tokenizers thread pool initialise.
+    os.environ.setdefault("AI_INFERENCE_WORKERS", str(args.inference_workers))
+    os.environ.setdefault("AI_ONNX_INTRA_OP_THREADS", str(args.intra_op_threads))
+    os.environ.setdefault("OMP_NUM_THREADS", str(args.intra_op_threads))
+    os.environ.setdefault("MKL_NUM_THREADS", str(args.intra_op_threads))
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    import main as engine
+
+    started = time.perf_counter()
+    engine.preload_state()
+    logger.info("Preloaded AI engine state in %.1fs.", time.perf_counter() - started)
+    if engine.ENRICHMENT_PROVIDER == "finbert-onnx":
+        logger.warning("finbert-onnx builds one onnxruntime session per worker; model weights are not shared.")
+
+    # Move preloaded objects to the permanent generation so worker GC passes do not
+    # write to (and un-share) the pages holding model weights.
+    gc.collect()
+    gc.freeze()
+
+    sock = bind_socket(args.host, args.port)
+    logger.info("Listening on %s:%s with %s workers.", args.host, args.port, args.workers)
+
+    workers: dict[int, int] = {}
+    for index in range(args.workers):
+        workers[spawn_worker(engine, sock, index, args)] = index
+
+    stopping = False
+
+    def handle_stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+
+    next_report = time.monotonic() + args.memory_report_interval
+    while workers:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid:
+            index = workers.pop(pid, None)
+            if index is not None and not stopping:
+                logger.warning("Worker %s (pid %s) exited with status %s; restarting.", index, pid, status)
+                workers[spawn_worker(engine, sock, index, args)] = index
+            continue
+
+        if args.memory_report_interval > 0 and time.monotonic() >= next_report and not stopping:
+            report_memory(os.getpid(), workers, args.memory_report_path)
+            next_report = time.monotonic() + args.memory_report_interval
+        time.sleep(0.5)
+
+    sock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+import json
+import logging
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+logger = logging.getLogger("uvicorn.error")
+
+DEFAULT_TERMS: dict[str, tuple[str, ...]] = {
+    "negative": ("outage", "disruption", "degraded", "incident", "latency", "unavailable"),
+    "supply": ("capacity", "shortage", "procurement", "inventory", "supply", "quota"),
+}
+
+# Never appears in a term, so a match can not span two joined documents.
+_DOCUMENT_SEPARATOR = "\x00"
+
+
+class TermMatcher:
+    """Counts distinct category terms per document, case-insensitively.
+
+    Semantics match ``sum(term in text.lower() for term in terms)``: each term
+    counts at most once per document and terms may overlap. ``count_many``
+    joins a batch into one string and scans it once per term with C-level
+    ``str.find``, jumping to the next document after each hit, so Python work
+    scales with the number of hits rather than the number of characters.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]) -> None:
+        self.categories: tuple[str, ...] = tuple(categories)
+        term_categories: dict[str, list[int]] = {}
+        for index, category in enumerate(self.categories):
+            for term in categories[category]:
+                normalized = str(term).strip().lower()
+                if normalized and index not in term_categories.setdefault(normalized, []):
+                    term_categories[normalized].append(index)
+        self._terms: tuple[str, ...] = tuple(term_categories)
+        self._term_categories: tuple[tuple[int, ...], ...] = tuple(
+            tuple(term_categories[term]) for term in self._terms
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "TermMatcher":
+        with Path(path).open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if not isinstance(payload, dict):
+            raise ValueError("Term file must be a JSON object of category -> list of terms.")
+        categories = {category: tuple(terms) for category, terms in DEFAULT_TERMS.items()}
+        for category, terms in payload.items():
+            if not isinstance(terms, list):
+                raise ValueError(f"Terms for category {category!r} must be a list.")
+            categories[str(category)] = tuple(str(term) for term in terms)
+        return cls(categories)
+
+    def category_index(self, category: str) -> int:
+        return self.categories.index(category)
+
+    def count(self, text: str) -> list[int]:
+        lowered = text.lower()
+        counts = [0] * len(self.categories)
+        for term, category_indexes in zip(self._terms, self._term_categories):
+            if term in lowered:
+                for category_index in category_indexes:
+                    counts[category_index] += 1
+        return counts
+
+    def count_many(self, texts: Sequence[str]):
+        """Return an ``(len(texts), len(categories))`` int32 NumPy array of term counts."""
+        import numpy as np
+
+        counts = np.zeros((len(texts), len(self.categories)), dtype=np.int32)
+        if not texts:
+            return counts
+
+        lowered = [text.lower() for text in texts]
+        starts: list[int] = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+        corpus = _DOCUMENT_SEPARATOR.join(lowered)
+        corpus_length = len(corpus)
+        document_count = len(lowered)
+
+        for term, category_indexes in zip(self._terms, self._term_categories):
+            hits: list[int] = []
+            position = corpus.find(term)
+            while position != -1:
+                document = bisect_right(starts, position) - 1
+                hits.append(document)
+                next_start = starts[document + 1] if document + 1 < document_count else corpus_length
+                position = corpus.find(term, next_start)
+            if hits:
+                rows = np.asarray(hits, dtype=np.intp)
+                for category_index in category_indexes:
+                    counts[rows, category_index] += 1
+        return counts
+
+
+def load_term_matcher(path: str | None) -> TermMatcher:
+    if path:
+        try:
+            matcher = TermMatcher.from_file(path)
+            logger.info("Loaded enrichment terms from %s.", path)
+            return matcher
+        except (OSError, ValueError) as exc:
+            logger.warning("Failed to load enrichment terms from %s, using defaults: %s", path, exc)
+    return TermMatcher(DEFAULT_TERMS)
@@ -0,0 +1,85 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from fastapi.testclient import TestClient
+
+    import main
+    from main import AnalyzeMemo, RiskPayload
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class AnalyzeMemoTests(unittest.TestCase):
+    def payload(self, capacity: float, history: list[float] | None = None) -> "RiskPayload":
+        return RiskPayload(
+            spotPriceHistory=history if history is not None else [1.0, 1.1, 1.2],
+            rebalanceSignal=False,
+            capacityScore=capacity,
+        )
+
+    def test_raw_then_semantic_lookup(self) -> None:
+        memo = AnalyzeMemo(maxsize=16, capacity_bucket=0.05)
+        body = b'{"spotPriceHistory":[1.0,1.1,1.2],"rebalanceSignal":false,"capacityScore":0.51}'
+        raw_key = memo.raw_key(body, "1")
+        semantic_key = memo.semantic_key(self.payload(0.51), "1")
+
+        self.assertIsNone(memo.get_raw(raw_key))
+        self.assertIsNone(memo.get_semantic(semantic_key))
+        memo.put(raw_key, semantic_key, b'{"status":"LOW"}')
+
+        self.assertEqual(memo.get_raw(raw_key), b'{"status":"LOW"}')
+        self.assertEqual(memo.get_semantic(memo.semantic_key(self.payload(0.52), "1")), b'{"status":"LOW"}')
+        self.assertIsNone(memo.get_semantic(memo.semantic_key(self.payload(0.56), "1")))
+        self.assertEqual(memo.stats(), {"raw_hit": 1, "semantic_hit": 1, "miss": 2, "entries": 1})
+
+    def test_scorer_version_and_invalidate(self) -> None:
+        memo = AnalyzeMemo(maxsize=16, capacity_bucket=0.05)
+        raw_key = memo.raw_key(b"{}", "1")
+        memo.put(raw_key, memo.semantic_key(self.payload(0.5), "1"), b"cached")
+
+        self.assertIsNone(memo.get_raw(memo.raw_key(b"{}", "2")))
+        memo.invalidate()
+        self.assertIsNone(memo.get_raw(raw_key))
+
+    def test_disabled_memo_never_keys(self) -> None:
+        memo = AnalyzeMemo(maxsize=0, capacity_bucket=0.05)
+        self.assertFalse(memo.enabled)
+        self.assertIsNone(memo.raw_key(b"{}", "1"))
+        self.assertIsNone(memo.semantic_key(self.payload(0.5), "1"))
+
+    def test_non_finite_capacity_is_keyed_on_the_raw_value(self) -> None:
+        memo = AnalyzeMemo(maxsize=16, capacity_bucket=0.05)
+
+        infinite = memo.semantic_key(self.payload(float("inf")), "1")
+        not_a_number = memo.semantic_key(self.payload(float("nan")), "1")
+
+        self.assertIsNotNone(infinite)
+        self.assertIsNotNone(not_a_number)
+        self.assertNotEqual(infinite, not_a_number)
+        self.assertNotEqual(infinite, memo.semantic_key(self.payload(float("-inf")), "1"))
+        self.assertEqual(not_a_number, memo.semantic_key(self.payload(float("nan")), "1"))
+
+    def test_analyze_accepts_overflowing_capacity_score(self) -> None:
+        provider = main.ENRICHMENT_PROVIDER
+        main.ENRICHMENT_PROVIDER = "heuristic"
+        try:
+            with TestClient(main.app) as client:
+                body = b'{"spotPriceHistory":[1.0,1.1],"rebalanceSignal":false,"capacityScore":1e400}'
+                first = client.post("/analyze", content=body, headers={"Content-Type": "application/json"})
+                second = client.post("/analyze", content=body, headers={"Content-Type": "application/json"})
+        finally:
+            main.ENRICHMENT_PROVIDER = provider
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+
+
+if __name__ == "__main__":
+    unittest.main()
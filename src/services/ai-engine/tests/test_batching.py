@@ -0,0 +1,110 @@
+import contextvars
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from batching import MicroBatchScheduler, length_buckets, padding_efficiency  # noqa: E402
+
+
+class MicroBatchSchedulerTests(unittest.TestCase):
+    def test_concurrent_submissions_share_one_batch(self) -> None:
+        batches: list[list[str]] = []
+        observed: list[tuple[int, int]] = []
+        release = threading.Event()
+
+        def process(items: list[str]) -> list[str]:
+            batches.append(list(items))
+            return [item.upper() for item in items]
+
+        scheduler = MicroBatchScheduler(
+            process,
+            max_batch_size=8,
+            max_wait_seconds=0.2,
+            on_batch=lambda size, waits: observed.append((size, len(waits))),
+        )
+        results: dict[str, str] = {}
+
+        def worker(text: str) -> None:
+            release.wait()
+            results[text] = scheduler.submit(text).result(timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(f"doc-{index}",)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        scheduler.close()
+
+        self.assertEqual(results, {f"doc-{index}": f"DOC-{index}" for index in range(4)})
+        self.assertEqual(sum(len(batch) for batch in batches), 4)
+        self.assertLess(len(batches), 4)
+        self.assertEqual(sum(size for size, _ in observed), 4)
+
+    def test_batches_are_capped_at_max_size(self) -> None:
+        sizes: list[int] = []
+
+        def process(items: list[int]) -> list[int]:
+            sizes.append(len(items))
+            return [item * 2 for item in items]
+
+        scheduler = MicroBatchScheduler(process, max_batch_size=3, max_wait_seconds=0.05)
+        self.assertEqual(scheduler.map(list(range(7)), timeout=5), [0, 2, 4, 6, 8, 10, 12])
+        scheduler.close()
+        self.assertTrue(all(size <= 3 for size in sizes))
+
+    def test_batch_failure_propagates_to_every_caller(self) -> None:
+        def process(items: list[int]) -> list[int]:
+            raise ValueError("model offline")
+
+        scheduler = MicroBatchScheduler(process, max_batch_size=4, max_wait_seconds=0.01)
+        futures = scheduler.submit_many([1, 2])
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+        scheduler.close()
+
+    def test_batch_runs_in_the_submitting_callers_context(self) -> None:
+        request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="none")
+        seen: list[str] = []
+
+        def process(items: list[int]) -> list[int]:
+            seen.append(request_id.get())
+            return items
+
+        scheduler = MicroBatchScheduler(process, max_batch_size=4, max_wait_seconds=0.01)
+        token = request_id.set("request-1")
+        try:
+            scheduler.map([1, 2], timeout=5)
+        finally:
+            request_id.reset(token)
+        scheduler.close()
+
+        self.assertEqual(seen, ["request-1"])
+
+
+class LengthBucketTests(unittest.TestCase):
+    def test_buckets_group_similar_lengths_and_cover_every_index(self) -> None:
+        lengths = [12, 300, 9, 280, 15, 512, 11, 310]
+        buckets = length_buckets(lengths, 3)
+
+        self.assertEqual(buckets, [[2, 6, 0], [4, 3, 1], [7, 5]])
+        self.assertEqual(sorted(index for bucket in buckets for index in bucket), list(range(len(lengths))))
+
+    def test_bucketing_improves_padding_efficiency_on_mixed_lengths(self) -> None:
+        lengths = [12, 300, 9, 280, 15, 512, 11, 310]
+        arrival = [list(range(start, start + 4)) for start in range(0, len(lengths), 4)]
+
+        def efficiency(groups: list[list[int]]) -> float:
+            return sum(lengths) / sum(len(group) * max(lengths[i] for i in group) for group in groups)
+
+        self.assertGreater(efficiency(length_buckets(lengths, 4)), efficiency(arrival))
+        self.assertAlmostEqual(padding_efficiency([10, 20]), 0.75)
+        self.assertEqual(padding_efficiency([]), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import caching  # noqa: E402
+from caching import LruCache, SqliteCache, TieredCache, approximate_size, content_digest  # noqa: E402
+
+
+class LruCacheTests(unittest.TestCase):
+    def test_get_many_returns_only_hits(self) -> None:
+        cache: LruCache[str, int] = LruCache(4)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get_many(["a", "c", "b"]), {"a": 1, "b": 2})
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: LruCache[str, int] = LruCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_zero_size_cache_stores_nothing(self) -> None:
+        cache: LruCache[str, int] = LruCache(0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_stats_count_lookups_evictions_and_footprint(self) -> None:
+        cache: LruCache[str, list[float]] = LruCache(2)
+        cache.put("a", [0.1, 0.2, 0.7])
+        cache.put("a", [0.3, 0.3, 0.4])
+        cache.put("b", [0.5, 0.4, 0.1])
+        cache.get("a")
+        cache.get_many(["a", "b", "c"])
+        cache.put("c", [0.2, 0.2, 0.6])
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (3, 1, 1))
+        self.assertEqual((stats.entries, stats.capacity), (2, 2))
+        expected = sum(approximate_size(key) + approximate_size(cache.get(key)) for key in ("b", "c"))
+        self.assertEqual(stats.approximate_bytes, expected)
+        cache.clear()
+        self.assertEqual(cache.stats().approximate_bytes, 0)
+
+    def test_replacing_and_evicting_reuse_the_stored_size(self) -> None:
+        cache: LruCache[str, list[float]] = LruCache(1)
+        with mock.patch.object(caching, "approximate_size", wraps=approximate_size) as measure:
+            cache.put("a", [0.1, 0.2, 0.7])
+            cache.put("a", [0.3, 0.3, 0.4])
+            cache.put("b", [0.5, 0.4, 0.1])
+
+        measured = [call.args[0] for call in measure.call_args_list if not call.args[1:]]
+        self.assertEqual(measured, ["a", [0.1, 0.2, 0.7], "a", [0.3, 0.3, 0.4], "b", [0.5, 0.4, 0.1]])
+        self.assertEqual(cache.stats().approximate_bytes, approximate_size("b") + approximate_size([0.5, 0.4, 0.1]))
+
+
+class PersistentCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "cache.sqlite3"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _tiered(self, store: SqliteCache) -> TieredCache[str, list[float]]:
+        return TieredCache(
+            LruCache(8),
+            store,
+            digest=lambda text: content_digest("enrich", "model", "1.0", text),
+            encode=list,
+            decode=lambda value: [float(item) for item in value],
+        )
+
+    def test_values_survive_a_new_cache_instance(self) -> None:
+        self._tiered(SqliteCache(self.path, max_entries=100)).put("outage", [0.7, 0.2, 0.1])
+        restarted = self._tiered(SqliteCache(self.path, max_entries=100))
+        self.assertEqual(restarted.get_many(["outage", "unknown"]), {"outage": [0.7, 0.2, 0.1]})
+
+    def test_persistent_lookups_count_only_memory_misses(self) -> None:
+        self._tiered(SqliteCache(self.path, max_entries=100)).put("outage", [0.7, 0.2, 0.1])
+        restarted = self._tiered(SqliteCache(self.path, max_entries=100))
+        restarted.get_many(["outage", "unknown"])
+        restarted.get_many(["outage"])
+
+        self.assertEqual(restarted.persistent_lookups(), (1, 1))
+        self.assertEqual(restarted.memory.stats().hits, 1)
+
+    def test_memory_only_entries_are_not_persisted(self) -> None:
+        self._tiered(SqliteCache(self.path, max_entries=100)).put("fallback", [0.1, 0.8, 0.1], persist=False)
+        restarted = self._tiered(SqliteCache(self.path, max_entries=100))
+        self.assertIsNone(restarted.get("fallback"))
+
+    def test_eviction_bounds_entry_count(self) -> None:
+        store = SqliteCache(self.path, max_entries=10)
+        store.put_many((f"key-{index}", "1") for index in range(25))
+        store.evict()
+        self.assertEqual(store.count(), 10)
+        self.assertEqual(store.evictions, 15)
+        self.assertIn("key-24", store.get_many(["key-24"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
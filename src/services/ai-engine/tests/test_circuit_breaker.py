@@ -0,0 +1,59 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker  # noqa: E402
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.transitions: list[tuple[str, str]] = []
+        self.breaker = CircuitBreaker(
+            failure_threshold=3,
+            reset_timeout_seconds=30,
+            clock=lambda: self.now,
+            on_state_change=lambda previous, state: self.transitions.append((previous, state)),
+        )
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        for _ in range(2):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+        self.breaker.record_success()
+        for _ in range(3):
+            self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_half_open_allows_one_trial(self) -> None:
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.now = 31.0
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.transitions, [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)])
+
+    def test_failed_trial_reopens_for_a_new_cooldown(self) -> None:
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.now = 31.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+
+        self.now = 40.0
+        self.assertFalse(self.breaker.allow())
+        self.now = 62.0
+        self.assertTrue(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from fastapi.testclient import TestClient
+
+    import main
+    from executor import InferenceExecutor
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+DOCUMENTS = {"documents": [{"source": "status", "title": "EC2 capacity shortage and outage in us-east-1"}]}
+
+
+if HAS_SERVICE_DEPENDENCIES:
+
+    class SlowEnricher(main.HeuristicEnricher):
+        provider_name = "finbert"
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        def enrich_batch(self, documents):
+            self.calls += 1
+            return super().enrich_batch(documents)
+
+    class ThreadRecordingSummarizer(main.HeuristicSummarizer):
+        def __init__(self) -> None:
+            super().__init__(max_chars=600, cache_size=16)
+            self.threads: list[str] = []
+
+        def summarize_many(self, texts, max_chars):
+            self.threads.append(threading.current_thread().name)
+            return super().summarize_many(texts, max_chars)
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class DeadlineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep the lifespan from loading FinBERT; the test installs its own enricher.
+        self.provider = main.ENRICHMENT_PROVIDER
+        main.ENRICHMENT_PROVIDER = "heuristic"
+        self.client = TestClient(main.app)
+        self.client.__enter__()
+        self.enricher = SlowEnricher()
+        main.app.state.enricher = self.enricher
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        main.ENRICHMENT_PROVIDER = self.provider
+
+    def test_expired_deadline_returns_504_without_inference(self) -> None:
+        response = self.client.post(
+            "/signals/enrich/batch", json=DOCUMENTS, headers={main.REQUEST_TIMEOUT_HEADER: "0"}
+        )
+
+        self.assertEqual(response.status_code, 504)
+        self.assertEqual(self.enricher.calls, 0)
+
+    def test_long_queue_wait_degrades_to_heuristics(self) -> None:
+        executor: InferenceExecutor = main.app.state.inference_executor
+        executor.estimated_wait_seconds = lambda: 10.0  # type: ignore[method-assign]
+
+        response = self.client.post(
+            "/signals/enrich/batch", json=DOCUMENTS, headers={main.REQUEST_TIMEOUT_HEADER: "500"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["degraded"])
+        self.assertEqual(response.headers["X-Degraded"], "true")
+        self.assertEqual(self.enricher.calls, 0)
+
+    def test_budget_above_queue_wait_uses_model(self) -> None:
+        response = self.client.post(
+            "/signals/enrich/batch", json=DOCUMENTS, headers={main.REQUEST_TIMEOUT_HEADER: "5000"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["degraded"])
+        self.assertNotIn("X-Degraded", response.headers)
+        self.assertEqual(self.enricher.calls, 1)
+
+    def test_summaries_run_on_their_own_executor(self) -> None:
+        summarizer = ThreadRecordingSummarizer()
+        main.app.state.summarizer = summarizer
+
+        response = self.client.post("/signals/summarize", json=DOCUMENTS, headers={main.REQUEST_TIMEOUT_HEADER: "5000"})
+        expired = self.client.post("/signals/summarize", json=DOCUMENTS, headers={main.REQUEST_TIMEOUT_HEADER: "0"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(expired.status_code, 504)
+        self.assertEqual(len(summarizer.threads), 1)
+        self.assertTrue(summarizer.threads[0].startswith("summarizer"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from executor import DeadlineExceededError, InferenceExecutor, QueueFullError  # noqa: E402
+
+
+class InferenceExecutorTests(unittest.TestCase):
+    def test_runs_work_off_the_event_loop(self) -> None:
+        executor = InferenceExecutor(max_workers=2, max_queue=2)
+        caller_thread = threading.get_ident()
+
+        async def scenario() -> int:
+            return await executor.run(threading.get_ident)
+
+        self.assertNotEqual(asyncio.run(scenario()), caller_thread)
+        executor.shutdown()
+
+    def test_rejects_when_workers_and_queue_are_full(self) -> None:
+        rejections: list[int] = []
+        executor = InferenceExecutor(max_workers=1, max_queue=1, on_reject=lambda: rejections.append(1))
+        release = threading.Event()
+
+        async def scenario() -> list[object]:
+            first = asyncio.ensure_future(executor.run(release.wait, 5))
+            second = asyncio.ensure_future(executor.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            self.assertEqual(executor.queue_depth, 1)
+            with self.assertRaises(QueueFullError) as raised:
+                await executor.run(release.wait, 5)
+            self.assertGreaterEqual(raised.exception.retry_after_seconds, 1)
+            release.set()
+            return await asyncio.gather(first, second)
+
+        self.assertEqual(asyncio.run(scenario()), [True, True])
+        self.assertEqual(rejections, [1])
+        self.assertEqual(executor.rejected, 1)
+        self.assertEqual(executor.queue_depth, 0)
+        executor.shutdown()
+
+    def test_drops_queued_job_whose_deadline_passed(self) -> None:
+        executor = InferenceExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        ran: list[int] = []
+
+        async def scenario() -> None:
+            blocker = asyncio.ensure_future(executor.run(release.wait, 5))
+            queued = asyncio.ensure_future(
+                executor.run(ran.append, 1, deadline=time.perf_counter() + 0.02)
+            )
+            await asyncio.sleep(0.05)
+            release.set()
+            with self.assertRaises(DeadlineExceededError):
+                await queued
+            await blocker
+
+        asyncio.run(scenario())
+        self.assertEqual(ran, [])
+        self.assertEqual(executor.expired, 1)
+        self.assertEqual(executor.queue_depth, 0)
+        executor.shutdown()
+
+    def test_cancelled_queued_job_releases_its_slot(self) -> None:
+        executor = InferenceExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        ran: list[int] = []
+
+        async def scenario() -> None:
+            blocker = asyncio.ensure_future(executor.run(release.wait, 5))
+            queued = asyncio.ensure_future(executor.run(ran.append, 1))
+            await asyncio.sleep(0.05)
+            self.assertEqual(executor.queue_depth, 1)
+            queued.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            await blocker
+
+        asyncio.run(scenario())
+        self.assertEqual(ran, [])
+        self.assertEqual(executor.queue_depth, 0)
+        self.assertEqual(executor.estimated_wait_seconds(), 0.0)
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
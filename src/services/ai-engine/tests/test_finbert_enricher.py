@@ -0,0 +1,254 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    import main
+    import onnx_export
+    from executor import InferenceExecutor
+    from main import FinbertEnricher, OnnxFinbertEnricher, SignalDocument, normalize_vector
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+try:
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    HAS_TRANSFORMERS = True
+except ImportError:
+    HAS_TRANSFORMERS = False
+
+try:
+    import onnxruntime  # noqa: F401
+
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
+
+class TextIdTokenizer:
+    """Encodes each distinct text as a run of one id, so ``_forward`` can tell texts apart."""
+
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+
+    def __call__(self, texts: list[str], truncation: bool = True) -> dict[str, list[list[int]]]:
+        encoded = []
+        for text in texts:
+            text_id = self.ids.setdefault(text, len(self.ids) + 1)
+            encoded.append([text_id] * len(text.split()))
+        return {"input_ids": encoded}
+
+    def pad(self, features: dict[str, list[list[int]]], return_tensors: str) -> dict[str, list[list[int]]]:
+        width = max(len(ids) for ids in features["input_ids"])
+        return {"input_ids": [ids + [0] * (width - len(ids)) for ids in features["input_ids"]]}
+
+
+def scores_for(text_id: int) -> list[float]:
+    return [text_id / 10, 0.5, 1 - text_id / 10]
+
+
+if HAS_SERVICE_DEPENDENCIES:
+
+    class StubFinbertEnricher(FinbertEnricher):
+        def _load_model(self, model_id: str) -> None:
+            self._tokenizer = TextIdTokenizer()
+            self.inferred: list[list[str]] = []
+            self.forward_sizes: list[int] = []
+
+        def _infer(self, texts: list[str]) -> list[list[float]]:
+            self.inferred.append(list(texts))
+            return super()._infer(texts)
+
+        def _forward(self, features) -> list[list[float]]:
+            self.forward_sizes.append(len(features["input_ids"]))
+            return [scores_for(ids[0]) for ids in features["input_ids"]]
+
+        def expected(self, text: str) -> list[float]:
+            return normalize_vector(scores_for(self._tokenizer.ids[text]))
+
+
+def documents(*titles: str) -> list["SignalDocument"]:
+    return [SignalDocument(source="status", title=title) for title in titles]
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class FinbertEnricherCachingTests(unittest.TestCase):
+    def test_batch_scores_each_distinct_miss_once_in_bounded_chunks(self) -> None:
+        enricher = StubFinbertEnricher(model_id="test", max_chars=2000, cache_size=16, batch_size=2)
+        titles = (
+            "EC2 outage",
+            "capacity shortage in zone a",
+            "EC2 outage",
+            "spot prices stable",
+            "capacity shortage in zone a",
+        )
+
+        results = enricher.enrich_batch(documents(*titles))
+
+        self.assertEqual(enricher.inferred, [["EC2 outage", "capacity shortage in zone a", "spot prices stable"]])
+        self.assertEqual(enricher.forward_sizes, [2, 1])
+        self.assertEqual([result.s_v for result in results], [enricher.expected(title) for title in titles])
+
+    def test_cached_texts_skip_the_model_and_keep_their_position(self) -> None:
+        enricher = StubFinbertEnricher(model_id="test", max_chars=2000, cache_size=16, batch_size=2)
+        enricher.enrich_batch(documents("EC2 outage", "spot prices stable"))
+
+        titles = ("spot prices stable", "GPU quota delays expected", "EC2 outage")
+        results = enricher.enrich_batch(documents(*titles))
+
+        self.assertEqual(enricher.inferred[1:], [["GPU quota delays expected"]])
+        self.assertEqual([result.s_v for result in results], [enricher.expected(title) for title in titles])
+
+    def test_fully_cached_batch_never_calls_the_model(self) -> None:
+        enricher = StubFinbertEnricher(model_id="test", max_chars=2000, cache_size=16)
+        batch = documents("EC2 outage", "spot prices stable")
+        first = enricher.enrich_batch(batch)
+
+        second = enricher.enrich_batch(batch)
+
+        self.assertEqual(len(enricher.inferred), 1)
+        self.assertEqual([result.s_v for result in second], [result.s_v for result in first])
+
+    def test_more_requests_than_workers_share_one_forward_pass(self) -> None:
+        enricher = StubFinbertEnricher(
+            model_id="test", max_chars=2000, cache_size=16, batch_max_size=4, batch_max_wait_ms=5000
+        )
+        self.addCleanup(enricher.close)
+        executor = InferenceExecutor(max_workers=1, max_queue=8)
+        self.addCleanup(executor.shutdown)
+        titles = ["EC2 outage", "spot prices stable", "GPU quota delays expected", "capacity shortage"]
+
+        async def request(title: str) -> list[float]:
+            # The worker is released once the text is queued, so the next request can join the batch.
+            pending = await executor.run(enricher.start_enrich_batch, documents(title))
+            return (await pending.wait())[0].s_v
+
+        async def scenario() -> list[list[float]]:
+            return await asyncio.gather(*(request(title) for title in titles))
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual(enricher.forward_sizes, [4])
+        self.assertEqual(sorted(enricher.inferred[0]), sorted(titles))
+        self.assertEqual(results, [enricher.expected(title) for title in titles])
+
+
+class TinyBertTestCase(unittest.TestCase):
+    """Saves a tiny randomly initialised BERT to a temporary directory as ``model_dir``."""
+
+    # FinBERT's own label order, which differs from the negative/neutral/positive vector order.
+    id2label = {0: "positive", 1: "negative", 2: "neutral"}
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        model_dir = Path(self._tmp.name)
+        words = "ec2 outage capacity shortage spot prices stable gpu quota delays expected".split()
+        vocab = model_dir / "vocab.txt"
+        vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *words]), encoding="utf-8")
+        BertTokenizerFast(vocab_file=str(vocab)).save_pretrained(model_dir)
+        torch.manual_seed(0)
+        config = BertConfig(
+            vocab_size=5 + len(words),
+            hidden_size=16,
+            num_hidden_layers=1,
+            num_attention_heads=2,
+            intermediate_size=32,
+            num_labels=3,
+            id2label=self.id2label,
+            label2id={label: index for index, label in self.id2label.items()},
+        )
+        self.model = BertForSequenceClassification(config).eval()
+        self.model.save_pretrained(model_dir)
+        self.tokenizer = BertTokenizerFast.from_pretrained(model_dir)
+        self.model_dir = str(model_dir)
+        self.cache_dir = str(Path(self._tmp.name) / "onnx")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+
+@unittest.skipUnless(
+    HAS_SERVICE_DEPENDENCIES and HAS_TRANSFORMERS, "ai-engine service dependencies or transformers are not installed"
+)
+class FinbertEnricherModelTests(TinyBertTestCase):
+    """Runs the real tokenizer and model path on the tiny local BERT."""
+
+    def test_scores_follow_label_order_and_input_order(self) -> None:
+        enricher = FinbertEnricher(model_id=self.model_dir, max_chars=2000, cache_size=16, batch_size=2)
+        titles = ["spot prices stable", "ec2 outage", "gpu quota delays expected for capacity", "ec2 outage"]
+
+        results = enricher.enrich_batch(documents(*titles))
+
+        for title, result in zip(titles, results):
+            with torch.inference_mode():
+                logits = self.model(**self.tokenizer(title, return_tensors="pt")).logits[0]
+            probabilities = torch.softmax(logits, dim=-1).tolist()
+            expected = [probabilities[1], probabilities[2], probabilities[0]]
+            for actual, wanted in zip(result.s_v, expected):
+                self.assertAlmostEqual(actual, wanted, places=5)
+
+
+@unittest.skipUnless(
+    HAS_SERVICE_DEPENDENCIES and HAS_TRANSFORMERS and HAS_ONNXRUNTIME,
+    "ai-engine service dependencies, transformers or onnxruntime are not installed",
+)
+class OnnxFinbertEnricherTests(TinyBertTestCase):
+    titles = ["spot prices stable", "ec2 outage", "gpu quota delays expected for capacity"]
+
+    def build(self, quantize: bool) -> "OnnxFinbertEnricher":
+        return OnnxFinbertEnricher(
+            model_id=self.model_dir, max_chars=2000, cache_size=16, cache_dir=self.cache_dir, quantize=quantize
+        )
+
+    def test_fp32_and_int8_exports_match_the_torch_model(self) -> None:
+        expected = FinbertEnricher(model_id=self.model_dir, max_chars=2000, cache_size=16).enrich_batch(
+            documents(*self.titles)
+        )
+
+        for quantize, places in ((False, 5), (True, 2)):
+            with self.subTest(quantize=quantize):
+                results = self.build(quantize).enrich_batch(documents(*self.titles))
+                for result, wanted in zip(results, expected):
+                    for actual, target in zip(result.s_v, wanted.s_v):
+                        self.assertAlmostEqual(actual, target, places=places)
+
+    def test_second_build_reuses_the_cached_export(self) -> None:
+        self.build(quantize=True)
+        target_dir = onnx_export.artifact_dir(self.cache_dir, self.model_dir)
+        modified = {path.name: path.stat().st_mtime_ns for path in target_dir.glob("*.onnx")}
+
+        with mock.patch.multiple(
+            onnx_export,
+            _export_fp32=mock.Mock(side_effect=AssertionError("re-exported")),
+            _quantize_int8=mock.Mock(side_effect=AssertionError("re-quantized")),
+        ):
+            self.build(quantize=True)
+            self.build(quantize=False)
+
+        self.assertEqual(set(modified), {"model.onnx", "model.int8.onnx"})
+        self.assertEqual({path.name: path.stat().st_mtime_ns for path in target_dir.glob("*.onnx")}, modified)
+
+    def test_session_is_rebuilt_in_a_forked_process(self) -> None:
+        enricher = self.build(quantize=False)
+        parent_session = enricher._session_for_process()
+
+        with mock.patch.object(main.os, "getpid", return_value=os.getpid() + 1):
+            child_session = enricher._session_for_process()
+            self.assertIs(enricher._session_for_process(), child_session)
+            results = enricher.enrich_batch(documents(*self.titles))
+
+        self.assertIsNot(child_session, parent_session)
+        self.assertEqual(len(results), len(self.titles))
+
+
+if __name__ == "__main__":
+    unittest.main()
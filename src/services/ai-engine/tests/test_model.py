@@ -4,7 +4,14 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from model import RiskScorer  # noqa: E402
+from model import IncrementalRiskScorer, RiskScorer  # noqa: E402
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 
 class RiskScorerTests(unittest.TestCase):
@@ -42,5 +49,82 @@ class RiskScorerTests(unittest.TestCase):
         self.assertEqual(result.Reason, "Stable")
 
 
+class IncrementalRiskScorerTests(unittest.TestCase):
+    def test_updates_match_full_history_scoring(self) -> None:
+        scorer = RiskScorer()
+        incremental = IncrementalRiskScorer(scorer)
+        updates = [[1.0, 1.0], [None, 1.0], [1.0] * 6, [1.6], [float("nan")], [1.0, 20.0] * 5, [1.0, 1.01]]
+        history: list = []
+        for update in updates:
+            history.extend(update)
+            assessment, samples = incremental.update("i-1", update, False, 0.8)
+            self.assertEqual(assessment, scorer.assess_risk(history, False, 0.8))
+        self.assertEqual(samples, 10)
+
+    def test_reset_and_rebalance(self) -> None:
+        incremental = IncrementalRiskScorer()
+        incremental.update("i-1", [1.0, 1.0, 1.0], False, 0.8)
+
+        assessment, samples = incremental.update("i-1", [1.0], True, 0.8, reset=True)
+
+        self.assertEqual(assessment.Reason, "Cloud Provider Signal")
+        self.assertEqual(samples, 1)
+
+    def test_idle_and_excess_series_are_evicted(self) -> None:
+        now = [0.0]
+        incremental = IncrementalRiskScorer(max_series=2, idle_ttl_seconds=60, clock=lambda: now[0])
+        incremental.update("a", [1.0], False, 0.8)
+        incremental.update("b", [1.0], False, 0.8)
+        incremental.update("c", [1.0], False, 0.8)
+        self.assertEqual((incremental.samples("a"), len(incremental)), (0, 2))
+
+        now[0] = 61.0
+        incremental.update("d", [1.0], False, 0.8)
+        self.assertEqual(len(incremental), 1)
+        self.assertEqual(incremental.samples("d"), 1)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class RiskScorerBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scorer = RiskScorer()
+
+    def test_batch_matches_scalar_for_ragged_histories(self) -> None:
+        histories = [
+            [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.6],
+            [1.0, 20.0, 1.0, 20.0, 1.0, 20.0, 1.0, 20.0, 1.0, 1.0],
+            [1.0, 1.02, 1.01, 0.99, 1.0, 1.01],
+            [1.0, 1.2],
+            [float("nan"), 1.0, float("inf"), 1.0, 1.0],
+            [5.0] * 30 + [1.0, 1.0, 1.0],
+            [],
+        ]
+        width = max(len(history) for history in histories)
+        prices = np.full((len(histories), width), np.nan)
+        mask = np.zeros((len(histories), width), dtype=bool)
+        for row, history in enumerate(histories):
+            prices[row, : len(history)] = history
+            mask[row, : len(history)] = True
+        rebalance = [False] * (len(histories) - 1) + [True]
+
+        results = self.scorer.assess_risk_batch(prices, mask, rebalance_signals=rebalance)
+
+        expected = [
+            self.scorer.assess_risk(history, signal, 0.8) for history, signal in zip(histories, rebalance)
+        ]
+        self.assertEqual(results, expected)
+
+    def test_batch_rechecks_rows_on_threshold_boundaries(self) -> None:
+        # Exactly 20% spike and exactly 5.0 volatility must not flip on rounding noise.
+        rng = np.random.default_rng(11)
+        rows = [[1.0] * 9 + [1.2 + delta] for delta in (-2e-16, 0.0, 2e-16)]
+        rows += [[offset - 5.0, offset + 5.0] * 5 for offset in rng.uniform(-50, 50, size=20)]
+        rows += rng.uniform(0.5, 2.0, size=(50, 10)).tolist()
+
+        results = self.scorer.assess_risk_batch(np.asarray(rows))
+
+        self.assertEqual(results, [self.scorer.assess_risk(row, False, 0.8) for row in rows])
+
+
 if __name__ == "__main__":
     unittest.main()
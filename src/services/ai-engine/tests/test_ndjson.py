@@ -0,0 +1,38 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ndjson import NdjsonReader  # noqa: E402
+
+
+class NdjsonReaderTests(unittest.TestCase):
+    def test_lines_split_across_chunks_are_reassembled(self) -> None:
+        reader = NdjsonReader(max_line_bytes=1024)
+        body = b'{"title": "a"}\n\n{"title": "b"}\n{"title": "c"}'
+        records = []
+        for start in range(0, len(body), 5):
+            records.extend(reader.feed(body[start : start + 5]))
+        records.extend(reader.finish())
+
+        self.assertEqual([record.index for record in records], [0, 1, 2])
+        self.assertEqual([record.value["title"] for record in records], ["a", "b", "c"])
+        self.assertTrue(all(record.error is None for record in records))
+
+    def test_invalid_and_oversized_lines_become_errors(self) -> None:
+        reader = NdjsonReader(max_line_bytes=16)
+        records = reader.feed(b'{"title": \n')
+        records += reader.feed(b'{"title": "' + b"x" * 40)
+        records += reader.feed(b'"}\n{"ok": 1}\n')
+        records += reader.finish()
+
+        self.assertEqual([record.index for record in records], [0, 1, 2])
+        self.assertIn("Invalid JSON", records[0].error)
+        self.assertIn("exceeds 16 bytes", records[1].error)
+        self.assertEqual(records[2].value, {"ok": 1})
+        self.assertEqual(reader.records_read, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from near_duplicate import NearDuplicateIndex, hamming_distance  # noqa: E402
+
+try:
+    import numpy  # noqa: F401
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import main
+    from main import FinbertEnricher, SignalDocument
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+BASE = (
+    "AWS us-east-1 is experiencing elevated error rates for EC2 instance launches "
+    "and capacity shortages in several availability zones while engineers investigate"
+)
+VARIANT = BASE.replace("several", "multiple")
+UNRELATED = (
+    "Quarterly earnings beat expectations as cloud revenue grows strongly and "
+    "margins improve across every region according to the company"
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class NearDuplicateIndexTests(unittest.TestCase):
+    def test_similar_text_reuses_value_and_unrelated_text_does_not(self) -> None:
+        index: NearDuplicateIndex[str] = NearDuplicateIndex(max_distance=8)
+        index.add(index.fingerprint(BASE), "base")
+
+        self.assertLessEqual(hamming_distance(index.fingerprint(BASE), index.fingerprint(VARIANT)), 8)
+        self.assertEqual(index.lookup(index.fingerprint(VARIANT))[0], "base")
+        self.assertIsNone(index.lookup(index.fingerprint(UNRELATED)))
+
+    def test_lookup_finds_every_fingerprint_within_max_distance(self) -> None:
+        index: NearDuplicateIndex[int] = NearDuplicateIndex(max_distance=3)
+        stored = 0x0123456789ABCDEF
+        index.add(stored, 1)
+
+        # Flip bits spread across bands; banding must still surface the entry.
+        for bits in ((0,), (5, 40), (1, 22, 63), (15, 16, 47)):
+            probe = stored
+            for bit in bits:
+                probe ^= 1 << bit
+            self.assertEqual(index.lookup(probe), (1, len(bits)))
+        self.assertIsNone(index.lookup(stored ^ 0b1111))
+
+    def test_short_texts_are_not_fingerprinted(self) -> None:
+        index: NearDuplicateIndex[str] = NearDuplicateIndex(min_features=8)
+
+        self.assertIsNone(index.fingerprint("EC2 outage"))
+        self.assertIsNotNone(index.fingerprint(BASE))
+
+    def test_entries_expire_and_are_bounded(self) -> None:
+        clock = FakeClock()
+        index: NearDuplicateIndex[int] = NearDuplicateIndex(max_entries=2, ttl_seconds=10, clock=clock)
+        low, high, ones = 0x00000000FFFFFFFF, 0xFFFFFFFF00000000, 0xFFFFFFFFFFFFFFFF
+        index.add(0, 1)
+        index.add(low, 2)
+        index.add(high, 3)
+
+        self.assertEqual(len(index), 2)
+        self.assertIsNone(index.lookup(0))
+        self.assertEqual(index.lookup(ones ^ high ^ 1), (2, 1))
+        clock.now = 11
+        self.assertIsNone(index.lookup(high))
+        self.assertEqual(len(index), 0)
+        stats = index.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (1, 2, 3))
+        self.assertEqual((stats.entries, stats.approximate_bytes), (0, 0))
+
+    def test_rejects_distance_that_defeats_banding(self) -> None:
+        with self.assertRaises(ValueError):
+            NearDuplicateIndex(max_distance=32)
+
+
+if HAS_SERVICE_DEPENDENCIES:
+
+    class CountingEnricher(FinbertEnricher):
+        def _load_model(self, model_id: str) -> None:
+            self.inferred: list[str] = []
+
+        def _infer(self, texts: list[str]) -> list[list[float]]:
+            self.inferred.extend(texts)
+            return [[0.6, 0.3, 0.1] for _ in texts]
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES and HAS_NUMPY, "ai-engine service dependencies are not installed")
+class EnricherNearDuplicateTests(unittest.TestCase):
+    def test_near_duplicate_skips_inference(self) -> None:
+        enricher = CountingEnricher(
+            model_id="test",
+            max_chars=2000,
+            cache_size=16,
+            near_duplicates=NearDuplicateIndex(max_distance=8),
+        )
+        first = enricher.enrich_batch([SignalDocument(source="status", title=BASE)])
+        second = enricher.enrich_batch(
+            [SignalDocument(source="status", title=VARIANT), SignalDocument(source="status", title=UNRELATED)]
+        )
+
+        self.assertEqual(enricher.inferred, [BASE, UNRELATED])
+        self.assertEqual(second[0].s_v, first[0].s_v)
+
+    def test_invalid_settings_fail_instead_of_falling_back_to_heuristics(self) -> None:
+        with mock.patch.multiple(
+            main, ENRICHMENT_PROVIDER="finbert", ENRICHMENT_NEAR_DUP=True, ENRICHMENT_NEAR_DUP_MAX_DISTANCE=64
+        ), mock.patch.object(main, "FinbertEnricher") as model:
+            with self.assertRaises(ValueError):
+                main.build_enricher()
+
+        model.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from profiling import (  # noqa: E402
+    Profile,
+    RequestProfiler,
+    RequestProfilingMiddleware,
+    SlowRequestRecorder,
+    StackSampler,
+)
+
+try:
+    from fastapi.testclient import TestClient
+
+    import main
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+def spin_in_profiled_function(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def make_profile(*stacks: tuple[str, ...]) -> Profile:
+    profile = Profile(interval_seconds=0.01, started_at=0.0)
+    for stack in stacks:
+        profile.counts[stack] += 1
+        profile.seconds[stack] += 0.01
+    return profile
+
+
+class StackSamplerTests(unittest.TestCase):
+    def test_samples_busy_thread_and_skips_idle_waits(self) -> None:
+        stop = threading.Event()
+        busy = threading.Thread(target=spin_in_profiled_function, args=(stop,), name="busy")
+        idle = threading.Thread(target=stop.wait, name="idle")
+        busy.start()
+        idle.start()
+        sampler = StackSampler(interval_seconds=0.002).start()
+        time.sleep(0.2)
+        profile = sampler.stop()
+        stop.set()
+        busy.join()
+        idle.join()
+
+        threads = {stack[0] for stack in profile.counts}
+        self.assertIn("busy", threads)
+        self.assertNotIn("idle", threads)
+        self.assertNotIn("stack-sampler", threads)
+        self.assertIn("spin_in_profiled_function (test_profiling.py:", profile.collapsed())
+
+    def test_speedscope_output_indexes_shared_frames(self) -> None:
+        profile = make_profile(
+            ("MainThread", "main (app.py:1)", "work (app.py:10)"),
+            ("MainThread", "main (app.py:1)", "work (app.py:10)"),
+            ("worker", "main (app.py:1)"),
+        )
+
+        document = profile.speedscope("test")
+
+        self.assertEqual(
+            [frame["name"] for frame in document["shared"]["frames"]],
+            ["main", "work"],
+        )
+        profiles = {item["name"]: item for item in document["profiles"]}
+        self.assertEqual(profiles["MainThread"]["samples"], [[0, 1]])
+        self.assertEqual(profiles["MainThread"]["weights"], [0.02])
+        self.assertEqual(profiles["worker"]["samples"], [[0]])
+        self.assertEqual(profile.collapsed().splitlines()[0], "MainThread;main (app.py:1);work (app.py:10) 2")
+
+
+class SlowRequestRecorderTests(unittest.TestCase):
+    def test_keeps_only_the_slowest_profiles_on_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = SlowRequestRecorder(directory, keep=2)
+            profile = make_profile(("MainThread", "main (app.py:1)"))
+
+            self.assertIsNotNone(recorder.record("POST /signals/enrich", 30.0, profile))
+            self.assertIsNotNone(recorder.record("POST /signals/enrich", 10.0, profile))
+            self.assertIsNotNone(recorder.record("POST /signals/enrich", 50.0, profile))
+            self.assertIsNone(recorder.record("POST /signals/enrich", 5.0, profile))
+
+            kept = recorder.paths()
+            self.assertEqual([Path(path).name.split("-")[2] for path in kept], ["50ms", "30ms"])
+            self.assertEqual(sorted(os.listdir(directory)), sorted(Path(path).name for path in kept))
+
+
+class RequestProfilerTests(unittest.TestCase):
+    def test_profiles_one_in_n_requests(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = RequestProfiler(3, SlowRequestRecorder(directory), interval_seconds=0.001)
+            selected = []
+            for index in range(6):
+                sampler = profiler.begin()
+                if sampler is not None:
+                    selected.append(index)
+                    profiler.finish(sampler, "GET /", float(index))
+
+            self.assertEqual(selected, [2, 5])
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+
+class ThreadRecordingProfiler(RequestProfiler):
+    def finish(self, sampler: StackSampler, name: str, duration_ms: float) -> str | None:
+        self.finish_thread = threading.get_ident()
+        return super().finish(sampler, name, duration_ms)
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class RequestProfilingMiddlewareTests(unittest.TestCase):
+    def test_finishes_the_profile_off_the_event_loop(self) -> None:
+        async def endpoint(scope, receive, send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        async def noop_send(message) -> None:
+            return None
+
+        async def scenario(middleware: RequestProfilingMiddleware) -> int:
+            await middleware({"type": "http", "method": "GET", "path": "/"}, None, noop_send)
+            return threading.get_ident()
+
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = ThreadRecordingProfiler(1, SlowRequestRecorder(directory), interval_seconds=0.001)
+
+            loop_thread = asyncio.run(scenario(RequestProfilingMiddleware(endpoint, profiler)))
+
+            self.assertNotEqual(profiler.finish_thread, loop_thread)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            next_sampler = profiler.begin()
+            self.assertIsNotNone(next_sampler)
+            next_sampler.stop()
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class DebugProfileEndpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = main.ENRICHMENT_PROVIDER
+        self.token = main.DEBUG_TOKEN
+        main.ENRICHMENT_PROVIDER = "heuristic"
+        self.client = TestClient(main.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        main.ENRICHMENT_PROVIDER = self.provider
+        main.DEBUG_TOKEN = self.token
+
+    def test_endpoint_is_hidden_without_a_configured_token(self) -> None:
+        main.DEBUG_TOKEN = ""
+
+        response = self.client.get("/debug/profile", params={"seconds": 0.05})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_requires_matching_bearer_token(self) -> None:
+        main.DEBUG_TOKEN = "secret"
+
+        missing = self.client.get("/debug/profile", params={"seconds": 0.05})
+        wrong = self.client.get(
+            "/debug/profile", params={"seconds": 0.05}, headers={"Authorization": "Bearer nope"}
+        )
+
+        self.assertEqual(missing.status_code, 401)
+        self.assertEqual(wrong.status_code, 401)
+
+    def test_returns_collapsed_stacks_and_speedscope(self) -> None:
+        main.DEBUG_TOKEN = "secret"
+        headers = {"Authorization": "Bearer secret"}
+
+        collapsed = self.client.get("/debug/profile", params={"seconds": 0.05, "idle": "true"}, headers=headers)
+        speedscope = self.client.get(
+            "/debug/profile", params={"seconds": 0.05, "format": "speedscope"}, headers=headers
+        )
+        too_long = self.client.get("/debug/profile", params={"seconds": 3600}, headers=headers)
+
+        self.assertEqual(collapsed.status_code, 200)
+        self.assertTrue(collapsed.text.strip())
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed.text.splitlines()))
+        self.assertEqual(speedscope.status_code, 200)
+        self.assertEqual(speedscope.json()["$schema"], "https://www.speedscope.app/file-format-schema.json")
+        self.assertEqual(too_long.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from fastapi.testclient import TestClient
+
+    import main
+    from main import HeuristicEnricher
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+ENRICH_BODY = {"documents": [{"source": "status", "title": "EC2 capacity shortage in us-east-1"}]}
+
+if HAS_SERVICE_DEPENDENCIES:
+
+    class ModelEnricher(HeuristicEnricher):
+        provider_name = "finbert"
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.warmed_up: list[int] = []
+            self.enrich_calls = 0
+            self.closed = False
+
+        def warmup(self, sequence_lengths) -> None:
+            self.warmed_up = list(sequence_lengths)
+
+        def enrich(self, documents):
+            self.enrich_calls += 1
+            return super().enrich(documents)
+
+        def close(self) -> None:
+            self.closed = True
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class BackgroundLoadingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = main.ENRICHMENT_PROVIDER
+        self.background = main.ENRICHMENT_BACKGROUND_LOAD
+        self.preloaded = main.preloaded_state
+        main.ENRICHMENT_PROVIDER = "finbert"
+        main.ENRICHMENT_BACKGROUND_LOAD = True
+        main.preloaded_state = None
+        self.release = threading.Event()
+
+    def tearDown(self) -> None:
+        self.release.set()
+        main.ENRICHMENT_PROVIDER = self.provider
+        main.ENRICHMENT_BACKGROUND_LOAD = self.background
+        main.preloaded_state = self.preloaded
+
+    def start(self, enricher: "HeuristicEnricher") -> "TestClient":
+        def build_enricher(near_duplicates=None) -> "HeuristicEnricher":
+            self.release.wait(5)
+            return enricher
+
+        patcher = mock.patch.object(main, "build_enricher", side_effect=build_enricher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        client = TestClient(main.app)
+        client.__enter__()
+        self.addCleanup(client.__exit__, None, None, None)
+        return client
+
+    def wait_until_ready(self) -> None:
+        deadline = time.monotonic() + 5
+        while main.app.state.readiness.status != "ready" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_serves_heuristics_while_loading_then_swaps_in_the_model(self) -> None:
+        model = ModelEnricher()
+        client = self.start(model)
+
+        loading = client.get("/readyz")
+        health = client.get("/healthz")
+        enriched = client.post("/signals/enrich", json=ENRICH_BODY)
+
+        self.assertEqual(loading.status_code, 503)
+        self.assertEqual(loading.json()["status"], "loading")
+        self.assertEqual(loading.json()["activeProvider"], "heuristic")
+        self.assertEqual(health.status_code, 200)
+        self.assertEqual(health.json()["status"], "ok")
+        self.assertEqual(enriched.status_code, 200)
+        self.assertIsInstance(main.app.state.enricher, HeuristicEnricher)
+        self.assertNotIsInstance(main.app.state.enricher, ModelEnricher)
+        self.assertEqual(model.enrich_calls, 0)
+
+        self.release.set()
+        self.wait_until_ready()
+        ready = client.get("/readyz")
+        client.post("/signals/enrich", json=ENRICH_BODY)
+
+        self.assertEqual(ready.status_code, 200)
+        self.assertEqual(ready.json()["activeProvider"], "finbert")
+        self.assertIsNone(ready.json()["detail"])
+        self.assertIsNotNone(ready.json()["readyAt"])
+        self.assertIs(main.app.state.enricher, model)
+        self.assertEqual(model.warmed_up, main.ENRICHMENT_WARMUP_LENGTHS)
+        self.assertEqual(model.enrich_calls, 1)
+        self.assertEqual(client.get("/healthz").status_code, 200)
+
+    def test_reports_detail_when_the_model_falls_back_to_heuristics(self) -> None:
+        client = self.start(HeuristicEnricher())
+
+        self.release.set()
+        self.wait_until_ready()
+        ready = client.get("/readyz")
+
+        self.assertEqual(ready.status_code, 200)
+        self.assertEqual(ready.json()["targetProvider"], "finbert")
+        self.assertEqual(ready.json()["activeProvider"], "heuristic")
+        self.assertEqual(ready.json()["detail"], "finbert unavailable; serving heuristic")
+        self.assertEqual(client.get("/healthz").json()["detail"], "finbert unavailable; serving heuristic")
+
+    def test_model_loaded_after_shutdown_is_closed_instead_of_installed(self) -> None:
+        model = ModelEnricher()
+        earlier = set(threading.enumerate())
+        self.start(model)
+        (loader,) = [thread for thread in set(threading.enumerate()) - earlier if thread.name == "enricher-loader"]
+        heuristic = main.app.state.enricher
+
+        self.doCleanups()  # Runs the lifespan shutdown while the loader is still building the model.
+        self.release.set()
+        loader.join(5)
+
+        self.assertFalse(loader.is_alive())
+        self.assertTrue(model.closed)
+        self.assertEqual(model.warmed_up, [])
+        self.assertIs(main.app.state.enricher, heuristic)
+        self.assertEqual(main.app.state.readiness.status, "loading")
+
+
+if __name__ == "__main__":
+    unittest.main()
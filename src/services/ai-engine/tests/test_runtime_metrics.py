@@ -0,0 +1,98 @@
+import asyncio
+import gc
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from runtime_metrics import GcPauseMonitor, RuntimeMonitor, process_rss_bytes  # noqa: E402
+
+try:
+    from fastapi.testclient import TestClient
+
+    import main
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+class GcPauseMonitorTests(unittest.TestCase):
+    def test_records_pause_per_generation(self) -> None:
+        monitor = GcPauseMonitor()
+        monitor.install()
+        try:
+            gc.collect(0)
+            gc.collect(2)
+        finally:
+            monitor.uninstall()
+
+        pauses = monitor.drain()
+        self.assertEqual([generation for generation, _ in pauses][-2:], [0, 2])
+        self.assertTrue(all(pause_ms >= 0 for _, pause_ms in pauses))
+        self.assertEqual(monitor.drain(), [])
+        generations = monitor.snapshot()["generations"]
+        self.assertGreaterEqual(generations["2"]["collections"], 1)
+        self.assertNotIn(monitor._callback, gc.callbacks)
+
+
+class RuntimeMonitorTests(unittest.TestCase):
+    def test_measures_event_loop_lag_and_flushes_gc_pauses(self) -> None:
+        lags: list[float] = []
+        pauses: list[tuple[int, float]] = []
+
+        async def scenario() -> dict:
+            monitor = RuntimeMonitor(0.01, on_gc_pause=lambda *pause: pauses.append(pause), on_loop_lag=lags.append)
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)  # Block the loop so the next wake-up is late.
+            gc.collect(1)
+            await asyncio.sleep(0.05)
+            snapshot = monitor.snapshot()
+            await monitor.stop()
+            return snapshot
+
+        snapshot = asyncio.run(scenario())
+
+        self.assertGreaterEqual(max(lags), 50)
+        self.assertGreaterEqual(snapshot["event_loop"]["max_lag_ms"], 50)
+        self.assertIn(1, [generation for generation, _ in pauses])
+        self.assertEqual(snapshot["threadpool"]["busy"], 0)
+        self.assertGreater(snapshot["threadpool"]["limit"], 0)
+        if process_rss_bytes() is not None:
+            self.assertGreater(snapshot["process"]["rss_bytes"], 0)
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class DebugRuntimeEndpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = main.ENRICHMENT_PROVIDER
+        self.token = main.DEBUG_TOKEN
+        main.ENRICHMENT_PROVIDER = "heuristic"
+        main.DEBUG_TOKEN = "secret"
+        self.client = TestClient(main.app)
+        self.client.__enter__()
+
+    def tearDown(self) -> None:
+        self.client.__exit__(None, None, None)
+        main.ENRICHMENT_PROVIDER = self.provider
+        main.DEBUG_TOKEN = self.token
+
+    def test_reports_runtime_state_to_authorized_callers(self) -> None:
+        unauthorized = self.client.get("/debug/runtime")
+        response = self.client.get("/debug/runtime", headers={"Authorization": "Bearer secret"})
+
+        self.assertEqual(unauthorized.status_code, 401)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(
+            set(body),
+            {"pid", "event_loop", "gc", "threadpool", "process", "torch", "inference_executor", "summary_executor"},
+        )
+        self.assertEqual(set(body["gc"]["generations"]), {"0", "1", "2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import struct
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import serialization  # noqa: E402
+from serialization import (  # noqa: E402
+    FLOAT32_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    negotiate_vector_format,
+    vector_batch_response,
+)
+
+VECTORS = [([0.2, 0.5, 0.3], 0.4, 0.05), ([0.15, 0.7, 0.15], 0.1, 0.0)]
+
+
+class NegotiationTests(unittest.TestCase):
+    def test_defaults_to_json(self) -> None:
+        self.assertEqual(negotiate_vector_format(None), JSON_MEDIA_TYPE)
+        self.assertEqual(negotiate_vector_format("*/*"), JSON_MEDIA_TYPE)
+        self.assertEqual(negotiate_vector_format("text/html"), JSON_MEDIA_TYPE)
+
+    def test_highest_quality_wins(self) -> None:
+        accept = f"application/json;q=0.5, {FLOAT32_MEDIA_TYPE}"
+        self.assertEqual(negotiate_vector_format(accept), FLOAT32_MEDIA_TYPE)
+        accept = f"{FLOAT32_MEDIA_TYPE};q=0, application/json"
+        self.assertEqual(negotiate_vector_format(accept), JSON_MEDIA_TYPE)
+
+    @unittest.skipUnless(serialization.msgpack is not None, "msgpack is not installed")
+    def test_msgpack_aliases(self) -> None:
+        self.assertEqual(negotiate_vector_format("application/x-msgpack"), MSGPACK_MEDIA_TYPE)
+
+
+class VectorResponseTests(unittest.TestCase):
+    def test_json_matches_batch_response_shape(self) -> None:
+        response = vector_batch_response("1.0", VECTORS, JSON_MEDIA_TYPE)
+        payload = json.loads(response.body)
+
+        self.assertEqual(payload["schemaVersion"], "1.0")
+        self.assertEqual(payload["vectors"][0], {"index": 0, "S_v": [0.2, 0.5, 0.3], "P_v": 0.4, "B_s": 0.05})
+        self.assertEqual(response.headers["x-schema-version"], "1.0")
+
+    def test_float32_is_row_major_little_endian(self) -> None:
+        response = vector_batch_response("1.0", VECTORS, FLOAT32_MEDIA_TYPE)
+        values = struct.unpack("<10f", response.body)
+
+        self.assertEqual(response.headers["x-vector-count"], "2")
+        self.assertEqual(response.media_type, FLOAT32_MEDIA_TYPE)
+        for actual, expected in zip(values, [0.2, 0.5, 0.3, 0.4, 0.05, 0.15, 0.7, 0.15, 0.1, 0.0]):
+            self.assertAlmostEqual(actual, expected, places=6)
+
+    @unittest.skipUnless(serialization.msgpack is not None, "msgpack is not installed")
+    def test_msgpack_round_trips_json_payload(self) -> None:
+        packed = vector_batch_response("1.0", VECTORS, MSGPACK_MEDIA_TYPE)
+        plain = vector_batch_response("1.0", VECTORS, JSON_MEDIA_TYPE)
+
+        self.assertEqual(serialization.msgpack.unpackb(packed.body), json.loads(plain.body))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import serve  # noqa: E402
+
+try:
+    from fastapi.testclient import TestClient
+
+    import main
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+def parse(*argv: str, cpu_count: int = 8, **env: str):
+    environment = {key: value for key, value in os.environ.items() if not key.startswith(("AI_SERVE_", "AI_INFERENCE"))}
+    with mock.patch.object(sys, "argv", ["serve.py", *argv]), mock.patch.dict(
+        os.environ, {**environment, **env}, clear=True
+    ), mock.patch.object(os, "cpu_count", return_value=cpu_count):
+        return serve.parse_args()
+
+
+class ParseArgsTests(unittest.TestCase):
+    def test_splits_each_workers_cpu_share_between_its_inference_calls(self) -> None:
+        args = parse("--workers", "2", cpu_count=16)
+
+        self.assertEqual(args.threads_per_worker, 8)
+        self.assertEqual(args.inference_workers, 4)
+        self.assertEqual(args.intra_op_threads, 2)
+        self.assertLessEqual(args.workers * args.inference_workers * args.intra_op_threads, 16)
+
+    def test_explicit_inference_workers_shrink_intra_op_threads(self) -> None:
+        args = parse("--workers", "2", "--threads-per-worker", "6", AI_INFERENCE_WORKERS="3")
+
+        self.assertEqual(args.inference_workers, 3)
+        self.assertEqual(args.intra_op_threads, 2)
+
+    def test_small_nodes_keep_at_least_one_thread(self) -> None:
+        args = parse("--workers", "4", cpu_count=1)
+
+        self.assertEqual((args.threads_per_worker, args.inference_workers, args.intra_op_threads), (1, 1, 1))
+
+
+class StubComponent:
+    provider_name = "finbert"
+
+    def close(self) -> None:
+        return None
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class PreloadedStateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = main.ENRICHMENT_PROVIDER
+        self.background = main.ENRICHMENT_BACKGROUND_LOAD
+        self.preloaded = main.preloaded_state
+        main.ENRICHMENT_PROVIDER = "finbert"
+        main.ENRICHMENT_BACKGROUND_LOAD = True
+        main.preloaded_state = None
+
+    def tearDown(self) -> None:
+        main.ENRICHMENT_PROVIDER = self.provider
+        main.ENRICHMENT_BACKGROUND_LOAD = self.background
+        main.preloaded_state = self.preloaded
+
+    def test_every_worker_lifespan_reuses_the_preloaded_state(self) -> None:
+        enricher, summarizer = StubComponent(), StubComponent()
+        with mock.patch.object(main, "build_enricher", return_value=enricher) as build_enricher, mock.patch.object(
+            main, "build_summarizer", return_value=summarizer
+        ) as build_summarizer:
+            main.preload_state()
+            # Each forked worker runs the lifespan against the parent's preloaded objects.
+            for _ in range(2):
+                with TestClient(main.app) as client:
+                    self.assertIs(main.app.state.enricher, enricher)
+                    self.assertIs(main.app.state.summarizer, summarizer)
+                    self.assertEqual(client.get("/readyz").status_code, 200)
+
+        self.assertEqual(build_enricher.call_count, 1)
+        self.assertEqual(build_summarizer.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
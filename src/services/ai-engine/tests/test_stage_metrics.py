@@ -0,0 +1,101 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    import main
+    from main import FinbertEnricher, HeuristicSummarizer, SignalDocument
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+class RecordingHistogram:
+    def __init__(self) -> None:
+        self.samples: list[tuple[float, dict[str, str]]] = []
+
+    def record(self, value: float, attributes: dict[str, str]) -> None:
+        self.samples.append((value, attributes))
+
+
+class WordTokenizer:
+    def __call__(self, texts: list[str], truncation: bool = True) -> dict[str, list[list[int]]]:
+        return {"input_ids": [[1] * len(text.split()) for text in texts]}
+
+    def pad(self, features: dict[str, list[list[int]]], return_tensors: str) -> dict[str, list[list[int]]]:
+        width = max(len(ids) for ids in features["input_ids"])
+        return {"input_ids": [ids + [0] * (width - len(ids)) for ids in features["input_ids"]]}
+
+
+if HAS_SERVICE_DEPENDENCIES:
+
+    class FakeFinbertEnricher(FinbertEnricher):
+        def _load_model(self, model_id: str) -> None:
+            self._tokenizer = WordTokenizer()
+
+        def _forward(self, features) -> list[list[float]]:
+            return [[0.2, 0.5, 0.3] for _ in features["input_ids"]]
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class PipelineStageMetricsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.histogram = RecordingHistogram()
+        self.previous = main.signals_stage_histogram
+        main.signals_stage_histogram = self.histogram
+
+    def tearDown(self) -> None:
+        main.signals_stage_histogram = self.previous
+
+    def stages(self, component: str) -> list[dict[str, str]]:
+        return [labels for _, labels in self.histogram.samples if labels["component"] == component]
+
+    def test_enricher_records_each_stage_and_cache_result(self) -> None:
+        enricher = FakeFinbertEnricher(model_id="test", max_chars=2000, cache_size=16)
+        documents = [SignalDocument(source="status", title="EC2 capacity shortage in us-east-1")]
+
+        enricher.enrich_batch(documents)
+        enricher.enrich_batch(documents)
+
+        stages = [labels["stage"] for labels in self.stages("enricher")]
+        self.assertEqual(
+            stages,
+            ["cache_lookup", "tokenize", "forward", "normalize", "postprocess", "cache_lookup", "postprocess"],
+        )
+        cache_results = [labels["cache.result"] for labels in self.stages("enricher") if "cache.result" in labels]
+        self.assertEqual(cache_results, ["miss", "hit"])
+        self.assertTrue(all(value >= 0 for value, _ in self.histogram.samples))
+
+    def test_each_stage_is_recorded_once_per_batch_request(self) -> None:
+        enricher = FakeFinbertEnricher(model_id="test", max_chars=2000, cache_size=16)
+        documents = [SignalDocument(source="status", title=f"EC2 capacity shortage {index}") for index in range(3)]
+
+        main.start_enrich_batch_vectors(enricher, documents).result()
+
+        stages = [labels["stage"] for labels in self.stages("enricher")]
+        self.assertEqual(stages, ["cache_lookup", "tokenize", "forward", "normalize", "postprocess", "sanitize"])
+
+    def test_warmup_is_not_recorded(self) -> None:
+        enricher = FakeFinbertEnricher(model_id="test", max_chars=2000, cache_size=16)
+
+        enricher.warmup([4, 16])
+
+        self.assertEqual(self.histogram.samples, [])
+        self.assertFalse(main.stage_recording_suppressed.get())
+
+    def test_summarizer_segments_only_uncached_texts(self) -> None:
+        summarizer = HeuristicSummarizer(max_chars=40, cache_size=16)
+        text = "Engineers are investigating elevated error rates. Another update will follow soon."
+
+        summarizer.summarize_many([text])
+        summarizer.summarize_many([text])
+
+        stages = [(labels["stage"], labels.get("cache.result")) for labels in self.stages("summarizer")]
+        self.assertEqual(stages, [("cache_lookup", "miss"), ("segment", None), ("cache_lookup", "hit")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from main import HeuristicSummarizer, HttpSummarizer
+
+    HAS_SERVICE_DEPENDENCIES = True
+except ImportError:
+    HAS_SERVICE_DEPENDENCIES = False
+
+
+def start_summarizer_server(
+    supports_batch: bool, capabilities_delay: float = 0.0
+) -> tuple[ThreadingHTTPServer, list[str]]:
+    requests_seen: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def reply(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            requests_seen.append(f"GET {self.path}")
+            time.sleep(capabilities_delay)
+            self.reply(200, {"batch": supports_batch})
+
+        def do_POST(self) -> None:
+            requests_seen.append(f"POST {self.path}")
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if self.path.endswith("/batch"):
+                if not supports_batch:
+                    self.reply(404, {})
+                    return
+                self.reply(200, {"summaries": [{"summary": item["text"][:5]} for item in payload["items"]]})
+                return
+            self.reply(200, {"summary": payload["text"][:5]})
+
+        def log_message(self, *args) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests_seen
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class HeuristicSummarizerTests(unittest.TestCase):
+    def test_one_segmentation_serves_every_limit(self) -> None:
+        summarizer = HeuristicSummarizer(max_chars=600, cache_size=16)
+        text = "Capacity incident in us-east-1.  Engineers are investigating!\nMitigation is in progress? Next update soon."
+
+        self.assertEqual(summarizer.summarize(text, 10).summary, "Capacity i")
+        self.assertEqual(summarizer.summarize(text, 31).summary, "Capacity incident in us-east-1.")
+        self.assertEqual(
+            summarizer.summarize(text, 90).summary,
+            "Capacity incident in us-east-1. Engineers are investigating! Mitigation is in progress?",
+        )
+        self.assertFalse(summarizer.summarize(text, 2000).truncated)
+        self.assertEqual(len(summarizer._segments.memory), 1)
+
+
+@unittest.skipUnless(HAS_SERVICE_DEPENDENCIES, "ai-engine service dependencies are not installed")
+class HttpSummarizerTests(unittest.TestCase):
+    def build(self, server: ThreadingHTTPServer, batch_mode: str = "auto") -> "HttpSummarizer":
+        summarizer = HttpSummarizer(
+            endpoint=f"http://127.0.0.1:{server.server_address[1]}/summarize",
+            fallback=HeuristicSummarizer(max_chars=600, cache_size=16),
+            max_chars=600,
+            cache_size=64,
+            timeout=2.0,
+            concurrency=4,
+            batch_mode=batch_mode,
+        )
+        self.addCleanup(summarizer.close)
+        return summarizer
+
+    def test_batch_capable_endpoint_gets_one_request(self) -> None:
+        server, seen = start_summarizer_server(supports_batch=True)
+        self.addCleanup(server.shutdown)
+        summarizer = self.build(server)
+
+        results = summarizer.summarize_many([f"incident {index} in us-east-1" for index in range(6)], 600)
+
+        self.assertEqual([result.summary for result in results], ["incid"] * 6)
+        self.assertEqual(seen, ["GET /summarize/capabilities", "POST /summarize/batch"])
+
+    def test_slow_capability_probe_does_not_block_other_callers(self) -> None:
+        server, seen = start_summarizer_server(supports_batch=True, capabilities_delay=1.0)
+        self.addCleanup(server.shutdown)
+        summarizer = self.build(server)
+        prober = threading.Thread(target=summarizer.summarize_many, args=(["probe one", "probe two"], 600))
+        prober.start()
+        while not seen:
+            time.sleep(0.01)
+
+        started = time.monotonic()
+        results = summarizer.summarize_many(["first incident", "second incident"], 600)
+        elapsed = time.monotonic() - started
+        prober.join()
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual([result.summary for result in results], ["first", "secon"])
+        self.assertEqual(seen.count("GET /summarize/capabilities"), 1)
+        self.assertEqual(seen.count("POST /summarize"), 2)
+        self.assertEqual(seen.count("POST /summarize/batch"), 1)
+
+    def test_endpoint_without_batching_gets_per_document_calls(self) -> None:
+        server, seen = start_summarizer_server(supports_batch=False)
+        self.addCleanup(server.shutdown)
+        summarizer = self.build(server, batch_mode="on")
+
+        results = summarizer.summarize_many(["first incident", "second incident", "first incident"], 600)
+
+        self.assertEqual([result.summary for result in results], ["first", "secon", "first"])
+        self.assertEqual(seen.count("POST /summarize"), 2)
+        self.assertEqual(seen.count("POST /summarize/batch"), 1)
+
+    def test_open_breaker_falls_back_without_calling_the_endpoint(self) -> None:
+        server, seen = start_summarizer_server(supports_batch=True)
+        self.addCleanup(server.shutdown)
+        summarizer = self.build(server)
+        for _ in range(10):
+            summarizer.breaker.record_failure()
+
+        result = summarizer.summarize("Capacity incident. Details follow.", 600)
+
+        self.assertEqual(result.summary, "Capacity incident. Details follow.")
+        self.assertEqual(seen, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
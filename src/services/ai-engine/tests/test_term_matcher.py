@@ -0,0 +1,70 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from term_matcher import DEFAULT_TERMS, TermMatcher, load_term_matcher  # noqa: E402
+
+try:
+    import numpy  # noqa: F401
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def reference_counts(text: str) -> list[int]:
+    lowered = text.lower()
+    return [sum(term in lowered for term in terms) for terms in DEFAULT_TERMS.values()]
+
+
+class TermMatcherTests(unittest.TestCase):
+    def test_count_matches_substring_semantics(self) -> None:
+        matcher = TermMatcher(DEFAULT_TERMS)
+        text = "Major OUTAGE and outage again; supply-chain shortage, Inventory low"
+
+        self.assertEqual(matcher.count(text), reference_counts(text))
+        self.assertEqual(matcher.count(text), [1, 3])
+
+    def test_terms_file_overrides_listed_categories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "terms.json"
+            path.write_text(json.dumps({"negative": ["Brownout"]}), encoding="utf-8")
+            matcher = load_term_matcher(str(path))
+
+        self.assertEqual(matcher.count("brownout with capacity limits"), [1, 1])
+        self.assertEqual(matcher.count("outage"), [0, 0])
+
+    def test_invalid_terms_file_falls_back_to_defaults(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "terms.json"
+            path.write_text("[]", encoding="utf-8")
+            matcher = load_term_matcher(str(path))
+
+        self.assertEqual(matcher.count("outage"), [1, 0])
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_count_many_matches_count_per_document(self) -> None:
+        matcher = TermMatcher(DEFAULT_TERMS)
+        texts = [
+            "",
+            "outage",
+            "outage outage latency",
+            "sup",
+            "ply quota",
+            "Capacity incident in us-east-1",
+            "nothing relevant",
+        ]
+
+        counts = matcher.count_many(texts)
+
+        self.assertEqual(counts.shape, (len(texts), len(matcher.categories)))
+        self.assertEqual(counts.tolist(), [matcher.count(text) for text in texts])
+        self.assertEqual(matcher.count_many([]).shape, (0, len(matcher.categories)))
+
+
+if __name__ == "__main__":
+    unittest.main()
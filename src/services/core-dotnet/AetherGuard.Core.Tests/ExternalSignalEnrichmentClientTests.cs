@@ -119,6 +119,23 @@ public class ExternalSignalEnrichmentClientTests
         Assert.Equal(0.0, result.SupplyBias, 3);
     }
 
+    [Fact]
+    public async Task Requests_CarryTimeoutBudgetHeader()
+    {
+        string? budget = null;
+        var client = CreateClient((request, _) =>
+        {
+            budget = request.Headers.TryGetValues(ExternalSignalEnrichmentClient.RequestTimeoutHeader, out var values)
+                ? string.Join(",", values)
+                : null;
+            return new HttpResponseMessage(HttpStatusCode.ServiceUnavailable);
+        });
+
+        await client.EnrichAsync(CreateSignal("signal-1"), CancellationToken.None);
+
+        Assert.Equal("5000", budget);
+    }
+
     private static ExternalSignalEnrichmentClient CreateClient(
         Func<HttpRequestMessage, CancellationToken, HttpResponseMessage> responder)
     {
@@ -1,4 +1,5 @@
 using System.Diagnostics;
+using System.Globalization;
 using System.Net.Http.Json;
 using System.Text.Json;
 using System.Text.Json.Serialization;
@@ -9,6 +10,8 @@ namespace AetherGuard.Core.Services.ExternalSignals;
 
 public sealed class ExternalSignalEnrichmentClient
 {
+    public const string RequestTimeoutHeader = "X-Request-Timeout-Ms";
+
     private static readonly JsonSerializerOptions RequestJsonOptions = new()
     {
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
@@ -338,6 +341,12 @@ public sealed class ExternalSignalEnrichmentClient
 
         var timeoutSeconds = Math.Clamp(options.TimeoutSeconds, 2, 60);
         _httpClient.Timeout = TimeSpan.FromSeconds(timeoutSeconds);
+
+        // Tell the AI engine how long we will wait so it can skip or degrade work we would discard.
+        _httpClient.DefaultRequestHeaders.Remove(RequestTimeoutHeader);
+        _httpClient.DefaultRequestHeaders.TryAddWithoutValidation(
+            RequestTimeoutHeader,
+            (timeoutSeconds * 1000).ToString(CultureInfo.InvariantCulture));
         return true;
     }
 